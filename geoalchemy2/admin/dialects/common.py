@@ -86,6 +86,43 @@ def setup_create_drop(table, bind, check_col_management=None):
     return dialect, gis_cols, regular_cols
 
 
+def _get_cached_spatial_column(inspector, key, table_name, column_name, fetch):
+    """Get the attributes of a spatial column cached on the inspector.
+
+    When the first table of a schema is reflected, only the spatial columns of this table are
+    fetched. When another table of the same schema is then reflected with the same inspector (e.g.
+    with ``MetaData.reflect``), the attributes of all the spatial columns of the schema are
+    fetched in one query instead of one or more queries per table. The results are cached on
+    the inspector, like the other reflection results of SQLAlchemy, and are cleared by
+    ``Inspector.clear_cache()``.
+
+    The cached values are keyed by the exact table and column names returned by the database.
+
+    Args:
+        inspector: The inspector used for the reflection.
+        key: The cache key (usually the schema name).
+        table_name: The name of the reflected table.
+        column_name: The name of the reflected column.
+        fetch: A function taking a table name, or ``None`` for all the tables of the schema, and
+            returning a dictionary whose keys are the ``(table name, column name)`` tuples and
+            whose values are the attributes of the spatial columns.
+
+    Returns:
+        The attributes of the column or ``None`` if it is not a spatial column.
+    """
+    cache = inspector.info_cache.setdefault("geoalchemy2_spatial_columns", {})
+    schema_cache = cache.setdefault(key, {"tables": {}, "schema": None})
+    tables = schema_cache["tables"]
+    if table_name not in tables:
+        if schema_cache["schema"] is None and tables:
+            # Several tables are reflected so all the spatial columns of the schema are fetched
+            schema_cache["schema"] = fetch(None)
+        if schema_cache["schema"] is not None:
+            return schema_cache["schema"].get((table_name, column_name))
+        tables[table_name] = {col_name: attrs for (_, col_name), attrs in fetch(table_name).items()}
+    return tables[table_name].get(column_name)
+
+
 def reflect_geometry_column(inspector, table, column_info):
     return  # pragma: no cover
 
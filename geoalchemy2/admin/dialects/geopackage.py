@@ -4,6 +4,8 @@ See GeoPackage specifications here: http://www.geopackage.org/spec/
 """
 
 import re
+from contextlib import contextmanager
+from functools import partial
 
 from sqlalchemy import text
 from sqlalchemy.dialects import registry
@@ -15,10 +17,12 @@ from sqlalchemy.sql import select
 from geoalchemy2 import functions
 from geoalchemy2.admin.dialects.common import _check_spatial_type
 from geoalchemy2.admin.dialects.common import _format_select_args
+from geoalchemy2.admin.dialects.common import _get_cached_spatial_column
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
 from geoalchemy2.admin.dialects.common import compile_bin_literal
 from geoalchemy2.admin.dialects.common import setup_create_drop
 from geoalchemy2.admin.dialects.sqlite import _SQLITE_FUNCTIONS
+from geoalchemy2.admin.dialects.sqlite import _bulk_load_transaction
 from geoalchemy2.admin.dialects.sqlite import get_col_dim
 from geoalchemy2.admin.dialects.sqlite import load_spatialite_driver
 from geoalchemy2.types import Geography
@@ -121,6 +125,55 @@ def _get_spatialite_attrs(bind, table_name, col_name):
     return col_attributes
 
 
+# The table names are joined to the ones of the SQLite catalog to get the names returned by the
+# reflection
+_SPATIAL_COLUMNS_ATTRS_QUERY = text(
+    """SELECT
+        M.name,
+        A.column_name,
+        A.geometry_type_name,
+        A.srs_id,
+        A.z,
+        A.m,
+        IFNULL(B.has_index, 0) AS has_index
+    FROM gpkg_geometry_columns
+    AS A
+    JOIN sqlite_master AS M
+        ON M.type = 'table' AND LOWER(M.name) = LOWER(A.table_name)
+    LEFT JOIN (
+        SELECT LOWER(table_name) AS table_name, column_name, COUNT(*) AS has_index
+        FROM gpkg_extensions
+        WHERE extension_name = 'gpkg_rtree_index'
+        GROUP BY LOWER(table_name), column_name
+    ) AS B
+    ON LOWER(A.table_name) = B.table_name
+        AND A.column_name = B.column_name
+    WHERE :table_name IS NULL OR LOWER(A.table_name) = LOWER(:table_name)"""
+)
+
+
+def _get_all_spatialite_attrs(bind, table_name=None):
+    """Get the attributes of the spatial columns registered in the GeoPackage metadata.
+
+    If the table name is not ``None``, only the columns of this table are returned.
+
+    Returns:
+        A dictionary whose keys are the ``(table name, column name)`` tuples and whose values are
+        the attributes returned by
+        :func:`geoalchemy2.admin.dialects.geopackage._get_spatialite_attrs`.
+    """
+    attrs = bind.execute(_SPATIAL_COLUMNS_ATTRS_QUERY, {"table_name": table_name})
+    return {
+        (row_table_name, column_name): (
+            geometry_type,
+            "XY" + ("Z" if has_z else "") + ("M" if has_m else ""),
+            srid,
+            has_index,
+        )
+        for row_table_name, column_name, geometry_type, srid, has_z, has_m, has_index in attrs
+    }
+
+
 def _setup_dummy_type(table, gis_cols):
     """Setup dummy type for new Geometry columns so they can be updated later."""
     for col in gis_cols:
@@ -163,12 +216,113 @@ def disable_spatial_index(bind, table, col):
     )
 
 
+# The prefixes of the triggers created by gpkgAddGeometryTriggers() to check the geometry types
+# and the SRIDs of the inserted and updated geometries
+_GEOMETRY_TRIGGER_PREFIXES = ["fgti", "fgtu", "fgsi", "fgsu"]
+
+
+def _rebuild_rtree(bind, table, col):
+    """Fill the R*Tree of a spatial column from all the geometries of the table."""
+    quote = bind.dialect.identifier_preparer.quote
+    rtree_name = quote("rtree_{}_{}".format(table.name, col.name))
+    col_name = quote(col.name)
+    bind.exec_driver_sql("DELETE FROM {};".format(rtree_name))
+    bind.exec_driver_sql(
+        """INSERT INTO {rtree}
+        SELECT rowid, ST_MinX({col}), ST_MaxX({col}), ST_MinY({col}), ST_MaxY({col})
+        FROM {table}
+        WHERE {col} NOT NULL AND NOT ST_IsEmpty({col});""".format(
+            rtree=rtree_name, col=col_name, table=quote(table.name)
+        )
+    )
+
+
+@contextmanager
+def bulk_load(bind, table):
+    """Context manager to suspend the spatial triggers of a table during a bulk load.
+
+    The triggers that maintain the ``rtree_<table>_<column>`` spatial index (created by
+    ``gpkgAddSpatialIndex``) and the triggers that check the geometry types and SRIDs (created by
+    ``gpkgAddGeometryTriggers``) are dropped when entering the context. When leaving the context,
+    the spatial index is filled from all the rows of the table with a single
+    ``INSERT ... SELECT`` statement and the triggers are restored.
+
+    All these steps are executed in the transaction of the connection. If the load fails, the
+    spatial index is not filled and the changes are rolled back, so the triggers are left untouched.
+
+    .. Warning::
+
+        Since the geometry types and SRIDs are not checked during the load, the inserted
+        geometries must be valid for the column.
+
+    Args:
+        bind: The connection used to load the data.
+        table: The table in which the data are loaded.
+
+    Example::
+
+        with engine.begin() as conn:
+            with bulk_load(conn, Lake.__table__):
+                conn.execute(Lake.__table__.insert(), rows)
+    """
+    gis_cols = [col for col in table.columns if _check_spatial_type(col.type, Geometry)]
+    trigger_prefixes = []
+    for col in gis_cols:
+        trigger_prefixes.append("rtree_{}_{}_".format(table.name, col.name).lower())
+        trigger_prefixes.extend(
+            "{}_{}_{}".format(prefix, table.name, col.name).lower()
+            for prefix in _GEOMETRY_TRIGGER_PREFIXES
+        )
+
+    triggers = [
+        (name, sql)
+        for name, sql in bind.execute(
+            text(
+                """SELECT name, sql FROM sqlite_master
+                WHERE type = 'trigger' AND LOWER(tbl_name) = LOWER(:table_name);"""
+            ).bindparams(table_name=table.name)
+        )
+        # The identifiers are case-insensitive in SQLite
+        if name.lower().startswith(tuple(trigger_prefixes))
+    ]
+    rtree_cols = [
+        col
+        for col in gis_cols
+        if bind.execute(
+            text(
+                """SELECT COUNT(*) FROM gpkg_extensions
+                WHERE LOWER(table_name) = LOWER(:table_name)
+                    AND LOWER(column_name) = LOWER(:column_name)
+                    AND extension_name = 'gpkg_rtree_index';"""
+            ).bindparams(table_name=table.name, column_name=col.name)
+        ).scalar()
+    ]
+
+    quote = bind.dialect.identifier_preparer.quote
+    with _bulk_load_transaction(bind):
+        for name, _ in triggers:
+            bind.exec_driver_sql("DROP TRIGGER {};".format(quote(name)))
+        yield
+        for col in rtree_cols:
+            _rebuild_rtree(bind, table, col)
+        for _, sql in triggers:
+            # The statements are executed without parsing the bind parameters since they are
+            # copied from the database
+            bind.exec_driver_sql(sql)
+
+
 def reflect_geometry_column(inspector, table, column_info):
     """Reflect a column of type Geometry with GeoPackage dialect."""
     # Get geometry type, SRID and spatial index from the SpatiaLite metadata
     if not isinstance(column_info.get("type"), Geometry):
         return
-    col_attributes = _get_spatialite_attrs(inspector.bind, table.name, column_info["name"])
+    col_attributes = _get_cached_spatial_column(
+        inspector,
+        None,
+        table.name,
+        column_info["name"],
+        partial(_get_all_spatialite_attrs, inspector.bind),
+    )
     if col_attributes is not None:
         geometry_type, coord_dimension, srid, spatial_index = col_attributes
 
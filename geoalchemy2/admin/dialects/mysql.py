@@ -1,11 +1,16 @@
 """This module defines specific functions for MySQL dialect."""
 
+from functools import partial
+
+from sqlalchemy import String
+from sqlalchemy import bindparam
 from sqlalchemy import text
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql.sqltypes import NullType
 
 from geoalchemy2 import functions
 from geoalchemy2.admin.dialects.common import _check_spatial_type
+from geoalchemy2.admin.dialects.common import _get_cached_spatial_column
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
 from geoalchemy2.admin.dialects.common import compile_bin_literal
 from geoalchemy2.admin.dialects.common import setup_create_drop
@@ -23,45 +28,88 @@ _POSSIBLE_TYPES = [
     "geometrycollection",
 ]
 
+# The spatial columns of a schema (or of one table) with their SRID and spatial index type
+_SPATIAL_COLUMNS_ATTRS_QUERY = """SELECT
+        C.TABLE_NAME, C.COLUMN_NAME, C.DATA_TYPE, {select_srid}, C.IS_NULLABLE, S.INDEX_TYPE
+    FROM INFORMATION_SCHEMA.COLUMNS AS C
+    LEFT JOIN (
+        SELECT DISTINCT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, INDEX_TYPE
+        FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE INDEX_TYPE = 'SPATIAL'
+    ) AS S
+    ON C.TABLE_SCHEMA = S.TABLE_SCHEMA
+        AND C.TABLE_NAME = S.TABLE_NAME
+        AND C.COLUMN_NAME = S.COLUMN_NAME
+    WHERE C.DATA_TYPE IN :possible_types
+        AND (:schema IS NULL OR C.TABLE_SCHEMA = :schema)
+        AND (:table_name IS NULL OR C.TABLE_NAME = :table_name)"""
+
+_MYSQL_SPATIAL_COLUMNS_ATTRS_QUERY = text(
+    _SPATIAL_COLUMNS_ATTRS_QUERY.format(select_srid="C.SRS_ID")
+).bindparams(
+    bindparam("possible_types", _POSSIBLE_TYPES, expanding=True),
+    bindparam("schema", type_=String),
+    bindparam("table_name", type_=String),
+)
+
+# MariaDB does not store the SRID of the columns
+_MARIADB_SPATIAL_COLUMNS_ATTRS_QUERY = text(
+    _SPATIAL_COLUMNS_ATTRS_QUERY.format(select_srid="-1")
+).bindparams(
+    bindparam("possible_types", _POSSIBLE_TYPES, expanding=True),
+    bindparam("schema", type_=String),
+    bindparam("table_name", type_=String),
+)
+
+
+def _get_spatial_columns_attrs(bind, schema, dialect_name, table_name=None):
+    """Get the attributes of the spatial columns of a schema.
+
+    If the table name is not ``None``, only the columns of this table are returned.
+
+    Returns:
+        A dictionary whose keys are the ``(table name, column name)`` tuples and whose values are
+        the geometry type, the SRID, the nullable flag and the spatial index flag of the columns.
+    """
+    if dialect_name == "mariadb":
+        query = _MARIADB_SPATIAL_COLUMNS_ATTRS_QUERY
+    else:
+        query = _MYSQL_SPATIAL_COLUMNS_ATTRS_QUERY
+
+    rows = bind.execute(query, {"schema": schema, "table_name": table_name})
+    return {
+        (row_table_name, column_name): (
+            geometry_type,
+            srid,
+            str(nullable_str).lower() == "yes",
+            str(index_type).lower() == "spatial",
+        )
+        for row_table_name, column_name, geometry_type, srid, nullable_str, index_type in rows
+    }
+
 
 def reflect_geometry_column(inspector, table, column_info):
-    """Reflect a column of type Geometry with Postgresql dialect."""
+    """Reflect a column of type Geometry with MySQL dialect.
+
+    The attributes of the spatial columns are fetched by table, or at once for all the tables of
+    the schema when several tables are reflected, and are cached on the inspector.
+    """
     if not isinstance(column_info.get("type"), (Geometry, NullType)):
         return
 
     column_name = column_info.get("name")
     schema = table.schema or inspector.default_schema_name
 
-    if inspector.dialect.name == "mariadb":
-        select_srid = "-1, "
-    else:
-        select_srid = "SRS_ID, "
-
-    # Check geometry type, SRID and if the column is nullable
-    geometry_type_query = """SELECT DATA_TYPE, {}IS_NULLABLE
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_NAME = '{}' and COLUMN_NAME = '{}'""".format(
-        select_srid, table.name, column_name
+    col_attributes = _get_cached_spatial_column(
+        inspector,
+        schema,
+        table.name,
+        column_name,
+        partial(_get_spatial_columns_attrs, inspector.bind, schema, inspector.dialect.name),
     )
-    if schema is not None:
-        geometry_type_query += """ and table_schema = '{}'""".format(schema)
-    geometry_type, srid, nullable_str = inspector.bind.execute(text(geometry_type_query)).one()
-    is_nullable = str(nullable_str).lower() == "yes"
-
-    if geometry_type not in _POSSIBLE_TYPES:
+    if col_attributes is None:
         return  # pragma: no cover
-
-    # Check if the column has spatial index
-    has_index_query = """SELECT DISTINCT
-            INDEX_TYPE
-        FROM INFORMATION_SCHEMA.STATISTICS
-        WHERE TABLE_NAME = '{}' and COLUMN_NAME = '{}'""".format(
-        table.name, column_name
-    )
-    if schema is not None:
-        has_index_query += """ and TABLE_SCHEMA = '{}'""".format(schema)
-    spatial_index_res = inspector.bind.execute(text(has_index_query)).scalar()
-    spatial_index = str(spatial_index_res).lower() == "spatial"
+    geometry_type, srid, is_nullable, spatial_index = col_attributes
 
     # Set attributes
     column_info["type"] = Geometry(
@@ -1,7 +1,13 @@
 """This module defines specific functions for SQLite dialect."""
 
 import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict
 from typing import Optional
+from typing import Tuple
 
 from sqlalchemy import text
 from sqlalchemy.ext.compiler import compiles
@@ -11,6 +17,7 @@ from sqlalchemy.sql import select
 from geoalchemy2 import functions
 from geoalchemy2.admin.dialects.common import _check_spatial_type
 from geoalchemy2.admin.dialects.common import _format_select_args
+from geoalchemy2.admin.dialects.common import _get_cached_spatial_column
 from geoalchemy2.admin.dialects.common import _spatial_idx_name
 from geoalchemy2.admin.dialects.common import compile_bin_literal
 from geoalchemy2.admin.dialects.common import setup_create_drop
@@ -19,6 +26,10 @@ from geoalchemy2.types import Geometry
 from geoalchemy2.types import _DummyGeometry
 from geoalchemy2.utils import authorized_values_in_docstring
 
+# The key set in the info dictionary of the connection records whose DBAPI connection already has
+# the SpatiaLite extension loaded (this dictionary is cleared when the DBAPI connection is closed)
+_SPATIALITE_LOADED_KEY = "geoalchemy2_spatialite_loaded"
+
 
 def load_spatialite_driver(dbapi_conn, *args):
     """Load SpatiaLite extension in SQLite connection.
@@ -27,18 +38,58 @@ def load_spatialite_driver(dbapi_conn, *args):
         The path to the SpatiaLite module should be set in the `SPATIALITE_LIBRARY_PATH`
         environment variable.
 
+    .. Note::
+        The DBAPI connections of the `aiosqlite` driver (used with
+        :func:`sqlalchemy.ext.asyncio.create_async_engine`) are also supported.
+
+    .. Note::
+        When this function is used as a ``connect`` listener, the extension is not loaded again
+        if it was already loaded in the same connection by this function (e.g. when several
+        listeners are attached to the same engine). This is tracked in the ``info`` dictionary
+        of the connection record.
+
     Args:
         dbapi_conn: The DBAPI connection.
+        *args: The connection record given to the ``connect`` listeners can be passed as the
+            first extra argument.
     """
     if "SPATIALITE_LIBRARY_PATH" not in os.environ:
         raise RuntimeError("The SPATIALITE_LIBRARY_PATH environment variable is not set.")
+    if hasattr(dbapi_conn, "run_async"):
+        # The connection is an adapter of an asyncio driver whose methods must be awaited
+        dbapi_conn.run_async(
+            partial(_load_extension_async, path=os.environ["SPATIALITE_LIBRARY_PATH"])
+        )
+        return
+    info = getattr(args[0], "info", None) if args else None
+    if info is not None and info.get(_SPATIALITE_LOADED_KEY):
+        return
     dbapi_conn.enable_load_extension(True)
     dbapi_conn.load_extension(os.environ["SPATIALITE_LIBRARY_PATH"])
     dbapi_conn.enable_load_extension(False)
+    if info is not None:
+        info[_SPATIALITE_LOADED_KEY] = True
+
+
+async def _load_extension_async(driver_conn, path):
+    """Load an extension with the connection of an asyncio driver (e.g. `aiosqlite`)."""
+    await driver_conn.enable_load_extension(True)
+    await driver_conn.load_extension(path)
+    await driver_conn.enable_load_extension(False)
 
 
 _JOURNAL_MODE_VALUES = ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
 
+# The database files already initialized in the current process: the (device, inode) of each file
+# is associated with its (ctime, mtime, size) when it was initialized, because the inode of a
+# deleted file can be reused by a new file
+_INITIALIZED_DATABASES: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+
+# The pre-initialized in-memory databases used as templates, keyed by process ID and init mode
+_MEMORY_TEMPLATES: Dict[Tuple[int, Optional[str]], sqlite3.Connection] = {}
+
+_INIT_CACHE_LOCK = threading.Lock()
+
 
 @authorized_values_in_docstring(JOURNAL_MODE_VALUES=_JOURNAL_MODE_VALUES)
 def init_spatialite(
@@ -47,6 +98,7 @@ def init_spatialite(
     transaction: bool = False,
     init_mode: Optional[str] = None,
     journal_mode: Optional[str] = None,
+    cache: bool = False,
 ):
     """Initialize internal SpatiaLite tables.
 
@@ -72,6 +124,21 @@ def init_spatialite(
             .. Note::
                 The original value is restored after the initialization.
 
+        cache: If set to `True`, the initialization is cached in the current process:
+
+            * the database files that were already initialized are not checked again, unless
+              they were modified or recreated since then.
+            * the in-memory databases are initialized by copying a template database, using the
+              backup API of SQLite. The template is initialized once per process and per
+              `init_mode` value, so loading the EPSG SRIDs only happens once.
+
+            See :func:`geoalchemy2.admin.dialects.sqlite.clear_spatialite_init_cache` to clear
+            this cache.
+
+            .. Note::
+                The cache is only used with the connections of the `sqlite3` module, it is
+                ignored for the connections of other drivers (e.g. `aiosqlite`).
+
     .. Note::
         When using this function as a listener it is not possible to pass the `transaction`,
         `init_mode` or `journal_mode` arguments directly. To do this you can either create another
@@ -117,15 +184,90 @@ def init_spatialite(
                 "The 'journal_mode' argument must be one of {}.".format(_JOURNAL_MODE_VALUES)
             )
 
-    if dbapi_conn.execute("SELECT CheckSpatialMetaData();").fetchone()[0] < 1:
-        if journal_mode is not None:
-            current_journal_mode = dbapi_conn.execute("PRAGMA journal_mode").fetchone()[0]
-            dbapi_conn.execute("PRAGMA journal_mode = {}".format(journal_mode))
+    if cache and isinstance(dbapi_conn, sqlite3.Connection):
+        _init_spatialite_with_cache(dbapi_conn, func_args, init_mode, journal_mode)
+    elif not _has_spatial_metadata(dbapi_conn):
+        _init_spatial_metadata(dbapi_conn, func_args, journal_mode)
+
+
+def _has_spatial_metadata(dbapi_conn):
+    """Check if the SpatiaLite internal tables exist."""
+    return dbapi_conn.execute("SELECT CheckSpatialMetaData();").fetchone()[0] >= 1
+
+
+def _init_spatial_metadata(dbapi_conn, func_args, journal_mode):
+    """Create the SpatiaLite internal tables."""
+    if journal_mode is not None:
+        current_journal_mode = dbapi_conn.execute("PRAGMA journal_mode").fetchone()[0]
+        dbapi_conn.execute("PRAGMA journal_mode = {}".format(journal_mode))
+
+    dbapi_conn.execute("SELECT InitSpatialMetaData({});".format(", ".join(func_args)))
+
+    if journal_mode is not None:
+        dbapi_conn.execute("PRAGMA journal_mode = {}".format(current_journal_mode))
+
+
+def _main_database_file(dbapi_conn):
+    """Get the path of the main database file (empty for in-memory and temporary databases)."""
+    for _, name, path in dbapi_conn.execute("PRAGMA database_list").fetchall():
+        if name == "main":
+            return path or ""
+    return ""  # pragma: no cover
+
+
+def _file_signature(stat):
+    """Get the values of a file status that change when the file is modified or recreated."""
+    return (stat.st_ctime_ns, stat.st_mtime_ns, stat.st_size)
+
+
+def _init_spatialite_with_cache(dbapi_conn, func_args, init_mode, journal_mode):
+    """Initialize the SpatiaLite internal tables using the cache of the current process."""
+    path = _main_database_file(dbapi_conn)
+
+    if path:
+        stat = os.stat(path)
+        file_id = (stat.st_dev, stat.st_ino)
+        if _INITIALIZED_DATABASES.get(file_id) == _file_signature(stat):
+            return
+        # The file is unknown or was modified or recreated since it was initialized, so it is
+        # checked again
+        if not _has_spatial_metadata(dbapi_conn):
+            _init_spatial_metadata(dbapi_conn, func_args, journal_mode)
+        with _INIT_CACHE_LOCK:
+            _INITIALIZED_DATABASES[file_id] = _file_signature(os.stat(path))
+        return
 
-        dbapi_conn.execute("SELECT InitSpatialMetaData({});".format(", ".join(func_args)))
+    if _has_spatial_metadata(dbapi_conn):
+        return
+    if dbapi_conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] > 0:
+        # The database is not empty (e.g. a shared-cache database) so it can not be overwritten
+        _init_spatial_metadata(dbapi_conn, func_args, journal_mode)
+        return
 
-        if journal_mode is not None:
-            dbapi_conn.execute("PRAGMA journal_mode = {}".format(current_journal_mode))
+    with _INIT_CACHE_LOCK:
+        key = (os.getpid(), init_mode)
+        template = _MEMORY_TEMPLATES.get(key)
+        if template is None:
+            # The autocommit mode ensures that no transaction is left open, otherwise the backup
+            # would wait for it forever
+            template = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            load_spatialite_driver(template)
+            _init_spatial_metadata(template, func_args, None)
+            _MEMORY_TEMPLATES[key] = template
+        template.backup(dbapi_conn)
+
+
+def clear_spatialite_init_cache():
+    """Clear the SpatiaLite initialization cache of the current process.
+
+    This closes the in-memory template databases and forgets the database files already
+    initialized by :func:`geoalchemy2.admin.dialects.sqlite.init_spatialite` with `cache=True`.
+    """
+    with _INIT_CACHE_LOCK:
+        _INITIALIZED_DATABASES.clear()
+        for template in _MEMORY_TEMPLATES.values():
+            template.close()
+        _MEMORY_TEMPLATES.clear()
 
 
 def load_spatialite(dbapi_conn, *args, **kwargs):
@@ -135,7 +277,7 @@ def load_spatialite(dbapi_conn, *args, **kwargs):
     :func:`geoalchemy2.admin.dialects.sqlite.init_spatialite` functions for details about
     arguments.
     """
-    load_spatialite_driver(dbapi_conn)
+    load_spatialite_driver(dbapi_conn, *args)
     init_spatialite(dbapi_conn, **kwargs)
 
 
@@ -154,6 +296,34 @@ def _get_spatialite_attrs(bind, table_name, col_name):
     return attrs[2:]
 
 
+# The names stored in the SpatiaLite metadata are lower-cased, so they are joined to the ones of
+# the SQLite catalog to get the names returned by the reflection
+_SPATIAL_COLUMNS_ATTRS_QUERY = text(
+    """SELECT m.name, p.name, g.*
+    FROM "geometry_columns" AS g
+    JOIN sqlite_master AS m
+        ON m.type = 'table' AND LOWER(m.name) = LOWER(g.f_table_name)
+    JOIN pragma_table_info(m.name) AS p
+        ON LOWER(p.name) = LOWER(g.f_geometry_column)
+    WHERE :table_name IS NULL OR LOWER(g.f_table_name) = LOWER(:table_name)"""
+)
+
+
+def _get_all_spatialite_attrs(bind, table_name=None):
+    """Get the attributes of the spatial columns registered in the SpatiaLite metadata.
+
+    If the table name is not ``None``, only the columns of this table are returned.
+
+    Returns:
+        A dictionary whose keys are the ``(table name, column name)`` tuples and whose values are
+        the attributes returned by :func:`geoalchemy2.admin.dialects.sqlite._get_spatialite_attrs`.
+    """
+    return {
+        (attrs[0], attrs[1]): tuple(attrs[4:])
+        for attrs in bind.execute(_SPATIAL_COLUMNS_ATTRS_QUERY, {"table_name": table_name})
+    }
+
+
 def get_spatialite_version(bind):
     """Get the version of the currently loaded Spatialite extension."""
     return bind.execute(text("SELECT spatialite_version();")).fetchone()[0]
@@ -215,12 +385,84 @@ def disable_spatial_index(bind, table, col):
         )
 
 
+@contextmanager
+def _bulk_load_transaction(bind):
+    """Run the statements of a bulk load in a savepoint of the transaction of the connection.
+
+    The pysqlite driver only starts its transaction before the DML statements, so the DDL
+    statements executed at the beginning of a bulk load would be committed on their own. The
+    transaction of the driver is thus started explicitly, so all the changes of a failed load are
+    rolled back and the original exception is propagated.
+    """
+    if not bind.in_transaction():
+        with bind.begin():
+            with _bulk_load_transaction(bind):
+                yield
+        return
+    if not getattr(bind.connection.dbapi_connection, "in_transaction", True):
+        bind.exec_driver_sql("BEGIN")
+    with bind.begin_nested():
+        yield
+
+
+@contextmanager
+def bulk_load(bind, table, columns=None):
+    """Context manager to defer the maintenance of the spatial indexes during a bulk load.
+
+    The R*Tree spatial indexes of the given columns are disabled when entering the context, so
+    the inserted rows are no longer added one by one to the index by the SpatiaLite triggers. When
+    leaving the context, the indexes are rebuilt in one pass with the ``CreateSpatialIndex``
+    function. The columns remain registered in the SpatiaLite metadata during the whole process.
+
+    All these steps are executed in the transaction of the connection. If the load fails, the
+    indexes are not rebuilt and the changes are rolled back, so the indexes are left untouched.
+
+    Args:
+        bind: The connection used to load the data.
+        table: The table in which the data are loaded.
+        columns: The names of the columns whose spatial index is deferred. By default, all the
+            spatial columns with an enabled spatial index are used.
+
+    Example::
+
+        with engine.begin() as conn:
+            with bulk_load(conn, Lake.__table__):
+                conn.execute(Lake.__table__.insert(), rows)
+    """
+    if columns is None:
+        cols = [col for col in table.columns if _check_spatial_type(col.type, Geometry)]
+    else:
+        cols = [table.columns[col_name] for col_name in columns]
+
+    indexed_cols = []
+    for col in cols:
+        if col.computed is not None:
+            continue
+        attrs = _get_spatialite_attrs(bind, table.name, col.name)
+        # The value 1 means that the column has an R*Tree index (2 is for the legacy MBR cache)
+        if attrs is not None and attrs[-1] == 1:
+            indexed_cols.append(col)
+
+    with _bulk_load_transaction(bind):
+        for col in indexed_cols:
+            disable_spatial_index(bind, table, col)
+        yield
+        for col in indexed_cols:
+            create_spatial_index(bind, table, col)
+
+
 def reflect_geometry_column(inspector, table, column_info):
     """Reflect a column of type Geometry with SQLite dialect."""
     # Get geometry type, SRID and spatial index from the SpatiaLite metadata
     if not isinstance(column_info.get("type"), Geometry):
         return
-    col_attributes = _get_spatialite_attrs(inspector.bind, table.name, column_info["name"])
+    col_attributes = _get_cached_spatial_column(
+        inspector,
+        None,
+        table.name,
+        column_info["name"],
+        partial(_get_all_spatialite_attrs, inspector.bind),
+    )
     if col_attributes is not None:
         geometry_type, coord_dimension, srid, spatial_index = col_attributes
 
@@ -1,10 +1,69 @@
+import time
 from collections import defaultdict
 from functools import partial
+from typing import List
+from typing import Optional
 
 from sqlalchemy import event
 from sqlalchemy.engine import CreateEnginePlugin
+from sqlalchemy.pool import SingletonThreadPool
+from sqlalchemy.pool import StaticPool
 
 from geoalchemy2.admin import select_dialect
+from geoalchemy2.exc import ArgumentError
+
+CONNECT_TIME_KEY = "geoalchemy2_connect_time"
+"""The key of the time spent in the ``connect`` listener in the ``info`` dictionary of the
+connections."""
+
+
+def _timed_connect(func, dbapi_conn, connection_record):
+    """Call a ``connect`` listener and store the time spent in the info of the connection."""
+    start = time.perf_counter()
+    func(dbapi_conn, connection_record)
+    if connection_record is not None:
+        connection_record.info[CONNECT_TIME_KEY] = time.perf_counter() - start
+
+
+def warm_up_pool(engine, size: int) -> List[Optional[float]]:
+    """Create the connections of the pool of an engine in advance.
+
+    The given number of connections are checked out at the same time and then returned to the
+    pool, so the ``connect`` listeners (e.g. the loading of the SpatiaLite extension) are not
+    called when the application needs a connection for the first time.
+
+    With :class:`sqlalchemy.pool.StaticPool` and :class:`sqlalchemy.pool.SingletonThreadPool`,
+    only one connection is created since these pools hold one connection (per thread for the
+    latter), so the ``connect`` listeners are only called once for each thread anyway.
+
+    .. Note::
+
+        The ``size`` should not exceed the ``pool_size`` (plus ``max_overflow``) of the pool,
+        otherwise the extra connections are discarded or the checkout waits for the pool timeout.
+
+    Args:
+        engine: The engine whose pool is warmed up. The engines using an asyncio driver are not
+            supported.
+        size: The number of connections to create.
+
+    Returns:
+        The time (in seconds) spent in the ``connect`` listener of the :class:`GeoEngine` plugin
+        when each connection was created, or ``None`` when the listener is not attached by the
+        plugin.
+    """
+    if engine.dialect.is_async:
+        raise ArgumentError("The pool warm-up is not supported with asyncio drivers")
+    if isinstance(engine.pool, (StaticPool, SingletonThreadPool)):
+        size = min(size, 1)
+
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.raw_connection())
+        return [conn.info.get(CONNECT_TIME_KEY) for conn in connections]
+    finally:
+        for conn in connections:
+            conn.close()
 
 
 class GeoEngine(CreateEnginePlugin):
@@ -25,6 +84,16 @@ class GeoEngine(CreateEnginePlugin):
 
     The names of the parameters can be found in the event listener of each dialect. Note that all
     dialects don't have listeners for all events.
+
+    The time spent in the ``connect`` listener is stored in the ``info`` dictionary of each
+    connection, under the :data:`CONNECT_TIME_KEY` key. The pool of the engine can also be warmed
+    up when the engine is created, using the `geoalchemy2_pool_warm_up` parameter to give the
+    number of connections to create (see :func:`warm_up_pool`):
+
+    .. code-block:: python
+
+        db_url = "sqlite:////tmp/test_db.sqlite?geoalchemy2_pool_warm_up=5"
+        engine = sqlalchemy.create_engine(db_url, plugins=["geoalchemy2"])
     """
 
     def __init__(self, url, kwargs):
@@ -45,6 +114,17 @@ class GeoEngine(CreateEnginePlugin):
         if journal_mode is not None:
             self.params["connect"]["sqlite"]["journal_mode"] = journal_mode
 
+        init_cache = url.query.get("geoalchemy2_connect_sqlite_init_cache", None)
+        if init_cache is not None:
+            self.params["connect"]["sqlite"]["cache"] = self.str_to_bool(init_cache)
+
+        binary_codecs = url.query.get("geoalchemy2_connect_postgresql_binary_codecs", None)
+        if binary_codecs is not None:
+            self.params["connect"]["postgresql"]["binary_codecs"] = self.str_to_bool(binary_codecs)
+
+        warm_up = url.query.get("geoalchemy2_pool_warm_up", None)
+        self.warm_up = int(warm_up) if warm_up is not None else None
+
         before_cursor_execute_convert_mysql = url.query.get(
             "geoalchemy2_before_cursor_execute_mysql_convert", None
         )
@@ -78,8 +158,11 @@ class GeoEngine(CreateEnginePlugin):
                 "geoalchemy2_connect_sqlite_transaction",
                 "geoalchemy2_connect_sqlite_init_mode",
                 "geoalchemy2_connect_sqlite_journal_mode",
+                "geoalchemy2_connect_sqlite_init_cache",
+                "geoalchemy2_connect_postgresql_binary_codecs",
                 "geoalchemy2_before_cursor_execute_mysql_convert",
                 "geoalchemy2_before_cursor_execute_mariadb_convert",
+                "geoalchemy2_pool_warm_up",
             ],
         )
 
@@ -90,9 +173,12 @@ class GeoEngine(CreateEnginePlugin):
         if hasattr(dialect_module, "connect"):
             params = dict(self.params["connect"].get(engine.dialect.name, {}))
             func = partial(dialect_module.connect, **params)
-            event.listen(engine, "connect", func)
+            event.listen(engine, "connect", partial(_timed_connect, func))
 
         if hasattr(dialect_module, "before_cursor_execute"):
             params = dict(self.params["before_cursor_execute"].get(engine.dialect.name, {}))
             func = partial(dialect_module.before_cursor_execute, **params)
             event.listen(engine, "before_cursor_execute", func, retval=True)
+
+        if self.warm_up:
+            warm_up_pool(engine, self.warm_up)
@@ -16,6 +16,8 @@ from alembic.operations import BatchOperations
 from alembic.operations import Operations
 from alembic.operations import ops
 from sqlalchemy import Column
+from sqlalchemy import String
+from sqlalchemy import bindparam
 from sqlalchemy import text
 from sqlalchemy.dialects.mysql.base import MySQLDialect
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
@@ -36,6 +38,37 @@ writer = rewriter.Rewriter()
 
 _SPATIAL_TABLES = set()
 
+# The spatial columns of a GeoPackage table and whether they have an R*Tree index or not
+_GPKG_SPATIAL_INDEX_QUERY = text(
+    """SELECT A.table_name, A.column_name, IFNULL(B.has_index, 0) AS has_index
+    FROM "gpkg_geometry_columns"
+    AS A
+    LEFT JOIN (
+        SELECT table_name, column_name, COUNT(*) AS has_index
+        FROM gpkg_extensions
+        WHERE LOWER(table_name) = LOWER(:table_name)
+            AND extension_name = 'gpkg_rtree_index'
+    ) AS B
+    ON LOWER(A.table_name) = LOWER(B.table_name)
+    WHERE LOWER(A.table_name) = LOWER(:table_name);"""
+)
+
+_SPATIALITE_SPATIAL_INDEX_QUERY = text(
+    """SELECT *
+    FROM geometry_columns
+    WHERE f_table_name = :table_name
+    ORDER BY f_table_name, f_geometry_column;"""
+)
+
+_MYSQL_SPATIAL_INDEX_QUERY = text(
+    """SELECT DISTINCT
+        COLUMN_NAME
+    FROM INFORMATION_SCHEMA.STATISTICS
+    WHERE TABLE_NAME = :table_name
+        AND INDEX_TYPE = 'SPATIAL'
+        AND (:schema IS NULL OR TABLE_SCHEMA = :schema)"""
+).bindparams(bindparam("schema", type_=String))
+
 
 class GeoPackageImpl(SQLiteImpl):
     """Class to copy the Alembic implementation from SQLite to GeoPackage."""
@@ -66,33 +99,13 @@ def _monkey_patch_get_indexes_for_sqlite():
 
         # Get spatial indexes
         if is_gpkg:
-            spatial_index_query = text(
-                """SELECT A.table_name, A.column_name, IFNULL(B.has_index, 0) AS has_index
-                FROM "gpkg_geometry_columns"
-                AS A
-                LEFT JOIN (
-                    SELECT table_name, column_name, COUNT(*) AS has_index
-                    FROM gpkg_extensions
-                    WHERE LOWER(table_name) = LOWER('{table_name}')
-                        AND extension_name = 'gpkg_rtree_index'
-                ) AS B
-                ON LOWER(A.table_name) = LOWER(B.table_name)
-                WHERE LOWER(A.table_name) = LOWER('{table_name}');
-            """.format(
-                    table_name=table_name
-                )
-            )
+            spatial_index_query = _GPKG_SPATIAL_INDEX_QUERY
         else:
-            spatial_index_query = text(
-                """SELECT *
-                FROM geometry_columns
-                WHERE f_table_name = '{}'
-                ORDER BY f_table_name, f_geometry_column;""".format(
-                    table_name
-                )
-            )
+            spatial_index_query = _SPATIALITE_SPATIAL_INDEX_QUERY
 
-        spatial_indexes = connection.execute(spatial_index_query).fetchall()
+        spatial_indexes = connection.execute(
+            spatial_index_query, {"table_name": table_name}
+        ).fetchall()
 
         if spatial_indexes:
             reflected_names = set([i["name"] for i in indexes])
@@ -129,15 +142,9 @@ def _monkey_patch_get_indexes_for_mysql():
         indexes = self._get_indexes_normal_behavior(connection, table_name, schema=None, **kw)
 
         # Get spatial indexes
-        has_index_query = """SELECT DISTINCT
-                COLUMN_NAME
-            FROM INFORMATION_SCHEMA.STATISTICS
-            WHERE TABLE_NAME = '{}' AND INDEX_TYPE = 'SPATIAL'""".format(
-            table_name
-        )
-        if schema is not None:
-            has_index_query += """ AND TABLE_SCHEMA = '{}'""".format(schema)
-        spatial_indexes = connection.execute(text(has_index_query)).fetchall()
+        spatial_indexes = connection.execute(
+            _MYSQL_SPATIAL_INDEX_QUERY, {"table_name": table_name, "schema": schema}
+        ).fetchall()
 
         if spatial_indexes:
             reflected_names = set([i["name"] for i in indexes])
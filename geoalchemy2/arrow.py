@@ -0,0 +1,194 @@
+"""This module provides utility functions to fetch query results as Arrow tables.
+
+The spatial columns are fetched as raw binary values and are directly stored in Arrow arrays
+using the `GeoArrow <https://geoarrow.org>`_ WKB extension type, so no
+:class:`geoalchemy2.elements.WKBElement` object is created for each row.
+
+.. note::
+
+    As GeoAlchemy 2 itself has no dependency on `PyArrow`, applications using
+    functions of this module have to ensure that `PyArrow` is available.
+"""
+
+import json
+from contextlib import contextmanager
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+try:
+    import pyarrow as pa
+
+    HAS_PYARROW = True
+    _pyarrow_exc = None
+except ImportError as exc:
+    HAS_PYARROW = False
+    _pyarrow_exc = exc
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.sql import func
+from sqlalchemy.sql.elements import ColumnClause
+from sqlalchemy.sql.elements import Label
+from sqlalchemy.sql.expression import type_coerce
+
+from geoalchemy2.types import Raster
+from geoalchemy2.types import _GISType
+
+GEOARROW_WKB_EXTENSION_NAME = "geoarrow.wkb"
+"""The name of the GeoArrow WKB extension type."""
+
+
+@contextmanager
+def check_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError(
+            "This feature needs the optional PyArrow dependency. "
+            "Please install it with 'pip install geoalchemy2[arrow]'."
+        ) from _pyarrow_exc
+    yield
+
+
+def _raw_binary_select(statement):
+    """Replace the spatial columns of a select statement by raw binary columns.
+
+    The spatial columns are wrapped in the "as binary" function of their type (which is
+    translated for each dialect, e.g. ``ST_AsEWKB`` for PostgreSQL, ``AsEWKB`` for SQLite and
+    ``ST_AsBinary`` for MySQL) and coerced to a binary type, so the result processor of the
+    spatial type is not called.
+
+    Returns:
+        The new statement and a list with the spatial type of each column (or ``None`` for the
+        non-spatial columns).
+    """
+    columns = []
+    spatial_types = []
+    for col in statement.selected_columns:
+        if isinstance(col.type, _GISType) and not isinstance(col.type, Raster):
+            raw_col = type_coerce(getattr(func, col.type.as_binary)(col), LargeBinary)
+            if isinstance(col, (ColumnClause, Label)):
+                raw_col = raw_col.label(col.name)
+            columns.append(raw_col)
+            spatial_types.append(col.type)
+        else:
+            columns.append(col)
+            spatial_types.append(None)
+    return statement.with_only_columns(*columns), spatial_types
+
+
+def _geoarrow_field(name: str, spatial_type) -> "pa.Field":
+    """Build the field of a spatial column with the GeoArrow WKB extension metadata."""
+    extension_metadata: Dict[str, Any] = {}
+    if spatial_type.srid > 0:
+        extension_metadata["crs"] = "EPSG:%d" % spatial_type.srid
+        extension_metadata["crs_type"] = "authority_code"
+    return pa.field(
+        name,
+        pa.binary(),
+        metadata={
+            "ARROW:extension:name": GEOARROW_WKB_EXTENSION_NAME,
+            "ARROW:extension:metadata": json.dumps(extension_metadata),
+        },
+    )
+
+
+def _binary_values(values: Sequence[Any]) -> List[Any]:
+    """Convert the hexadecimal strings to bytes.
+
+    The "as binary" functions of SpatiaLite return hexadecimal strings instead of binary values.
+    """
+    return [bytes.fromhex(value) if isinstance(value, str) else value for value in values]
+
+
+def _rows_to_record_batch(
+    keys: Sequence[str], rows: Sequence[Sequence[Any]], spatial_types: List[Optional[Any]]
+) -> "pa.RecordBatch":
+    """Build a record batch from the rows of a result with raw binary spatial columns."""
+    if rows:
+        values: Sequence[Sequence[Any]] = list(zip(*rows))
+    else:
+        values = [[] for _ in keys]
+
+    arrays = []
+    fields = []
+    for name, column_values, spatial_type in zip(keys, values, spatial_types):
+        if spatial_type is not None:
+            field = _geoarrow_field(name, spatial_type)
+            arrays.append(pa.array(_binary_values(column_values), type=field.type))
+        else:
+            arrays.append(pa.array(column_values))
+            field = pa.field(name, arrays[-1].type)
+        fields.append(field)
+    return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+
+@check_pyarrow()
+def iter_arrow_batches(
+    connection, statement, batch_size: int = 65536, execution_options: Optional[dict] = None
+) -> Iterator["pa.RecordBatch"]:
+    """Execute a select statement and yield the results as Arrow record batches.
+
+    The results are streamed from the database, so only ``batch_size`` rows are loaded in memory
+    at the same time.
+
+    Args:
+        connection: The connection used to execute the statement.
+        statement: The select statement to execute.
+        batch_size: The number of rows of each batch.
+        execution_options: Extra execution options passed to the statement execution.
+
+    Example::
+
+        with engine.connect() as conn:
+            for batch in iter_arrow_batches(conn, select(Lake.id, Lake.geom)):
+                process(batch)
+    """
+    raw_statement, spatial_types = _raw_binary_select(statement)
+    options = {"stream_results": True, "yield_per": batch_size}
+    options.update(execution_options or {})
+    result = connection.execute(raw_statement.execution_options(**options))
+    keys = list(result.keys())
+    for partition in result.partitions(batch_size):
+        yield _rows_to_record_batch(keys, partition, spatial_types)
+
+
+@check_pyarrow()
+def to_arrow_table(connection, statement, execution_options: Optional[dict] = None) -> "pa.Table":
+    """Execute a select statement and return the results as an Arrow table.
+
+    The spatial columns (except the raster columns) are returned as binary arrays using the
+    GeoArrow WKB extension type. If the column has a SRID, it is stored in the extension metadata.
+    Note that the binary values are the ones returned by the database, so they are EWKB values for
+    PostgreSQL and SQLite and WKB values for MySQL. The hexadecimal strings returned by SpatiaLite
+    are converted to bytes.
+
+    Args:
+        connection: The connection used to execute the statement.
+        statement: The select statement to execute.
+        execution_options: Extra execution options passed to the statement execution.
+
+    Example::
+
+        with engine.connect() as conn:
+            table = to_arrow_table(conn, select(Lake.id, Lake.geom))
+            df = geopandas.GeoDataFrame.from_arrow(table)
+    """
+    raw_statement, spatial_types = _raw_binary_select(statement)
+    result = connection.execute(raw_statement.execution_options(**(execution_options or {})))
+    keys = list(result.keys())
+    batch = _rows_to_record_batch(keys, result.fetchall(), spatial_types)
+    return pa.Table.from_batches([batch])
+
+
+__all__: List[str] = [
+    "GEOARROW_WKB_EXTENSION_NAME",
+    "check_pyarrow",
+    "iter_arrow_batches",
+    "to_arrow_table",
+]
+
+
+def __dir__():
+    return __all__
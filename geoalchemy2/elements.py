@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import binascii
+import pickle
 import re
 import struct
+from functools import lru_cache
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Set
 from typing import Union
@@ -13,6 +16,7 @@ from typing import Union
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import functions
 from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
 from sqlalchemy.types import to_instance
 
 from geoalchemy2.exc import ArgumentError
@@ -21,6 +25,26 @@ BinasciiError = binascii.Error
 
 function_registry: Set[str] = set()
 
+_WKB_GEOMETRY_TYPES: Dict[int, str] = {
+    1: "POINT",
+    2: "LINESTRING",
+    3: "POLYGON",
+    4: "MULTIPOINT",
+    5: "MULTILINESTRING",
+    6: "MULTIPOLYGON",
+    7: "GEOMETRYCOLLECTION",
+    8: "CIRCULARSTRING",
+    9: "COMPOUNDCURVE",
+    10: "CURVEPOLYGON",
+    11: "MULTICURVE",
+    12: "MULTISURFACE",
+    13: "CURVE",
+    14: "SURFACE",
+    15: "POLYHEDRALSURFACE",
+    16: "TIN",
+    17: "TRIANGLE",
+}
+
 
 class _SpatialElement:
     """The base class for public spatial elements.
@@ -139,6 +163,12 @@ class WKTElement(_SpatialElement):
         if extended is None:
             extended = data.startswith("SRID=")
         if extended and srid == -1:
+            if wkt_cache.enabled:
+                parsed_srid = wkt_cache.parse(data).srid
+                if parsed_srid is None:
+                    raise ArgumentError("invalid EWKT string {}".format(data))
+                _SpatialElement.__init__(self, data, parsed_srid, extended)
+                return
             # read srid from EWKT
             data_s = data.split(";")
             if len(data_s) != 2:
@@ -161,6 +191,8 @@ class WKTElement(_SpatialElement):
 
     def as_wkt(self) -> WKTElement:
         if self.extended:
+            if wkt_cache.enabled:
+                return WKTElement(wkt_cache.parse(self.data).body, self.srid, extended=False)
             srid_match = self._REMOVE_SRID.match(self.data)
             assert srid_match is not None
             return WKTElement(srid_match.group(3), self.srid, extended=False)
@@ -182,6 +214,103 @@ class DynamicWKTElement(WKTElement):
     __slots__ = ("__dict__", "__weakref__")
 
 
+class ParsedWKT(NamedTuple):
+    """The result of the parsing of a WKT or EWKT string."""
+
+    srid: Optional[int]
+    """The SRID read from the EWKT header, or ``None`` if there is no valid header."""
+
+    geom_type: Optional[str]
+    """The geometry type without spaces (e.g. ``POINTZ``), or ``None`` if it could not be parsed."""
+
+    body: str
+    """The WKT string without the SRID header."""
+
+    coords: Optional[str]
+    """The coordinates part of the WKT string, or ``None`` if it could not be parsed."""
+
+    srid_header: Optional[str] = None
+    """The matched SRID header without the separator (e.g. ``SRID=4326``), or ``None``."""
+
+
+def _parse_wkt(data: str) -> ParsedWKT:
+    """Parse a WKT or EWKT string."""
+    data_s = data.split(";")
+    srid: Optional[int] = None
+    if len(data_s) == 2:
+        try:
+            srid = int(data_s[0][5:])
+        except ValueError:
+            pass
+
+    srid_match = WKTElement._REMOVE_SRID.match(data)
+    assert srid_match is not None
+    body = srid_match.group(3)
+
+    match = WKTElement.SPLIT_WKT_PATTERN.match(data)
+    if match is None:
+        return ParsedWKT(srid, None, body, None)
+    return ParsedWKT(srid, match.group(3).replace(" ", ""), body, match.group(4), match.group(2))
+
+
+class WKTParseCache:
+    """An opt-in bounded LRU cache for the parsing of WKT and EWKT strings.
+
+    When enabled, the parsing of the strings given to :class:`geoalchemy2.elements.WKTElement`
+    objects and to the SQLite bind processor is cached, which avoids splitting the same strings
+    and running the same regular expressions on them again and again. This is useful when the
+    same geometries are bound many times, like tile envelopes or admin boundaries.
+
+    The cache is disabled by default and a global instance is available as
+    ``geoalchemy2.elements.wkt_cache``::
+
+        from geoalchemy2.elements import wkt_cache
+
+        wkt_cache.enable(maxsize=4096)
+        ...
+        print(wkt_cache.info())  # CacheInfo(hits=..., misses=..., maxsize=4096, currsize=...)
+    """
+
+    def __init__(self) -> None:
+        self._parse: Optional[Any] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Indicate whether the cache is enabled."""
+        return self._parse is not None
+
+    def enable(self, maxsize: int = 1024) -> None:
+        """Enable the cache with the given maximum number of entries.
+
+        Enabling the cache again resets it.
+        """
+        self._parse = lru_cache(maxsize=maxsize)(_parse_wkt)
+
+    def disable(self) -> None:
+        """Disable the cache and drop its entries."""
+        self._parse = None
+
+    def clear(self) -> None:
+        """Drop the entries and reset the statistics of the cache."""
+        if self._parse is not None:
+            self._parse.cache_clear()
+
+    def info(self):
+        """Return the hit/miss statistics of the cache, or ``None`` if it is disabled."""
+        if self._parse is None:
+            return None
+        return self._parse.cache_info()
+
+    def parse(self, data: str) -> ParsedWKT:
+        """Parse a WKT or EWKT string, using the cache if it is enabled."""
+        if self._parse is None:
+            return _parse_wkt(data)
+        return self._parse(data)
+
+
+wkt_cache = WKTParseCache()
+
+
 class WKBElement(_SpatialElement):
     """Instances of this class wrap a WKB or EWKB value.
 
@@ -192,6 +321,16 @@ class WKBElement(_SpatialElement):
     If ``extended`` is ``True`` and ``srid`` is ``-1`` at construction time
     then the SRID will be read from the EWKB data.
 
+    If ``lazy`` is ``True`` at construction time then the header of the data is not decoded
+    until the ``srid``, ``extended`` or ``geom_type`` attribute is accessed for the first
+    time. The decoded values are then cached, so they are decoded at most once. This is
+    useful when the data is only forwarded without being inspected. When these attributes are
+    read for most of the elements, the default eager mode is faster.
+
+    The ``geom_type`` attribute is always decoded lazily from the header. It contains the name
+    of the geometry type, including the dimension suffix (e.g. ``"POINT"``, ``"LINESTRINGZ"`` or
+    ``"POLYGONZM"``), or ``None`` if the type can not be determined.
+
     Note: you can create ``WKBElement`` objects from Shapely geometries
     using the :func:`geoalchemy2.shape.from_shape` function.
 
@@ -202,40 +341,29 @@ class WKBElement(_SpatialElement):
         ``DynamicWKBElement`` subclass, which provides these capabilities.
     """
 
-    __slots__ = ()
+    __slots__ = ("geom_type", "_hash")
 
     geom_from: str = "ST_GeomFromWKB"
     geom_from_extended_version: str = "ST_GeomFromEWKB"
 
     def __init__(
-        self, data: str | bytes | memoryview, srid: int = -1, extended: Optional[bool] = None
+        self,
+        data: str | bytes | memoryview,
+        srid: int = -1,
+        extended: Optional[bool] = None,
+        lazy: bool = False,
     ) -> None:
+        if lazy:
+            # Only store what is already known, the header is decoded on first access to one of
+            # the 'srid', 'extended' or 'geom_type' attributes
+            self.data = data
+            if srid != -1 or extended is False:
+                self.srid = srid
+            if extended is not None:
+                self.extended = extended
+            return
         if srid == -1 or extended is None or extended:
-            # read srid from the EWKB
-            #
-            # WKB struct {
-            #    byte    byteOrder;
-            #    uint32  wkbType;
-            #    uint32  SRID;
-            #    struct  geometry;
-            # }
-            # byteOrder enum {
-            #     WKB_XDR = 0,  // Most Significant Byte First
-            #     WKB_NDR = 1,  // Least Significant Byte First
-            # }
-            # See https://trac.osgeo.org/postgis/browser/branches/3.0/doc/ZMSgeoms.txt
-            # for more details about WKB/EWKB specifications.
-            if isinstance(data, str):
-                # SpatiaLite case
-                # assume that the string is an hex value
-                header = binascii.unhexlify(data[:18])
-            else:
-                header = data[:9]
-            byte_order, wkb_type, wkb_srid = header[0], header[1:5], header[5:]
-            byte_order_marker = "<I" if byte_order else ">I"
-            wkb_type_int = (
-                int(struct.unpack(byte_order_marker, wkb_type)[0]) if len(wkb_type) == 4 else 0
-            )
+            byte_order_marker, wkb_type_int, wkb_srid = self._read_header(data)
             if extended is None:
                 if not wkb_type_int:
                     extended = False
@@ -246,13 +374,151 @@ class WKBElement(_SpatialElement):
                 srid = int(wkb_srid)
         _SpatialElement.__init__(self, data, srid, extended)
 
+    def __getattr__(self, name):
+        # This is only called when the attribute is not set yet, so each lazy attribute is
+        # decoded at most once
+        if name == "srid" or name == "extended":
+            self._decode_header()
+            return object.__getattribute__(self, name)
+        if name == "geom_type":
+            geom_type = self._geom_type_from_int(self._read_header(self.data)[1])
+            self.geom_type = geom_type
+            return geom_type
+        return _SpatialElement.__getattr__(self, name)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, WKBElement):
+            return _SpatialElement.__eq__(self, other)
+        if self.extended != other.extended or self.srid != other.srid:
+            return False
+        if isinstance(self.data, str) and isinstance(other.data, str):
+            return self.data.lower() == other.data.lower()
+        # Compare the raw bytes instead of the hex representations, which are twice as large
+        try:
+            return self._wkb_bytes() == other._wkb_bytes()
+        except ValueError:
+            # The hex string is not valid
+            return False
+
+    def __hash__(self):
+        # The hash is computed from the raw bytes and cached, so the data should not be modified
+        # after the element is hashed
+        try:
+            return self._hash
+        except AttributeError:
+            pass
+        try:
+            data = self._wkb_bytes()
+        except ValueError:
+            # The hex string is not valid
+            data = self.data
+        self._hash = hash((data, self.srid, self.extended))
+        return self._hash
+
+    def _wkb_bytes(self) -> bytes:
+        """Get the WKB data as bytes, converting the hex strings if needed."""
+        if isinstance(self.data, str):
+            return bytes.fromhex(self.data)
+        return self._wkb_to_bytes(self.data)
+
+    def __reduce_ex__(self, protocol):
+        # Pickle the raw bytes instead of the hex string, which is twice as large
+        is_hex = isinstance(self.data, str)
+        data = self._wkb_bytes()
+        return (
+            _unpickle_wkb_element,
+            (
+                self.__class__,
+                _pickle_buffer(data, protocol),
+                self.srid,
+                self.extended,
+                is_hex,
+                getattr(self, "__dict__", None) or None,
+            ),
+        )
+
+    @staticmethod
+    def _read_header(data: Union[str, bytes, memoryview]):
+        """Read the byte order, the geometry type and the raw SRID from the (E)WKB header."""
+        # read srid from the EWKB
+        #
+        # WKB struct {
+        #    byte    byteOrder;
+        #    uint32  wkbType;
+        #    uint32  SRID;
+        #    struct  geometry;
+        # }
+        # byteOrder enum {
+        #     WKB_XDR = 0,  // Most Significant Byte First
+        #     WKB_NDR = 1,  // Least Significant Byte First
+        # }
+        # See https://trac.osgeo.org/postgis/browser/branches/3.0/doc/ZMSgeoms.txt
+        # for more details about WKB/EWKB specifications.
+        header: Union[bytes, memoryview]
+        if isinstance(data, str):
+            # SpatiaLite case
+            # assume that the string is an hex value
+            header = binascii.unhexlify(data[:18])
+        else:
+            header = data[:9]
+        byte_order, wkb_type, wkb_srid = header[0], header[1:5], header[5:]
+        byte_order_marker = "<I" if byte_order else ">I"
+        wkb_type_int = (
+            int(struct.unpack(byte_order_marker, wkb_type)[0]) if len(wkb_type) == 4 else 0
+        )
+        return byte_order_marker, wkb_type_int, wkb_srid
+
+    @staticmethod
+    def _geom_type_from_int(wkb_type_int: int) -> Optional[str]:
+        """Get the geometry type name from the (E)WKB or ISO WKB type code."""
+        has_z = bool(wkb_type_int & 2147483648)  # EWKB Z bit
+        has_m = bool(wkb_type_int & 1073741824)  # EWKB M bit
+        iso_dimension, base_type = divmod(wkb_type_int & 268435455, 1000)
+        has_z = has_z or iso_dimension in (1, 3)
+        has_m = has_m or iso_dimension in (2, 3)
+        geom_type = _WKB_GEOMETRY_TYPES.get(base_type)
+        if geom_type is None:
+            return None
+        return geom_type + ("Z" if has_z else "") + ("M" if has_m else "")
+
+    def _decode_header(self) -> None:
+        """Decode the SRID and the extended flag if they were not given to the constructor."""
+        byte_order_marker, wkb_type_int, wkb_srid = self._read_header(self.data)
+        try:
+            extended = object.__getattribute__(self, "extended")
+        except AttributeError:
+            extended = bool(wkb_type_int & 536870912)  # Check SRID bit
+            self.extended = extended
+        try:
+            object.__getattribute__(self, "srid")
+        except AttributeError:
+            self.srid = int(struct.unpack(byte_order_marker, wkb_srid)[0]) if extended else -1
+
     @staticmethod
     def _wkb_to_hex(data: Union[str, bytes, memoryview]) -> str:
         """Convert WKB to hex string."""
         if isinstance(data, str):
             # SpatiaLite case
             return data.lower()
-        return str(binascii.hexlify(data), encoding="utf-8").lower()
+        # The hex() method works on both bytes and memoryview objects without copying them
+        return data.hex()
+
+    @staticmethod
+    def _wkb_to_bytes(data: Union[bytes, memoryview]) -> bytes:
+        """Convert WKB to bytes, without copying the data when possible."""
+        if (
+            isinstance(data, memoryview)
+            and isinstance(data.obj, bytes)
+            and data.contiguous
+            and data.ndim == 1
+            and data.format in ("B", "b", "c")
+            and data.nbytes == len(data.obj)
+        ):
+            # The view is a plain byte view covering the whole underlying bytes object, so the
+            # object can be used directly
+            return data.obj
+        # Note that bytes(data) returns data itself if it is already a bytes object
+        return bytes(data)
 
     @property
     def desc(self) -> str:
@@ -288,11 +554,9 @@ class WKBElement(_SpatialElement):
                 )
                 data = self.data[:2] + wkb_type_hex.decode("ascii") + self.data[18:]
             else:
-                buffer = bytearray()
-                buffer.extend(self.data[:1])
-                buffer.extend(struct.pack(byte_order_marker, wkb_type_int))
-                buffer.extend(self.data[9:])
-                data = memoryview(buffer)
+                # Only the header is rebuilt, the body is copied once from a view of the data
+                header = struct.pack(byte_order_marker[0] + "BI", byte_order, wkb_type_int)
+                data = memoryview(b"".join((header, memoryview(self.data)[9:])))
             return WKBElement(data, self.srid, extended=False)
         return WKBElement(self.data, self.srid)
 
@@ -326,12 +590,11 @@ class WKBElement(_SpatialElement):
                     + self.data[10:]
                 )
             else:
-                buffer = bytearray()
-                buffer.extend(self.data[:1])
-                buffer.extend(struct.pack(byte_order_marker, wkb_type_int))
-                buffer.extend(struct.pack(byte_order_marker, self.srid))
-                buffer.extend(self.data[5:])
-                data = memoryview(buffer)
+                # Only the header is rebuilt, the body is copied once from a view of the data
+                header = struct.pack(
+                    byte_order_marker[0] + "BII", byte_order, wkb_type_int, self.srid
+                )
+                data = memoryview(b"".join((header, memoryview(self.data)[5:])))
 
             return WKBElement(data, self.srid, extended=True)
         return WKBElement(self.data, self.srid)
@@ -387,6 +650,54 @@ class RasterElement(_SpatialElement):
     def _data_from_desc(desc):
         return desc
 
+    def __reduce_ex__(self, protocol):
+        # Pickle the raw bytes instead of the hex string, which is twice as large, unless the
+        # hex string is not in lower case (the exact string is then needed for the equality)
+        if self.data.islower() or self.data.isdigit():
+            data = _pickle_buffer(bytes.fromhex(self.data), protocol)
+        else:
+            data = self.data
+        return (
+            _unpickle_raster_element,
+            (self.__class__, data, self.srid, getattr(self, "__dict__", None) or None),
+        )
+
+
+def _pickle_buffer(data: bytes, protocol: int):
+    """Wrap the data to allow out-of-band pickling if the protocol supports it."""
+    if protocol >= 5:
+        return pickle.PickleBuffer(data)
+    return data
+
+
+def _unpickled_buffer(data):
+    """Get the data from a pickled buffer, without copying it."""
+    if isinstance(data, (bytes, str)):
+        return data
+    # The buffer was pickled out-of-band or comes from a writable buffer
+    return memoryview(data)
+
+
+def _unpickle_wkb_element(cls, data, srid, extended, is_hex, state):
+    data = _unpickled_buffer(data)
+    if is_hex:
+        data = data.hex()
+    element = cls(data, srid=srid, extended=extended, lazy=True)
+    if state is not None:
+        element.__dict__.update(state)
+    return element
+
+
+def _unpickle_raster_element(cls, data, srid, state):
+    data = _unpickled_buffer(data)
+    if not isinstance(data, str):
+        data = data.hex()
+    element = cls.__new__(cls)
+    _SpatialElement.__init__(element, data, srid, True)
+    if state is not None:
+        element.__dict__.update(state)
+    return element
+
 
 class DynamicRasterElement(RasterElement):
     """This is a subclass of ``RasterElement`` that allows dynamic attributes.
@@ -402,8 +713,14 @@ class CompositeElement(FunctionElement):
 
     __slots__ = ("name", "type")
 
-    inherit_cache: bool = False
-    """The cache is disabled for this class."""
+    inherit_cache: bool = True
+    """The cache is enabled for this class."""
+
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("name", InternalTraversal.dp_string),
+        ("type", InternalTraversal.dp_type),
+    ]
+    """The field name and the type are part of the cache key."""
 
     def __init__(self, base, field, type_) -> None:
         self.name = field
@@ -426,6 +743,9 @@ __all__: List[str] = [
     "DynamicRasterElement",
     "DynamicWKBElement",
     "DynamicWKTElement",
+    "ParsedWKT",
+    "WKTParseCache",
+    "wkt_cache",
 ]
 
 
@@ -77,6 +77,7 @@ from sqlalchemy.sql import annotation
 from sqlalchemy.sql import functions
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.selectable import FromClause
+from sqlalchemy.sql.visitors import InternalTraversal
 
 from geoalchemy2 import elements
 from geoalchemy2._functions import _FUNCTIONS
@@ -132,8 +133,11 @@ except ImportError:
 
 
 class TableRowElement(ColumnElement):
-    inherit_cache: bool = False
-    """The cache is disabled for this class."""
+    inherit_cache: bool = True
+    """The cache is enabled for this class."""
+
+    _traverse_internals = [("selectable", InternalTraversal.dp_clauseelement)]
+    """The selectable is part of the cache key."""
 
     def __init__(self, selectable: FromClause) -> None:
         self.selectable = selectable
@@ -12,7 +12,7 @@ class GenericFunction(functions.GenericFunction): ...
 
 class TableRowElement(ColumnElement):
     inherit_cache: bool = ...
-    """The cache is disabled for this class."""
+    """The cache is enabled for this class."""
 
     def __init__(self, selectable: bool) -> None: ...
     @property
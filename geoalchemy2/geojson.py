@@ -0,0 +1,93 @@
+"""This module provides utility functions to export query results as GeoJSON.
+
+The features are built by the database with the feature version of the ``ST_AsGeoJSON``
+function (PostGIS>=3) and are streamed from a server-side cursor, so large layers can be exported
+in constant memory.
+"""
+
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from sqlalchemy.sql import func
+from sqlalchemy.sql import select
+
+from geoalchemy2.exc import ArgumentError
+from geoalchemy2.types import Geography
+from geoalchemy2.types import Geometry
+
+_FEATURE_COLLECTION_HEADER = '{"type": "FeatureCollection", "features": ['
+_FEATURE_COLLECTION_FOOTER = "]}"
+
+
+def _geojson_features_select(
+    statement, geom_column: Optional[str] = None, max_decimal_digits: int = 9
+):
+    """Build the statement returning one GeoJSON feature per row of the given statement."""
+    if geom_column is None:
+        for col in statement.selected_columns:
+            if isinstance(col.type, (Geometry, Geography)):
+                geom_column = col.name
+                break
+        else:
+            raise ArgumentError("The statement does not select any spatial column")
+    subquery = statement.subquery()
+    return select(func.ST_AsGeoJSON(subquery, geom_column, max_decimal_digits))
+
+
+def iter_geojson_feature_collection(
+    connection,
+    statement,
+    geom_column: Optional[str] = None,
+    max_decimal_digits: int = 9,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    """Execute a select statement and yield the results as a GeoJSON FeatureCollection.
+
+    The FeatureCollection is yielded by chunks of ``batch_size`` features, so it can be directly
+    written to a file or sent in a streaming HTTP response. The results are fetched with a
+    server-side cursor (``stream_results``), so only one batch of features is loaded in memory at
+    the same time.
+
+    Each row is converted to a feature by the database: the geometry column is used as the
+    geometry of the feature and the other columns are used as properties.
+
+    .. Note::
+
+        This function requires PostGIS>=3.
+
+    Args:
+        connection: The connection used to execute the statement.
+        statement: The select statement to execute.
+        geom_column: The name of the geometry column. The first spatial column of the statement
+            is used by default.
+        max_decimal_digits: The maximum number of decimal places of the coordinates.
+        batch_size: The number of features fetched and yielded at once.
+
+    Example::
+
+        with engine.connect() as conn:
+            with open("lakes.geojson", "w") as f:
+                for chunk in iter_geojson_feature_collection(conn, select(Lake)):
+                    f.write(chunk)
+    """
+    features_statement = _geojson_features_select(statement, geom_column, max_decimal_digits)
+    result = connection.execute(
+        features_statement.execution_options(stream_results=True, yield_per=batch_size)
+    )
+
+    yield _FEATURE_COLLECTION_HEADER
+    separator = ""
+    for partition in result.scalars().partitions(batch_size):
+        yield separator + ", ".join(partition)
+        separator = ", "
+    yield _FEATURE_COLLECTION_FOOTER
+
+
+__all__: List[str] = [
+    "iter_geojson_feature_collection",
+]
+
+
+def __dir__():
+    return __all__
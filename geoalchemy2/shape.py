@@ -6,7 +6,11 @@
     functions of this module have to ensure that `Shapely` is available.
 """
 
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
+from typing import Any
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Union
@@ -18,8 +22,14 @@ try:
 
     HAS_SHAPELY = True
     _shapely_exc = None
+
+    # The vectorized functions are only available with Shapely >= 2
+    HAS_SHAPELY_VECTORIZED = hasattr(shapely, "from_wkb")
+    if HAS_SHAPELY_VECTORIZED:
+        import numpy as np
 except ImportError as exc:
     HAS_SHAPELY = False
+    HAS_SHAPELY_VECTORIZED = False
     _shapely_exc = exc
 
 from geoalchemy2.elements import WKBElement
@@ -36,6 +46,17 @@ def check_shapely():
     yield
 
 
+@contextmanager
+def check_shapely_vectorized():
+    with check_shapely():
+        if not HAS_SHAPELY_VECTORIZED:
+            raise ImportError(
+                "This feature needs Shapely>=2. "
+                "Please upgrade it with 'pip install -U geoalchemy2[shapely]'."
+            )
+        yield
+
+
 @check_shapely()
 def to_shape(element: Union[WKBElement, WKTElement]):
     """Function to convert a :class:`geoalchemy2.types.SpatialElement` to a Shapely geometry.
@@ -50,7 +71,9 @@ def to_shape(element: Union[WKBElement, WKTElement]):
     """
     if isinstance(element, WKBElement):
         data, hex = (
-            (element.data, True) if isinstance(element.data, str) else (bytes(element.data), False)
+            (element.data, True)
+            if isinstance(element.data, str)
+            else (element._wkb_to_bytes(element.data), False)
         )
         return shapely.wkb.loads(data, hex=hex)
     elif isinstance(element, WKTElement):
@@ -86,9 +109,181 @@ def from_shape(shape, srid: int = -1, extended: Optional[bool] = False) -> WKBEl
     )
 
 
+@check_shapely_vectorized()
+def to_shapes(elements: Iterable[Optional[Union[WKBElement, WKTElement]]]):
+    """Function to convert several :class:`geoalchemy2.types.SpatialElement` to Shapely geometries.
+
+    This function is equivalent to calling :func:`geoalchemy2.shape.to_shape` on each element but
+    the conversion is performed in bulk by Shapely's vectorized functions, which is much faster
+    for large numbers of elements. The ``None`` values are kept as is.
+
+    .. Note::
+
+        This function requires Shapely>=2.
+
+    Args:
+        elements: The elements to convert into ``Shapely`` objects.
+
+    Returns:
+        A NumPy array of ``Shapely`` geometries.
+
+    Example::
+
+        lakes = session.scalars(select(Lake.geom)).all()
+        polygons = to_shapes(lakes)
+    """
+    elements = list(elements)
+    wkb_indices = []
+    wkb_data = []
+    wkt_indices = []
+    wkt_data = []
+    for idx, element in enumerate(elements):
+        if element is None:
+            continue
+        elif isinstance(element, WKBElement):
+            wkb_indices.append(idx)
+            wkb_data.append(
+                element.data
+                if isinstance(element.data, str)
+                else element._wkb_to_bytes(element.data)
+            )
+        elif isinstance(element, WKTElement):
+            wkt_indices.append(idx)
+            wkt_data.append(element.data.split(";", 1)[1] if element.extended else element.data)
+        else:
+            raise TypeError("Only WKBElement and WKTElement objects are supported")
+
+    geoms = np.full(len(elements), None, dtype=object)
+    if wkb_indices:
+        geoms[wkb_indices] = shapely.from_wkb(np.array(wkb_data, dtype=object))
+    if wkt_indices:
+        geoms[wkt_indices] = shapely.from_wkt(np.array(wkt_data, dtype=object))
+    return geoms
+
+
+@check_shapely_vectorized()
+def from_shapes(
+    shapes, srid: int = -1, extended: Optional[bool] = False
+) -> List[Optional[WKBElement]]:
+    """Function to convert several Shapely geometries to :class:`geoalchemy2.types.WKBElement`.
+
+    This function is equivalent to calling :func:`geoalchemy2.shape.from_shape` on each geometry
+    but the conversion is performed in bulk by Shapely's vectorized functions, which is much faster
+    for large numbers of geometries. The ``None`` values are kept as is.
+
+    .. Note::
+
+        This function requires Shapely>=2.
+
+    Args:
+        shapes: The shapes to convert, given as an iterable or as a NumPy array.
+        srid: An integer representing the spatial reference system. E.g. ``4326``.
+            Default value is ``-1``, which means no/unknown reference system.
+        extended: A boolean to switch between WKB and EWKB.
+            Default value is False.
+
+    Example::
+
+        from shapely import points
+        wkb_elements = from_shapes(points([(5, 45), (6, 46)]), srid=4326)
+    """
+    shapes = np.asarray(shapes, dtype=object)
+    if extended:
+        shapes = shapely.set_srid(shapes, srid)
+    data = shapely.to_wkb(shapes, hex=False, output_dimension=3, include_srid=bool(extended))
+    # The SRID and the extended flag are already known so there is no need to decode the headers
+    return [
+        (
+            WKBElement(memoryview(i), srid=srid, extended=extended, lazy=True)
+            if i is not None
+            else None
+        )
+        for i in data.tolist()
+    ]
+
+
+def _raw_wkb_value(element: Any) -> Optional[bytes]:
+    """Get the raw WKB bytes of an element or of a raw WKB value."""
+    if element is None:
+        return None
+    if isinstance(element, WKBElement):
+        element = element.data
+    if isinstance(element, str):
+        return bytes.fromhex(element)
+    if isinstance(element, memoryview):
+        return WKBElement._wkb_to_bytes(element)
+    if isinstance(element, (bytes, bytearray)):
+        return bytes(element)
+    raise TypeError("Only WKBElement objects and raw WKB values are supported")
+
+
+def _decode_wkb_chunk(values: List[Optional[bytes]]):
+    """Decode a chunk of raw WKB values."""
+    # Shapely holds the GIL while decoding, so the threads only run in parallel on a
+    # free-threaded build of Python
+    return shapely.from_wkb(np.array(values, dtype=object))
+
+
+@check_shapely_vectorized()
+def to_shapes_parallel(
+    elements: Iterable[Any],
+    chunk_size: int = 100000,
+    executor: Optional[Executor] = None,
+):
+    """Function to convert many WKB values to Shapely geometries by chunks, possibly in threads.
+
+    This function is equivalent to :func:`geoalchemy2.shape.to_shapes` but the elements are split
+    into chunks of ``chunk_size`` elements which are submitted to the given
+    :class:`concurrent.futures.ThreadPoolExecutor`, or decoded one after the other in the calling
+    thread if no executor is given.
+
+    Since Shapely holds the GIL while decoding the WKB values, the threads only run in parallel on
+    a free-threaded build of Python. The process pools are not supported: the geometries would be
+    pickled as WKB values by the workers and decoded again in the main process, which is slower
+    than :func:`geoalchemy2.shape.to_shapes`.
+
+    .. Note::
+
+        This function requires Shapely>=2.
+
+    Args:
+        elements: The elements to convert into ``Shapely`` objects. They can be
+            :class:`geoalchemy2.elements.WKBElement` objects or raw WKB values (``bytes``,
+            ``memoryview`` or hexadecimal strings) as returned by the database. The ``None``
+            values are kept as is.
+        chunk_size: The number of elements decoded by each task.
+        executor: The :class:`concurrent.futures.ThreadPoolExecutor` used to decode the chunks.
+
+    Returns:
+        A NumPy array of ``Shapely`` geometries.
+
+    Example::
+
+        rows = conn.execute(select(func.ST_AsEWKB(Lake.geom))).scalars().all()
+        with ThreadPoolExecutor() as executor:
+            polygons = to_shapes_parallel(rows, executor=executor)
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk size must be a positive integer")
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError("The process pools are not supported, use a thread pool instead")
+    values = [_raw_wkb_value(i) for i in elements]
+    if not values:
+        return np.empty(0, dtype=object)
+    chunks = [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+    if executor is None:
+        return np.concatenate([_decode_wkb_chunk(chunk) for chunk in chunks])
+    futures = [executor.submit(_decode_wkb_chunk, chunk) for chunk in chunks]
+    return np.concatenate([future.result() for future in futures])
+
+
 __all__: List[str] = [
     "from_shape",
+    "from_shapes",
     "to_shape",
+    "to_shapes",
+    "to_shapes_parallel",
 ]
 
 
@@ -7,6 +7,7 @@ columns/properties in models.
 
 import re
 import warnings
+from functools import partial
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -18,6 +19,10 @@ from sqlalchemy.dialects.postgresql.base import ischema_names as _postgresql_isc
 from sqlalchemy.dialects.sqlite.base import ischema_names as _sqlite_ischema_names
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.sql import func
+from sqlalchemy.sql import literal
+from sqlalchemy.sql.elements import BindParameter
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.sql.visitors import InternalTraversal
 from sqlalchemy.types import Float
 from sqlalchemy.types import Integer
 from sqlalchemy.types import UserDefinedType
@@ -34,6 +39,7 @@ from geoalchemy2.comparator import Comparator
 from geoalchemy2.elements import CompositeElement
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
 from geoalchemy2.exc import ArgumentError
 from geoalchemy2.types import dialects
 
@@ -95,6 +101,32 @@ class _GISType(UserDefinedType):
             column. To use check constraints instead set ``use_typmod`` to
             ``False``. By default this option is not included in the call to
             ``AddGeometryColumn``. Note that this option is only available for PostGIS 2.x.
+        native_binary: If set to ``True``, the selected columns are not wrapped in the
+            "as binary" function when the ``asyncpg`` driver or the SQLite and GeoPackage
+            dialects are used, so the values are transferred in the native binary format of the
+            database.
+            With ``asyncpg``, this format is the EWKB format of PostGIS and the binary codecs must
+            be registered on the connections with
+            :func:`geoalchemy2.admin.dialects.postgresql.register_asyncpg_codecs`, otherwise the
+            values are transferred as hexadecimal strings.
+            With SQLite (resp. GeoPackage), the values are decoded from the internal BLOB format
+            of SpatiaLite (resp. the GeoPackage binary format) on the client side and the
+            :class:`geoalchemy2.elements.WKBElement` values are bound as SpatiaLite BLOBs (resp.
+            GeoPackage binary values) instead of EWKT strings. The WKT values are also converted
+            into native BLOBs on the client side (using ``Shapely``) and the binary values must be
+            valid native BLOBs, since all the values are bound as is.
+            With MySQL and MariaDB, the selected columns are still wrapped in the "as binary"
+            function but all the bound values are converted into WKB on the client side (using
+            ``Shapely`` for the WKT values) and passed to the ``ST_GeomFromWKB`` function, so the
+            :class:`geoalchemy2.elements.WKBElement` values are not converted into WKT. This is
+            the default with these dialects, set this option to ``False`` to convert the bound
+            values with the "from text" function instead.
+            This option has no effect with the other dialects and drivers. Default is ``None``,
+            which only enables it with MySQL and MariaDB.
+        lazy_elements: If set to ``True``, the :class:`geoalchemy2.elements.WKBElement` objects
+            built from the query results are lazy, so their header is only decoded when their
+            ``srid``, ``extended`` or ``geom_type`` attribute is accessed. This is useful when
+            the values are only forwarded without being inspected. Default is ``False``.
     """
 
     name: Optional[str] = None
@@ -113,8 +145,11 @@ class _GISType(UserDefinedType):
     """ This is the way by which spatial operators are defined for
         geometry/geography columns. """
 
-    cache_ok = False
-    """ Disable cache for this type. """
+    cache_ok = True
+    """ Enable cache for this type.
+
+    The cache key is built from the arguments of the constructor, so all the subclasses must
+    store these arguments as attributes with the same names. """
 
     def __init__(
         self,
@@ -127,6 +162,8 @@ class _GISType(UserDefinedType):
         from_text: Optional[str] = None,
         name: Optional[str] = None,
         nullable: bool = True,
+        native_binary: Optional[bool] = None,
+        lazy_elements: bool = False,
         _spatial_index_reflected=None,
     ) -> None:
         geometry_type, srid, dimension = self.check_ctor_args(
@@ -144,6 +181,8 @@ class _GISType(UserDefinedType):
         self.use_typmod = use_typmod
         self.extended: Optional[bool] = self.as_binary == "ST_AsEWKB"
         self.nullable = nullable
+        self.native_binary = native_binary
+        self.lazy_elements = lazy_elements
         self._spatial_index_reflected = _spatial_index_reflected
 
     def get_col_spec(self):
@@ -153,33 +192,95 @@ class _GISType(UserDefinedType):
 
     def column_expression(self, col):
         """Specific column_expression that automatically adds a conversion function."""
+        if self.native_binary:
+            return _AsBinaryOrNative(col, type_=self)
         return getattr(func, self.as_binary)(col, type_=self)
 
     def result_processor(self, dialect, coltype):
-        """Specific result_processor that automatically process spatial elements."""
+        """Specific result_processor that automatically process spatial elements.
+
+        The arguments given to the element constructor only depend on the type and on the dialect,
+        so they are resolved once here and the returned function is specialized accordingly.
+        """
+        element_type = self.ElementType
+        lazy = self.lazy_elements
+        if self.native_binary and _has_native_binary_codec(dialect):
+            to_ewkb = select_dialect(dialect.name).native_binary_to_ewkb
+            native_kwargs: Dict[str, Any] = {
+                "srid": self.srid if self.srid > 0 else -1,
+                "extended": True,
+            }
+            if lazy:
+                native_kwargs["lazy"] = True
+
+            def process(value):
+                if value is not None:
+                    return element_type(to_ewkb(value), **native_kwargs)
+
+            return process
+
+        srid = self.srid if self.srid > 0 else None
+        extended = self.extended if dialect.name not in ["mysql", "mariadb"] else None
+        if self.native_binary and _is_asyncpg(dialect):
+            # The native binary format of PostGIS is always EWKB
+            extended = True
+
+        if lazy:
+            # The header is decoded when it is accessed, using the values already known
+            kwargs: Dict[str, Any] = {"lazy": True}
+            if srid is not None:
+                kwargs["srid"] = srid
+            if extended is not None:
+                kwargs["extended"] = extended
+
+            def process(value):
+                if value is not None:
+                    return element_type(value, **kwargs)
+
+            return process
+
+        if srid is not None and extended is not None:
+
+            def process(value):
+                if value is not None:
+                    return element_type(value, srid=srid, extended=extended)
+
+        elif srid is not None:
 
-        def process(value):
-            if value is not None:
-                kwargs = {}
-                if self.srid > 0:
-                    kwargs["srid"] = self.srid
-                if self.extended is not None and dialect.name not in ["mysql", "mariadb"]:
-                    kwargs["extended"] = self.extended
-                return self.ElementType(value, **kwargs)
+            def process(value):
+                if value is not None:
+                    return element_type(value, srid=srid)
+
+        elif extended is not None:
+
+            def process(value):
+                if value is not None:
+                    return element_type(value, extended=extended)
+
+        else:
+
+            def process(value):
+                if value is not None:
+                    return element_type(value)
 
         return process
 
     def bind_expression(self, bindvalue):
         """Specific bind_expression that automatically adds a conversion function."""
-        return getattr(func, self.from_text)(bindvalue, type_=self)
+        return _FromTextOrBinary(bindvalue, type_=self)
 
     def bind_processor(self, dialect):
-        """Specific bind_processor that automatically process spatial elements."""
-
-        def process(bindvalue):
-            return select_dialect(dialect.name).bind_processor_process(self, bindvalue)
-
-        return process
+        """Specific bind_processor that automatically process spatial elements.
+
+        The dialect-specific function is resolved once here instead of once per bound value.
+        """
+        if dialect.name in ["mysql", "mariadb"]:
+            native = dialects.mysql.binds_wkb(self)
+        else:
+            native = bool(self.native_binary) and _has_native_binary_codec(dialect)
+        if native:
+            return partial(select_dialect(dialect.name).bind_processor_process_native, self)
+        return partial(select_dialect(dialect.name).bind_processor_process, self)
 
     @staticmethod
     def check_ctor_args(geometry_type, srid, dimension, use_typmod, nullable):
@@ -215,6 +316,105 @@ class _GISType(UserDefinedType):
         return geometry_type, srid, dimension
 
 
+def _is_asyncpg(dialect) -> bool:
+    return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+
+
+def _has_native_binary_codec(dialect) -> bool:
+    """Check if the native binary values are encoded and decoded on the client side."""
+    return dialect.name in ["sqlite", "geopackage"]
+
+
+def _supports_native_binary(dialect) -> bool:
+    return _is_asyncpg(dialect) or _has_native_binary_codec(dialect)
+
+
+class _AsBinaryOrNative(FunctionElement):
+    """Wrap a column in the "as binary" function of its type, except for the native formats.
+
+    This element is used by the ``column_expression`` method of the spatial types whose
+    ``native_binary`` option is enabled.
+    """
+
+    inherit_cache: bool = True
+    """The cache is enabled for this class."""
+
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("type", InternalTraversal.dp_type),
+    ]
+    """The type is part of the cache key."""
+
+    def __init__(self, col, type_) -> None:
+        self.type = type_
+        super().__init__(col)
+
+
+@compiles(_AsBinaryOrNative)
+def _compile_as_binary_or_native(element, compiler, **kw):
+    if _supports_native_binary(compiler.dialect):
+        return compiler.process(element.clauses, **kw)
+    as_binary = getattr(func, element.type.as_binary)(*element.clauses, type_=element.type)
+    return compiler.process(as_binary, **kw)
+
+
+class _FromTextOrBinary(FunctionElement):
+    """Wrap a bound value in the "from text" function of its type, except for the binary values.
+
+    This element is used by the ``bind_expression`` method of the spatial types. When the values
+    are converted into a binary format by the bind processor, the "from text" function is not used:
+
+    * with SQLite and GeoPackage, when the ``native_binary`` option is enabled, the values are
+      bound as native BLOBs without any function;
+    * with MySQL and MariaDB, unless the ``native_binary`` option is set to ``False``, the values
+      are bound as WKB (in hexadecimal with MariaDB) and converted with the ``ST_GeomFromWKB``
+      function.
+    """
+
+    inherit_cache: bool = True
+    """The cache is enabled for this class."""
+
+    _traverse_internals = FunctionElement._traverse_internals + [
+        ("type", InternalTraversal.dp_type),
+    ]
+    """The type is part of the cache key."""
+
+    def __init__(self, bindvalue, type_) -> None:
+        self.type = type_
+        super().__init__(bindvalue)
+
+
+@compiles(_FromTextOrBinary)
+def _compile_from_text_or_binary(element, compiler, **kw):
+    if element.type.native_binary and _has_native_binary_codec(compiler.dialect):
+        # All the values are converted into the native binary format by the bind processor, so
+        # they are bound as is
+        (bindvalue,) = element.clauses
+        if kw.get("literal_binds", False) and isinstance(bindvalue, BindParameter):
+            processed = element.type.bind_processor(compiler.dialect)(bindvalue.effective_value)
+            return "X'%s'" % bytes(processed).hex() if processed is not None else "NULL"
+        return compiler.process(bindvalue, **kw)
+    from_text = getattr(func, element.type.from_text)(*element.clauses, type_=element.type)
+    return compiler.process(from_text, **kw)
+
+
+@compiles(_FromTextOrBinary, "mysql")
+@compiles(_FromTextOrBinary, "mariadb")
+def _compile_from_text_or_binary_mysql(element, compiler, **kw):
+    (bindvalue,) = element.clauses
+    if kw.get("literal_binds", False) and isinstance(bindvalue, BindParameter):
+        # The spatial types have no literal processor, so the processed value is rendered instead
+        value = element.type.bind_processor(compiler.dialect)(bindvalue.effective_value)
+        if isinstance(value, WKTElement):
+            value = value.data
+        bindvalue = literal(value)
+    if dialects.mysql.binds_wkb(element.type):
+        # All the values are converted into WKB by the bind processor, so they are bound once
+        # (the compilation of ST_GeomFromWKB renders the literal values in hexadecimal)
+        return compiler.process(func.ST_GeomFromWKB(bindvalue, type_=element.type), **kw)
+    from_text = getattr(func, element.type.from_text)(bindvalue, type_=element.type)
+    return compiler.process(from_text, **kw)
+
+
 @compiles(_GISType, "mysql")
 @compiles(_GISType, "mariadb")
 def get_col_spec_mysql(self, compiler, *args, **kwargs):
@@ -276,7 +476,7 @@ class Geometry(_GISType):
         ``result_processor`` method. """
 
     cache_ok = True
-    """ Disable cache for this type. """
+    """ Enable cache for this type. """
 
 
 class Geography(_GISType):
@@ -306,7 +506,7 @@ class Geography(_GISType):
         ``result_processor`` method. """
 
     cache_ok = True
-    """ Disable cache for this type. """
+    """ Enable cache for this type. """
 
 
 class Raster(_GISType):
@@ -346,7 +546,7 @@ class Raster(_GISType):
         ``result_processor`` method. """
 
     cache_ok = True
-    """ Disable cache for this type. """
+    """ Enable cache for this type. """
 
     def __init__(self, spatial_index=True, from_text=None, name=None, nullable=True) -> None:
         # Enforce default values
@@ -371,6 +571,9 @@ class Raster(_GISType):
 class _DummyGeometry(Geometry):
     """A dummy type only used with SQLite."""
 
+    cache_ok = True
+    """ Enable cache for this type. """
+
     def get_col_spec(self):
         return self.geometry_type or "GEOMETRY"
 
@@ -1,5 +1,214 @@
 """This module defines functions used by several dialects."""
 
+import struct
+from typing import Any
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+EWKB_Z_FLAG = 0x80000000
+EWKB_M_FLAG = 0x40000000
+EWKB_SRID_FLAG = 0x20000000
+
+
+class WKBGeometry(NamedTuple):
+    """A geometry decoded from a binary representation.
+
+    The ``coords`` attribute depends on the geometry type:
+
+    * for points and linestrings, it is a flat tuple of the coordinates of the vertices,
+    * for polygons, it is a list of such flat tuples (one for each ring),
+    * for multi-geometries and geometry collections, it is a list of ``WKBGeometry`` objects.
+    """
+
+    geom_type: int
+    has_z: bool
+    has_m: bool
+    coords: Any
+
+    @property
+    def ndims(self) -> int:
+        """The number of coordinates of each vertex."""
+        return 2 + self.has_z + self.has_m
+
 
 def bind_processor_process(spatial_type, bindvalue):
     return bindvalue  # pragma: no cover
+
+
+def get_type_processor(processors, value):
+    """Get the processor registered for the type of the given value.
+
+    Args:
+        processors: A dictionary mapping the types to their processors.
+        value: The value to process.
+
+    The processor registered for the exact type of the value is returned if it exists, otherwise
+    the processor registered for the closest parent type is returned. If no processor is found
+    then ``None`` is returned.
+    """
+    value_type = type(value)
+    processor = processors.get(value_type)
+    if processor is None:
+        for parent_type in value_type.__mro__[1:]:
+            processor = processors.get(parent_type)
+            if processor is not None:
+                break
+    return processor
+
+
+def read_wkb(data) -> Tuple[WKBGeometry, Optional[int]]:
+    """Decode a WKB, EWKB or ISO WKB value.
+
+    Args:
+        data: The binary value, as ``bytes``, ``memoryview`` or hexadecimal string.
+
+    Returns:
+        The decoded geometry and its SRID (``None`` if the value does not contain any SRID).
+    """
+    if isinstance(data, str):
+        data = bytes.fromhex(data)
+    try:
+        geom, srid, _ = _read_wkb_geometry(data, 0)
+    except (struct.error, IndexError) as exc:
+        raise ValueError("Invalid WKB value") from exc
+    return geom, srid
+
+
+def _read_wkb_geometry(data, offset: int) -> Tuple[WKBGeometry, Optional[int], int]:
+    endian = "<" if data[offset] else ">"
+    (type_int,) = struct.unpack_from(endian + "I", data, offset + 1)
+    offset += 5
+    srid = None
+    if type_int & EWKB_SRID_FLAG:
+        (srid,) = struct.unpack_from(endian + "i", data, offset)
+        offset += 4
+    iso_dimension, geom_type = divmod(type_int & 0x0FFFFFFF, 1000)
+    has_z = bool(type_int & EWKB_Z_FLAG) or iso_dimension in (1, 3)
+    has_m = bool(type_int & EWKB_M_FLAG) or iso_dimension in (2, 3)
+    ndims = 2 + has_z + has_m
+    coords: Any
+    if geom_type == 1:
+        coords = struct.unpack_from("%s%dd" % (endian, ndims), data, offset)
+        offset += 8 * ndims
+    elif geom_type == 2:
+        coords, offset = _read_wkb_coords(data, offset, endian, ndims)
+    elif geom_type == 3:
+        (nb_rings,) = struct.unpack_from(endian + "I", data, offset)
+        offset += 4
+        coords = []
+        for _ in range(nb_rings):
+            ring, offset = _read_wkb_coords(data, offset, endian, ndims)
+            coords.append(ring)
+    elif 4 <= geom_type <= 7:
+        (nb_geoms,) = struct.unpack_from(endian + "I", data, offset)
+        offset += 4
+        coords = []
+        for _ in range(nb_geoms):
+            child, _, offset = _read_wkb_geometry(data, offset)
+            coords.append(child)
+    else:
+        raise ValueError("Unsupported WKB geometry type: %d" % type_int)
+    return WKBGeometry(geom_type, has_z, has_m, coords), srid, offset
+
+
+def _read_wkb_coords(data, offset: int, endian: str, ndims: int):
+    (nb_points,) = struct.unpack_from(endian + "I", data, offset)
+    offset += 4
+    nb_values = nb_points * ndims
+    coords = struct.unpack_from("%s%dd" % (endian, nb_values), data, offset)
+    return coords, offset + 8 * nb_values
+
+
+def write_ewkb(geom: WKBGeometry, srid: Optional[int] = None) -> bytes:
+    """Encode a geometry into little-endian EWKB.
+
+    Args:
+        geom: The geometry to encode.
+        srid: The SRID written in the header, no SRID is written if it is ``None``.
+    """
+    parts: List[bytes] = []
+    _write_wkb_geometry(geom, srid, False, parts)
+    return b"".join(parts)
+
+
+def write_iso_wkb(geom: WKBGeometry) -> bytes:
+    """Encode a geometry into little-endian ISO WKB."""
+    parts: List[bytes] = []
+    _write_wkb_geometry(geom, None, True, parts)
+    return b"".join(parts)
+
+
+def _write_wkb_geometry(
+    geom: WKBGeometry, srid: Optional[int], iso: bool, parts: List[bytes]
+) -> None:
+    type_int = geom.geom_type
+    if iso:
+        type_int += 1000 * geom.has_z + 2000 * geom.has_m
+    else:
+        if geom.has_z:
+            type_int |= EWKB_Z_FLAG
+        if geom.has_m:
+            type_int |= EWKB_M_FLAG
+    if srid is not None:
+        parts.append(struct.pack("<BIi", 1, type_int | EWKB_SRID_FLAG, srid))
+    else:
+        parts.append(struct.pack("<BI", 1, type_int))
+    coords = geom.coords
+    if geom.geom_type == 1:
+        parts.append(struct.pack("<%dd" % len(coords), *coords))
+    elif geom.geom_type == 2:
+        parts.append(_pack_wkb_coords(coords, geom.ndims))
+    elif geom.geom_type == 3:
+        parts.append(struct.pack("<I", len(coords)))
+        parts.extend(_pack_wkb_coords(ring, geom.ndims) for ring in coords)
+    else:
+        parts.append(struct.pack("<I", len(coords)))
+        for child in coords:
+            _write_wkb_geometry(child, None, iso, parts)
+
+
+def _pack_wkb_coords(coords, ndims: int) -> bytes:
+    return struct.pack("<I%dd" % len(coords), len(coords) // ndims, *coords)
+
+
+def iter_coord_arrays(geom: WKBGeometry):
+    """Iterate over the flat coordinate tuples of a geometry and of all its children.
+
+    Each item is a ``(coords, ndims)`` tuple.
+    """
+    if geom.geom_type == 1:
+        # The empty points are encoded with NaN coordinates
+        if geom.coords[0] == geom.coords[0]:
+            yield geom.coords, geom.ndims
+    elif geom.geom_type == 2:
+        yield geom.coords, geom.ndims
+    elif geom.geom_type == 3:
+        for ring in geom.coords:
+            yield ring, geom.ndims
+    else:
+        for child in geom.coords:
+            yield from iter_coord_arrays(child)
+
+
+def envelope(geom: WKBGeometry) -> Optional[Tuple[float, float, float, float]]:
+    """Compute the 2D envelope of a geometry.
+
+    Returns:
+        The ``(minx, miny, maxx, maxy)`` tuple, or ``None`` if the geometry is empty.
+    """
+    xs = []
+    ys = []
+    for coords, ndims in iter_coord_arrays(geom):
+        if coords:
+            xs.append(coords[0::ndims])
+            ys.append(coords[1::ndims])
+    if not xs:
+        return None
+    return (
+        min(min(i) for i in xs),
+        min(min(i) for i in ys),
+        max(max(i) for i in xs),
+        max(max(i) for i in ys),
+    )
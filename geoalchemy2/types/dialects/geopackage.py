@@ -1,3 +1,156 @@
 """This module defines specific functions for GeoPackage dialect."""
 
+import struct
+from functools import partial
+
+from geoalchemy2.elements import RasterElement
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.exc import ArgumentError
+from geoalchemy2.types.dialects.common import EWKB_M_FLAG
+from geoalchemy2.types.dialects.common import EWKB_SRID_FLAG
+from geoalchemy2.types.dialects.common import EWKB_Z_FLAG
+from geoalchemy2.types.dialects.common import envelope
+from geoalchemy2.types.dialects.common import get_type_processor
+from geoalchemy2.types.dialects.common import read_wkb
+from geoalchemy2.types.dialects.common import write_ewkb
+from geoalchemy2.types.dialects.common import write_iso_wkb
+from geoalchemy2.types.dialects.sqlite import _process_raster_element
+from geoalchemy2.types.dialects.sqlite import _process_str_native
+from geoalchemy2.types.dialects.sqlite import _process_wkb_element_native
+from geoalchemy2.types.dialects.sqlite import _process_wkt_element_native
+from geoalchemy2.types.dialects.sqlite import _to_native_binary
 from geoalchemy2.types.dialects.sqlite import bind_processor_process  # noqa
+from geoalchemy2.types.dialects.sqlite import spatialite_blob_to_ewkb
+
+# Markers of the GeoPackage binary format, see
+# http://www.geopackage.org/spec/#gpb_format for more details.
+_GPKG_MAGIC = b"GP"
+_GPKG_VERSION = 0
+_GPKG_LITTLE_ENDIAN_FLAG = 0x01
+_GPKG_XY_ENVELOPE_FLAG = 0x02
+_GPKG_EMPTY_FLAG = 0x10
+_GPKG_EXTENDED_FLAG = 0x20
+_GPKG_ENVELOPE_SIZES = {0: 0, 1: 32, 2: 48, 3: 48, 4: 64}
+
+
+def wkb_to_gpkg_blob(data, srid: int) -> bytes:
+    """Encode a WKB or EWKB value into the GeoPackage binary format.
+
+    The XY envelope is written for all the geometries except for the points and the empty
+    geometries.
+
+    Args:
+        data: The binary value, as ``bytes``, ``memoryview`` or hexadecimal string.
+        srid: The SRID stored in the header.
+
+    Raises:
+        ValueError: If the value can not be decoded (e.g. curves).
+    """
+    if isinstance(data, str):
+        data = bytes.fromhex(data)
+    geom, _ = read_wkb(data)
+    mbr = envelope(geom)
+    flags = _GPKG_LITTLE_ENDIAN_FLAG
+    envelope_data = b""
+    if mbr is None:
+        flags |= _GPKG_EMPTY_FLAG
+    elif geom.geom_type != 1:
+        flags |= _GPKG_XY_ENVELOPE_FLAG
+        envelope_data = struct.pack("<4d", mbr[0], mbr[2], mbr[1], mbr[3])
+    parts = [struct.pack("<2sBBi", _GPKG_MAGIC, _GPKG_VERSION, flags, srid), envelope_data]
+    (type_int,) = struct.unpack_from("<I" if data[0] else ">I", data, 1)
+    if type_int & (EWKB_Z_FLAG | EWKB_M_FLAG | EWKB_SRID_FLAG):
+        # The GeoPackage geometries must be stored as standard (ISO) WKB
+        parts.append(write_iso_wkb(geom))
+    else:
+        parts.append(bytes(data))
+    return b"".join(parts)
+
+
+def gpkg_blob_to_ewkb(data) -> bytes:
+    """Decode a GeoPackage binary value into little-endian EWKB.
+
+    The values that do not start with the GeoPackage magic number are decoded as SpatiaLite
+    BLOBs, since they are the ones stored by SpatiaLite in the ``Amphibious`` mode.
+
+    Args:
+        data: The GeoPackage binary value, as ``bytes`` or ``memoryview``.
+
+    Raises:
+        ValueError: If the value is neither a valid GeoPackage binary value nor a valid
+            SpatiaLite BLOB, or if it uses the extended GeoPackage geometry types.
+    """
+    if data[:2] != _GPKG_MAGIC:
+        return spatialite_blob_to_ewkb(data)
+    try:
+        flags = data[3]
+        (srid,) = struct.unpack_from("<i" if flags & _GPKG_LITTLE_ENDIAN_FLAG else ">i", data, 4)
+        envelope_size = _GPKG_ENVELOPE_SIZES.get((flags >> 1) & 0x07)
+        if envelope_size is None or flags & _GPKG_EXTENDED_FLAG:
+            raise ValueError("Unsupported GeoPackage binary value")
+        offset = 8 + envelope_size
+        (type_int,) = struct.unpack_from("<I" if data[offset] else ">I", data, offset + 1)
+        iso_dimension, geom_type = divmod(type_int, 1000)
+        if data[offset] and 1 <= geom_type <= 3 and iso_dimension <= 3:
+            # The body of the little-endian simple geometries is already the one of the EWKB
+            # value, so only the header has to be built
+            type_int = geom_type | EWKB_SRID_FLAG
+            if iso_dimension in (1, 3):
+                type_int |= EWKB_Z_FLAG
+            if iso_dimension in (2, 3):
+                type_int |= EWKB_M_FLAG
+            return b"".join((struct.pack("<BIi", 1, type_int, srid), data[offset + 5 :]))
+        geom, _ = read_wkb(data[offset:])
+    except (struct.error, IndexError) as exc:
+        raise ValueError("Invalid GeoPackage binary value") from exc
+    return write_ewkb(geom, srid)
+
+
+def _process_binary_native(spatial_type, bindvalue):
+    try:
+        if bindvalue[:2] == _GPKG_MAGIC:
+            # The GeoPackage binary values are bound as is, so they are only checked
+            gpkg_blob_to_ewkb(bindvalue)
+            return bindvalue
+        # The SpatiaLite BLOBs are not standard GeoPackage geometries, so they are re-encoded
+        ewkb = spatialite_blob_to_ewkb(bindvalue)
+    except ValueError as exc:
+        raise ArgumentError(
+            "The binary value is not in the native binary format: {}".format(exc)
+        ) from exc
+    # The SRID of the SpatiaLite BLOB is kept
+    (srid,) = struct.unpack_from("<i", ewkb, 5)
+    return _to_native_binary(wkb_to_gpkg_blob, ewkb, srid)
+
+
+_NATIVE_BIND_PROCESSORS = {
+    WKTElement: partial(_process_wkt_element_native, encode=wkb_to_gpkg_blob),
+    WKBElement: partial(_process_wkb_element_native, encode=wkb_to_gpkg_blob),
+    RasterElement: _process_raster_element,
+    str: partial(_process_str_native, encode=wkb_to_gpkg_blob),
+    bytes: _process_binary_native,
+    bytearray: _process_binary_native,
+    memoryview: _process_binary_native,
+}
+
+
+def bind_processor_process_native(spatial_type, bindvalue):
+    """Process the bound values of the types whose ``native_binary`` option is enabled.
+
+    The geometries are encoded into GeoPackage binary values instead of EWKT strings. The
+    GeoPackage binary values are checked, since they are bound as is, and the SpatiaLite BLOBs are
+    re-encoded into GeoPackage binary values.
+
+    Raises:
+        ArgumentError: If the geometry can not be encoded (e.g. curves) or if the binary value is
+            neither a valid GeoPackage binary value nor a valid SpatiaLite BLOB.
+    """
+    processor = get_type_processor(_NATIVE_BIND_PROCESSORS, bindvalue)
+    if processor is None:
+        return bindvalue
+    return processor(spatial_type, bindvalue)
+
+
+native_binary_to_ewkb = gpkg_blob_to_ewkb
+""" Convert the values of the types whose ``native_binary`` option is enabled to EWKB. """
@@ -5,44 +5,121 @@ from geoalchemy2.elements import WKTElement
 from geoalchemy2.elements import _SpatialElement
 from geoalchemy2.exc import ArgumentError
 from geoalchemy2.shape import to_shape
+from geoalchemy2.types.dialects.common import get_type_processor
 
 
-def bind_processor_process(spatial_type, bindvalue):
-    if isinstance(bindvalue, str):
-        wkt_match = WKTElement._REMOVE_SRID.match(bindvalue)
-        srid = wkt_match.group(2)
-        try:
-            if srid is not None:
-                srid = int(srid)
-        except (ValueError, TypeError):  # pragma: no cover
-            raise ArgumentError(
-                f"The SRID ({srid}) of the supplied value can not be casted to integer"
-            )
-
-        if srid is not None and srid != spatial_type.srid:
-            raise ArgumentError(
-                f"The SRID ({srid}) of the supplied value is different "
-                f"from the one of the column ({spatial_type.srid})"
-            )
-        return wkt_match.group(3)
-
-    if (
-        isinstance(bindvalue, _SpatialElement)
-        and bindvalue.srid != -1
-        and bindvalue.srid != spatial_type.srid
-    ):
+def _process_str(spatial_type, bindvalue):
+    wkt_match = WKTElement._REMOVE_SRID.match(bindvalue)
+    srid = wkt_match.group(2)
+    try:
+        if srid is not None:
+            srid = int(srid)
+    except (ValueError, TypeError):  # pragma: no cover
+        raise ArgumentError(f"The SRID ({srid}) of the supplied value can not be casted to integer")
+
+    if srid is not None and srid != spatial_type.srid:
+        raise ArgumentError(
+            f"The SRID ({srid}) of the supplied value is different "
+            f"from the one of the column ({spatial_type.srid})"
+        )
+    return wkt_match.group(3)
+
+
+def _check_srid(spatial_type, bindvalue):
+    if bindvalue.srid != -1 and bindvalue.srid != spatial_type.srid:
         raise ArgumentError(
             f"The SRID ({bindvalue.srid}) of the supplied value is different "
             f"from the one of the column ({spatial_type.srid})"
         )
+    return bindvalue
 
-    if isinstance(bindvalue, WKTElement):
-        bindvalue = bindvalue.as_wkt()
-        if bindvalue.srid <= 0:
-            bindvalue.srid = spatial_type.srid
-        return bindvalue
-    elif isinstance(bindvalue, WKBElement):
-        if "wkb" not in spatial_type.from_text.lower():
-            # With MySQL we use Shapely to convert the WKBElement to an EWKT string
-            return to_shape(bindvalue).wkt
+
+def _process_wkt_element(spatial_type, bindvalue):
+    _check_srid(spatial_type, bindvalue)
+    bindvalue = bindvalue.as_wkt()
+    if bindvalue.srid <= 0:
+        bindvalue.srid = spatial_type.srid
     return bindvalue
+
+
+_WKB_BOUND_FROM_TEXT = {"ST_GeomFromEWKT", "ST_GeomFromText", "ST_GeomFromWKB"}
+
+
+def binds_wkb(spatial_type) -> bool:
+    """Check if the values of the given type are bound as WKB with MySQL and MariaDB.
+
+    This is the default for the types using one of the default "from text" functions, unless the
+    ``native_binary`` option is explicitly set to ``False``.
+    """
+    return (
+        spatial_type.native_binary is not False and spatial_type.from_text in _WKB_BOUND_FROM_TEXT
+    )
+
+
+def _process_wkb_element(spatial_type, bindvalue):
+    _check_srid(spatial_type, bindvalue)
+    if "wkb" not in spatial_type.from_text.lower():
+        # With MySQL we use Shapely to convert the WKBElement to an EWKT string
+        return to_shape(bindvalue).wkt
+    return bindvalue
+
+
+_BIND_PROCESSORS = {
+    str: _process_str,
+    WKTElement: _process_wkt_element,
+    WKBElement: _process_wkb_element,
+    _SpatialElement: _check_srid,
+}
+
+
+def bind_processor_process(spatial_type, bindvalue):
+    processor = get_type_processor(_BIND_PROCESSORS, bindvalue)
+    if processor is None:
+        return bindvalue
+    return processor(spatial_type, bindvalue)
+
+
+def _process_wkb_element_native(spatial_type, bindvalue):
+    _check_srid(spatial_type, bindvalue)
+    # The SRID is passed to the ST_GeomFromWKB function so it is removed from the EWKB values
+    if bindvalue.extended:
+        bindvalue = bindvalue.as_wkb()
+    if isinstance(bindvalue.data, str):
+        return bytes.fromhex(bindvalue.data)
+    return WKBElement._wkb_to_bytes(bindvalue.data)
+
+
+def _process_wkt_element_native(spatial_type, bindvalue):
+    _check_srid(spatial_type, bindvalue)
+    # The values are converted with the ST_GeomFromWKB function, so the WKT values are converted
+    # into WKB on the client side
+    return to_shape(bindvalue.as_wkt()).wkb
+
+
+def _process_str_native(spatial_type, bindvalue):
+    return to_shape(WKTElement(_process_str(spatial_type, bindvalue))).wkb
+
+
+def _process_memoryview_native(spatial_type, bindvalue):
+    return WKBElement._wkb_to_bytes(bindvalue)
+
+
+_NATIVE_BIND_PROCESSORS = {
+    str: _process_str_native,
+    WKTElement: _process_wkt_element_native,
+    WKBElement: _process_wkb_element_native,
+    _SpatialElement: _check_srid,
+    memoryview: _process_memoryview_native,
+}
+
+
+def bind_processor_process_native(spatial_type, bindvalue):
+    """Process the bound values of the types whose values are bound as WKB.
+
+    All the geometries are converted into WKB values (without SRID) on the client side, since they
+    are passed to the ``ST_GeomFromWKB`` function. The ``bytes`` values are bound as is.
+    """
+    processor = get_type_processor(_NATIVE_BIND_PROCESSORS, bindvalue)
+    if processor is None:
+        return bindvalue
+    return processor(spatial_type, bindvalue)
@@ -3,27 +3,39 @@
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
-from geoalchemy2.shape import to_shape
+from geoalchemy2.types.dialects.common import get_type_processor
 
 
-def bind_processor_process(spatial_type, bindvalue):
-    if isinstance(bindvalue, WKTElement):
-        if bindvalue.extended:
-            return "%s" % (bindvalue.data)
-        else:
-            return "SRID=%d;%s" % (bindvalue.srid, bindvalue.data)
-    elif isinstance(bindvalue, WKBElement):
-        if not bindvalue.extended:
-            # When the WKBElement includes a WKB value rather
-            # than a EWKB value we use Shapely to convert the WKBElement to an
-            # EWKT string
-            shape = to_shape(bindvalue)
-            return "SRID=%d;%s" % (bindvalue.srid, shape.wkt)
-        else:
-            # PostGIS ST_GeomFromEWKT works with EWKT strings as well
-            # as EWKB hex strings
-            return bindvalue.desc
-    elif isinstance(bindvalue, RasterElement):
+def _process_wkt_element(spatial_type, bindvalue):
+    if bindvalue.extended:
         return "%s" % (bindvalue.data)
     else:
+        return "SRID=%d;%s" % (bindvalue.srid, bindvalue.data)
+
+
+def _process_wkb_element(spatial_type, bindvalue):
+    if not bindvalue.extended:
+        # When the WKBElement includes a WKB value rather than a EWKB value we inject the SRID
+        # into the WKB header to get a EWKB value
+        bindvalue = bindvalue.as_ewkb()
+    # PostGIS ST_GeomFromEWKT works with EWKT strings as well
+    # as EWKB hex strings
+    return bindvalue.desc
+
+
+def _process_raster_element(spatial_type, bindvalue):
+    return "%s" % (bindvalue.data)
+
+
+_BIND_PROCESSORS = {
+    WKTElement: _process_wkt_element,
+    WKBElement: _process_wkb_element,
+    RasterElement: _process_raster_element,
+}
+
+
+def bind_processor_process(spatial_type, bindvalue):
+    processor = get_type_processor(_BIND_PROCESSORS, bindvalue)
+    if processor is None:
         return bindvalue
+    return processor(spatial_type, bindvalue)
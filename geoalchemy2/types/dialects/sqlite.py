@@ -1,25 +1,45 @@
 """This module defines specific functions for SQLite dialect."""
 
-import re
+import struct
 import warnings
+from typing import List
 
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
+from geoalchemy2.elements import wkt_cache
+from geoalchemy2.exc import ArgumentError
 from geoalchemy2.shape import to_shape
+from geoalchemy2.types.dialects.common import EWKB_M_FLAG
+from geoalchemy2.types.dialects.common import EWKB_SRID_FLAG
+from geoalchemy2.types.dialects.common import EWKB_Z_FLAG
+from geoalchemy2.types.dialects.common import WKBGeometry
+from geoalchemy2.types.dialects.common import envelope
+from geoalchemy2.types.dialects.common import get_type_processor
+from geoalchemy2.types.dialects.common import read_wkb
+from geoalchemy2.types.dialects.common import write_ewkb
+
+# Markers of the SpatiaLite BLOB format, see
+# https://www.gaia-gis.it/gaia-sins/BLOB-Geometry.html for more details.
+_BLOB_START = 0x00
+_BLOB_MBR_END = 0x7C
+_BLOB_ENTITY = 0x69
+_BLOB_END = 0xFE
+_TINY_POINT_BIG_ENDIAN = 0x80
+_TINY_POINT_LITTLE_ENDIAN = 0x81
+_COMPRESSED_CLASS = 1000000
 
 
 def format_geom_type(wkt, default_srid=None):
     """Format the Geometry type for SQLite."""
-    match = re.match(WKTElement.SPLIT_WKT_PATTERN, wkt)
-    if match is None:
+    parsed = wkt_cache.parse(wkt)
+    geom_type, coords, srid = parsed.geom_type, parsed.coords, parsed.srid_header
+    if geom_type is None:
         warnings.warn(
             "The given WKT could not be parsed by GeoAlchemy2, this could lead to undefined "
             f"behavior with Z, M or ZM geometries or with incorrect SRID. The WKT string is: {wkt}"
         )
         return wkt
-    _, srid, geom_type, coords = match.groups()
-    geom_type = geom_type.replace(" ", "")
     if geom_type.endswith("ZM"):
         geom_type = geom_type[:-2]
     elif geom_type.endswith("Z"):
@@ -32,24 +52,272 @@ def format_geom_type(wkt, default_srid=None):
         return "%s%s" % (geom_type, coords)
 
 
+def _process_wkt_element(spatial_type, bindvalue):
+    return format_geom_type(
+        bindvalue.data,
+        default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
+    )
+
+
+def _process_wkb_element(spatial_type, bindvalue):
+    # With SpatiaLite we use Shapely to convert the WKBElement to an EWKT string
+    shape = to_shape(bindvalue)
+    # shapely.wkb.loads returns geom_type with a 'Z', for example, 'LINESTRING Z'
+    # which is a limitation with SpatiaLite. Hence, a temporary fix.
+    res = format_geom_type(
+        shape.wkt, default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid
+    )
+    return res
+
+
+def _process_raster_element(spatial_type, bindvalue):
+    return "%s" % (bindvalue.data)
+
+
+def _process_str(spatial_type, bindvalue):
+    return format_geom_type(bindvalue, default_srid=spatial_type.srid)
+
+
+_BIND_PROCESSORS = {
+    WKTElement: _process_wkt_element,
+    WKBElement: _process_wkb_element,
+    RasterElement: _process_raster_element,
+    str: _process_str,
+}
+
+
 def bind_processor_process(spatial_type, bindvalue):
-    if isinstance(bindvalue, WKTElement):
-        return format_geom_type(
-            bindvalue.data,
-            default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
-        )
-    elif isinstance(bindvalue, WKBElement):
-        # With SpatiaLite we use Shapely to convert the WKBElement to an EWKT string
-        shape = to_shape(bindvalue)
-        # shapely.wkb.loads returns geom_type with a 'Z', for example, 'LINESTRING Z'
-        # which is a limitation with SpatiaLite. Hence, a temporary fix.
-        res = format_geom_type(
-            shape.wkt, default_srid=bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid
-        )
-        return res
-    elif isinstance(bindvalue, RasterElement):
-        return "%s" % (bindvalue.data)
-    elif isinstance(bindvalue, str):
-        return format_geom_type(bindvalue, default_srid=spatial_type.srid)
+    processor = get_type_processor(_BIND_PROCESSORS, bindvalue)
+    if processor is None:
+        return bindvalue
+    return processor(spatial_type, bindvalue)
+
+
+def _spatialite_class(geom: WKBGeometry) -> int:
+    return geom.geom_type + 1000 * geom.has_z + 2000 * geom.has_m
+
+
+def wkb_to_spatialite_blob(data, srid: int) -> bytes:
+    """Encode a WKB or EWKB value into the internal BLOB format of SpatiaLite.
+
+    Args:
+        data: The binary value, as ``bytes``, ``memoryview`` or hexadecimal string.
+        srid: The SRID stored in the BLOB.
+
+    Raises:
+        ValueError: If the value is empty or can not be stored in a SpatiaLite BLOB (e.g. curves
+            or nested geometry collections).
+    """
+    geom, _ = read_wkb(data)
+    mbr = envelope(geom)
+    if mbr is None:
+        raise ValueError("The empty geometries can not be encoded into SpatiaLite BLOBs")
+    parts = [
+        struct.pack("<BBi4dBI", _BLOB_START, 1, srid, *mbr, _BLOB_MBR_END, _spatialite_class(geom))
+    ]
+    _write_spatialite_body(geom, parts)
+    parts.append(bytes((_BLOB_END,)))
+    return b"".join(parts)
+
+
+def _write_spatialite_body(geom: WKBGeometry, parts: List[bytes]) -> None:
+    coords = geom.coords
+    if geom.geom_type == 1:
+        if coords[0] != coords[0]:
+            raise ValueError("The empty points can not be encoded into SpatiaLite BLOBs")
+        parts.append(struct.pack("<%dd" % len(coords), *coords))
+    elif geom.geom_type == 2:
+        parts.append(struct.pack("<I%dd" % len(coords), len(coords) // geom.ndims, *coords))
+    elif geom.geom_type == 3:
+        parts.append(struct.pack("<I", len(coords)))
+        for ring in coords:
+            parts.append(struct.pack("<I%dd" % len(ring), len(ring) // geom.ndims, *ring))
+    else:
+        parts.append(struct.pack("<I", len(coords)))
+        for child in coords:
+            if child.geom_type > 3:
+                raise ValueError("The nested collections can not be encoded into SpatiaLite BLOBs")
+            parts.append(struct.pack("<BI", _BLOB_ENTITY, _spatialite_class(child)))
+            _write_spatialite_body(child, parts)
+
+
+def spatialite_blob_to_ewkb(data) -> bytes:
+    """Decode a SpatiaLite BLOB into little-endian EWKB.
+
+    The standard, compressed and TinyPoint BLOB formats are supported.
+
+    Args:
+        data: The SpatiaLite BLOB, as ``bytes`` or ``memoryview``.
+
+    Raises:
+        ValueError: If the value is not a valid SpatiaLite BLOB.
+    """
+    try:
+        if data[0] != _BLOB_START or data[-1] != _BLOB_END:
+            raise ValueError("Invalid SpatiaLite BLOB")
+        byte_order = data[1]
+        if byte_order in (_TINY_POINT_BIG_ENDIAN, _TINY_POINT_LITTLE_ENDIAN):
+            endian = "<" if byte_order == _TINY_POINT_LITTLE_ENDIAN else ">"
+            srid, point_type = struct.unpack_from(endian + "iB", data, 2)
+            if not 1 <= point_type <= 4:
+                raise ValueError("Invalid SpatiaLite BLOB")
+            geom = WKBGeometry(1, point_type in (2, 4), point_type in (3, 4), ())
+            coords = struct.unpack_from("%s%dd" % (endian, geom.ndims), data, 7)
+            return write_ewkb(geom._replace(coords=coords), srid)
+        if byte_order not in (0, 1) or data[38] != _BLOB_MBR_END:
+            raise ValueError("Invalid SpatiaLite BLOB")
+        endian = "<" if byte_order else ">"
+        (srid,) = struct.unpack_from(endian + "i", data, 2)
+        (class_int,) = struct.unpack_from(endian + "I", data, 39)
+        iso_dimension, geom_type = divmod(class_int, 1000)
+        if byte_order and 1 <= geom_type <= 3 and iso_dimension <= 3:
+            # The body of the uncompressed little-endian simple geometries is already the one of
+            # the EWKB value, so only the header has to be built
+            type_int = geom_type | EWKB_SRID_FLAG
+            if iso_dimension in (1, 3):
+                type_int |= EWKB_Z_FLAG
+            if iso_dimension in (2, 3):
+                type_int |= EWKB_M_FLAG
+            return b"".join((struct.pack("<BIi", 1, type_int, srid), data[43:-1]))
+        geom, _ = _read_spatialite_geometry(data, 43, endian, class_int)
+    except (struct.error, IndexError) as exc:
+        raise ValueError("Invalid SpatiaLite BLOB") from exc
+    return write_ewkb(geom, srid)
+
+
+def _read_spatialite_geometry(data, offset: int, endian: str, class_int: int):
+    compressed, class_int = divmod(class_int, _COMPRESSED_CLASS)
+    iso_dimension, geom_type = divmod(class_int, 1000)
+    if compressed > 1 or iso_dimension > 3 or not 1 <= geom_type <= 7:
+        raise ValueError("Unsupported SpatiaLite geometry class: %d" % class_int)
+    geom = WKBGeometry(geom_type, iso_dimension in (1, 3), iso_dimension in (2, 3), None)
+    read_coords = _read_compressed_coords if compressed else _read_coords
+    coords: list | tuple
+    if geom_type == 1:
+        coords = struct.unpack_from("%s%dd" % (endian, geom.ndims), data, offset)
+        offset += 8 * geom.ndims
+    elif geom_type == 2:
+        coords, offset = read_coords(data, offset, endian, geom)
+    elif geom_type == 3:
+        (nb_rings,) = struct.unpack_from(endian + "I", data, offset)
+        offset += 4
+        coords = []
+        for _ in range(nb_rings):
+            ring, offset = read_coords(data, offset, endian, geom)
+            coords.append(ring)
     else:
+        (nb_geoms,) = struct.unpack_from(endian + "I", data, offset)
+        offset += 4
+        coords = []
+        for _ in range(nb_geoms):
+            if data[offset] != _BLOB_ENTITY:
+                raise ValueError("Invalid SpatiaLite BLOB")
+            (child_class,) = struct.unpack_from(endian + "I", data, offset + 1)
+            child, offset = _read_spatialite_geometry(data, offset + 5, endian, child_class)
+            coords.append(child)
+    return geom._replace(coords=coords), offset
+
+
+def _read_coords(data, offset: int, endian: str, geom: WKBGeometry):
+    (nb_points,) = struct.unpack_from(endian + "I", data, offset)
+    nb_values = nb_points * geom.ndims
+    coords = struct.unpack_from("%s%dd" % (endian, nb_values), data, offset + 4)
+    return coords, offset + 4 + 8 * nb_values
+
+
+def _read_compressed_coords(data, offset: int, endian: str, geom: WKBGeometry):
+    # The first and the last vertices are stored as doubles while the other ones are stored as
+    # float deltas from the previous vertex, except the M values which are stored as doubles
+    (nb_points,) = struct.unpack_from(endian + "I", data, offset)
+    offset += 4
+    ndims = geom.ndims
+    nb_deltas = 2 + geom.has_z
+    full_format = "%s%dd" % (endian, ndims)
+    full_size = 8 * ndims
+    delta_format = endian + "f" * nb_deltas + ("d" if geom.has_m else "")
+    delta_size = 4 * nb_deltas + 8 * geom.has_m
+    coords: List[float] = []
+    previous: tuple = ()
+    for i in range(nb_points):
+        if i == 0 or i == nb_points - 1:
+            previous = struct.unpack_from(full_format, data, offset)
+            offset += full_size
+        else:
+            delta = struct.unpack_from(delta_format, data, offset)
+            offset += delta_size
+            previous = tuple(previous[j] + delta[j] for j in range(nb_deltas)) + delta[nb_deltas:]
+        coords.extend(previous)
+    return tuple(coords), offset
+
+
+def _to_native_binary(encode, data, srid):
+    """Encode a WKB or EWKB value into the native binary format with the given encoder."""
+    try:
+        return encode(data, srid)
+    except ValueError as exc:
+        raise ArgumentError(
+            "The geometry can not be bound in the native binary format: {}".format(exc)
+        ) from exc
+
+
+def _process_wkb_element_native(spatial_type, bindvalue, encode=wkb_to_spatialite_blob):
+    return _to_native_binary(
+        encode,
+        bindvalue.data,
+        bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
+    )
+
+
+def _process_wkt_element_native(spatial_type, bindvalue, encode=wkb_to_spatialite_blob):
+    # The native values are bound as is, so the WKT values are converted on the client side
+    return _to_native_binary(
+        encode,
+        to_shape(bindvalue).wkb,
+        bindvalue.srid if bindvalue.srid >= 0 else spatial_type.srid,
+    )
+
+
+def _process_str_native(spatial_type, bindvalue, encode=wkb_to_spatialite_blob):
+    return _process_wkt_element_native(spatial_type, WKTElement(bindvalue), encode)
+
+
+def _process_binary_native(spatial_type, bindvalue, decode=spatialite_blob_to_ewkb):
+    # The binary values are bound as is, so they must already be in the native binary format
+    try:
+        decode(bindvalue)
+    except ValueError as exc:
+        raise ArgumentError(
+            "The binary value is not in the native binary format: {}".format(exc)
+        ) from exc
+    return bindvalue
+
+
+_NATIVE_BIND_PROCESSORS = {
+    WKTElement: _process_wkt_element_native,
+    WKBElement: _process_wkb_element_native,
+    RasterElement: _process_raster_element,
+    str: _process_str_native,
+    bytes: _process_binary_native,
+    bytearray: _process_binary_native,
+    memoryview: _process_binary_native,
+}
+
+
+def bind_processor_process_native(spatial_type, bindvalue):
+    """Process the bound values of the types whose ``native_binary`` option is enabled.
+
+    The geometries are encoded into SpatiaLite BLOBs instead of EWKT strings and the binary values
+    are checked, since the values are bound as is.
+
+    Raises:
+        ArgumentError: If the geometry can not be stored in a SpatiaLite BLOB (e.g. empty
+            geometries) or if the binary value is not a valid SpatiaLite BLOB.
+    """
+    processor = get_type_processor(_NATIVE_BIND_PROCESSORS, bindvalue)
+    if processor is None:
         return bindvalue
+    return processor(spatial_type, bindvalue)
+
+
+native_binary_to_ewkb = spatialite_blob_to_ewkb
+""" Convert the values of the types whose ``native_binary`` option is enabled to EWKB. """
@@ -35,6 +35,7 @@ setup(
     setup_requires=["setuptools_scm"],
     install_requires=["SQLAlchemy>=1.4", "packaging"],
     extras_require={
+        "arrow": ["pyarrow"],
         "shapely": ["Shapely>=1.7"],
     },
     entry_points={
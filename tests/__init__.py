@@ -1,3 +1,4 @@
+import asyncio
 import os
 import platform
 import re
@@ -6,7 +7,12 @@ import shutil
 import pytest
 import shapely
 from packaging.version import parse as parse_version
+from shapely.geometry import LineString
 from shapely.wkb import dumps
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
 from sqlalchemy import __version__ as SA_VERSION
 from sqlalchemy import create_engine
 from sqlalchemy import select as raw_select
@@ -15,6 +21,7 @@ from sqlalchemy.event import listen
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.sql import func
 
+from geoalchemy2 import Geometry
 from geoalchemy2 import load_spatialite
 from geoalchemy2 import load_spatialite_gpkg
 from geoalchemy2.elements import WKBElement
@@ -238,6 +245,56 @@ def check_indexes(conn, dialect_name, expected, table_name):
         raise exc
 
 
+def check_async_engine(async_engine, schema=None):
+    """Create a spatial table, insert and select some values and reflect it with an async engine.
+
+    Returns:
+        The selected rows and the reflected table.
+    """
+    metadata = MetaData()
+    lake = Table(
+        "lake_async",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("geom", Geometry(geometry_type="LINESTRING", srid=4326)),
+        schema=schema,
+    )
+
+    async def run():
+        try:
+            async with async_engine.begin() as conn:
+                await conn.run_sync(metadata.drop_all, checkfirst=True)
+                await conn.run_sync(metadata.create_all)
+                await conn.execute(
+                    lake.insert(),
+                    [
+                        {"id": 1, "geom": WKTElement("LINESTRING(0 0,1 1)", srid=4326)},
+                        {
+                            "id": 2,
+                            "geom": WKBElement(
+                                dumps(LineString([(0, 0), (3, 4)]), srid=4326), extended=True
+                            ),
+                        },
+                    ],
+                )
+                result = await conn.execute(
+                    select([lake.c.geom, lake.c.geom.ST_Length()]).order_by(lake.c.id)
+                )
+                rows = result.all()
+                reflected = await conn.run_sync(
+                    lambda sync_conn: Table(
+                        "lake_async", MetaData(), schema=schema, autoload_with=sync_conn
+                    )
+                )
+                await conn.run_sync(metadata.drop_all)
+            return rows, reflected
+        finally:
+            await async_engine.dispose()
+
+    rows, reflected = asyncio.run(run())
+    return rows, reflected
+
+
 def create_wkt_points(N=50):
     """Create a list of points for benchmarking."""
     points = []
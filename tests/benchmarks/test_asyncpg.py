@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+
+from geoalchemy2 import Geometry
+
+from .. import create_points
+from .. import select
+from .. import skip_sqla_lt_2
+from .. import test_only_with_dialects
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(True, id="Native binary"),
+        pytest.param(False, id="ST_AsEWKB wrapping"),
+    ]
+)
+def native_binary(request):
+    """Fixture to determine if the native binary format is used to select the values."""
+    return request.param
+
+
+@pytest.fixture
+def async_engine(engine, native_binary):
+    pytest.importorskip("asyncpg")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    return create_async_engine(
+        engine.url.set(drivername="postgresql+asyncpg").update_query_dict(
+            {"geoalchemy2_connect_postgresql_binary_codecs": str(native_binary)}
+        ),
+        plugins=["geoalchemy2"],
+    )
+
+
+@skip_sqla_lt_2()
+@test_only_with_dialects("postgresql")
+@pytest.mark.parametrize(
+    "N",
+    [
+        2,
+        pytest.param(100, marks=pytest.mark.long_benchmark),
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_select_asyncpg(benchmark, async_engine, schema, native_binary, N):
+    """Benchmark the selection of points with asyncpg, with or without the binary codecs."""
+    metadata = MetaData()
+    table = Table(
+        "asyncpg_points",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("geom", Geometry("POINT", 4326, native_binary=native_binary)),
+        schema=schema,
+    )
+    points = create_points(N, convert_wkb=True, extended=True)
+
+    async def setup():
+        conn = await async_engine.connect()
+        await conn.run_sync(metadata.drop_all, checkfirst=True)
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(table.insert(), [{"geom": point} for point in points])
+        return conn
+
+    async def select_all(conn):
+        return (await conn.execute(select([table.c.geom]))).all()
+
+    async def teardown(conn):
+        # The table is removed by the rollback
+        await conn.rollback()
+        await conn.close()
+        await async_engine.dispose()
+
+    loop = asyncio.new_event_loop()
+    conn = loop.run_until_complete(setup())
+    try:
+        rows = benchmark(lambda: loop.run_until_complete(select_all(conn)))
+    finally:
+        loop.run_until_complete(teardown(conn))
+        loop.close()
+
+    assert len(rows) == N * N
+    assert rows[0][0].srid == 4326
@@ -0,0 +1,85 @@
+import pytest
+import shapely
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from geoalchemy2 import Geometry
+from geoalchemy2.admin.dialects.geopackage import GeoPackageDialect
+from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import to_shape
+from geoalchemy2.types.dialects.geopackage import gpkg_blob_to_ewkb
+from geoalchemy2.types.dialects.sqlite import spatialite_blob_to_ewkb
+
+
+def _shapely_bind_processor(bindvalue):
+    """Previous implementation of the PostgreSQL bind processor for non-extended WKBElements."""
+    return "SRID=%d;%s" % (bindvalue.srid, to_shape(bindvalue).wkt)
+
+
+@pytest.fixture(
+    params=[pytest.param(True, id="Native"), pytest.param(False, id="Shapely")],
+)
+def is_native(request):
+    """Fixture to determine if the native EWKB conversion or the Shapely one is used."""
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(1000, marks=pytest.mark.long_benchmark),
+        pytest.param(100000, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_bind_wkb_postgresql(benchmark, N, is_native):
+    """Benchmark the binding of a non-extended WKBElement containing a polygon of N vertices."""
+    polygon = shapely.Point(0, 0).buffer(1, quad_segs=max(N // 4, 1))
+    element = from_shape(polygon, srid=4326)
+    if is_native:
+        process = Geometry(srid=4326).bind_processor(postgresql.dialect())
+    else:
+        process = _shapely_bind_processor
+
+    res = benchmark(process, element)
+
+    if is_native:
+        assert shapely.get_srid(shapely.from_wkb(res)) == 4326
+        assert shapely.from_wkb(res).equals_exact(polygon, 0)
+    else:
+        assert res.startswith("SRID=4326;POLYGON")
+
+
+@pytest.mark.parametrize(
+    "dialect,decode",
+    [
+        pytest.param(sqlite.dialect(), spatialite_blob_to_ewkb, id="SQLite"),
+        pytest.param(GeoPackageDialect(), gpkg_blob_to_ewkb, id="GeoPackage"),
+        pytest.param(mysql.dialect(), bytes, id="MySQL"),
+    ],
+)
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(1000, marks=pytest.mark.long_benchmark),
+        pytest.param(100000, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_bind_wkb_native_binary(benchmark, N, is_native, dialect, decode):
+    """Benchmark the binding of a WKBElement containing a polygon of N vertices.
+
+    The native binary values are decoded into WKB or EWKB with the given function, the MySQL ones
+    being already WKB.
+    """
+    polygon = shapely.Point(0, 0).buffer(1, quad_segs=max(N // 4, 1))
+    element = from_shape(polygon, srid=4326)
+    process = Geometry(srid=4326, native_binary=is_native).bind_processor(dialect)
+
+    res = benchmark(process, element)
+
+    if is_native:
+        assert shapely.from_wkb(decode(res)).equals_exact(polygon, 0)
+    else:
+        assert "POLYGON" in res
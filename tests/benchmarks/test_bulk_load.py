@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import text
+
+from geoalchemy2 import Geometry
+from geoalchemy2.admin import select_dialect
+
+from .. import create_wkt_points
+from .. import test_only_with_dialects
+
+ROUNDS = 5
+
+
+@pytest.fixture(
+    params=[pytest.param(True, id="Bulk load"), pytest.param(False, id="Per-row index update")]
+)
+def use_bulk_load(request):
+    """Fixture to determine if the spatial index is rebuilt after the load or not."""
+    return request.param
+
+
+@test_only_with_dialects("sqlite-spatialite3", "sqlite-spatialite4", "geopackage")
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(100, marks=pytest.mark.long_benchmark),
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_insert_spatial_index(benchmark, conn, dialect_name, use_bulk_load, N):
+    """Benchmark the insertion of N*N points in a table with a spatial index."""
+    metadata = MetaData()
+    table = Table(
+        "bulk_load_points",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("geom", Geometry("POINT", srid=4326, spatial_index=True)),
+    )
+    metadata.drop_all(conn, checkfirst=True)
+    metadata.create_all(conn)
+    rows = [{"geom": "SRID=4326;" + point} for point in create_wkt_points(N)]
+    bulk_load = select_dialect(dialect_name).bulk_load
+    if dialect_name == "geopackage":
+        spatial_index = "rtree_bulk_load_points_geom"
+    else:
+        spatial_index = "idx_bulk_load_points_geom"
+
+    def setup():
+        conn.execute(table.delete())
+
+    def run():
+        if use_bulk_load:
+            with bulk_load(conn, table):
+                conn.execute(table.insert(), rows)
+        else:
+            conn.execute(table.insert(), rows)
+
+    benchmark.pedantic(run, setup=setup, iterations=1, rounds=ROUNDS)
+
+    assert conn.execute(text("SELECT COUNT(*) FROM {}".format(spatial_index))).scalar() == N * N
+    metadata.drop_all(conn, checkfirst=True)
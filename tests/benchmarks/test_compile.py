@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.event import listen
+
+from geoalchemy2 import Geometry
+
+from .. import select
+
+
+@pytest.fixture(
+    params=[pytest.param(True, id="Statement cache"), pytest.param(False, id="No statement cache")]
+)
+def use_statement_cache(request):
+    """Fixture to determine if the compiled statement cache of SQLAlchemy is used."""
+    return request.param
+
+
+@pytest.fixture
+def lake_table():
+    return Table(
+        "lake",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("geom", Geometry(geometry_type="LINESTRING", srid=4326, spatial_index=False)),
+    )
+
+
+@pytest.fixture
+def sqlite_conn(use_statement_cache):
+    """A plain SQLite connection where the spatial functions are replaced by dummy functions."""
+    engine = create_engine("sqlite://")
+
+    def register_functions(dbapi_conn, connection_record):
+        dbapi_conn.create_function("AsEWKB", 1, lambda value: value)
+        # Some tests register a SQLite mapping from ST_Buffer to Buffer
+        dbapi_conn.create_function("ST_Buffer", 2, lambda value, distance: value)
+        dbapi_conn.create_function("Buffer", 2, lambda value, distance: value)
+
+    listen(engine, "connect", register_functions)
+
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE lake (id INTEGER, geom BLOB)"))
+        if not use_statement_cache:
+            connection = connection.execution_options(compiled_cache=None)
+        yield connection
+    engine.dispose()
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(1000, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_repeated_select_st_buffer(benchmark, sqlite_conn, lake_table, N):
+    """Benchmark N executions of a new ``select(Lake.geom.ST_Buffer(2))`` statement.
+
+    The table is empty, so the time is mostly spent building and compiling the statement.
+    """
+
+    def run():
+        for _ in range(N):
+            sqlite_conn.execute(select([lake_table.c.geom.ST_Buffer(2)])).fetchall()
+
+    benchmark(run)
@@ -0,0 +1,83 @@
+import pytest
+import shapely
+
+from geoalchemy2.elements import WKBElement
+
+from .. import create_points
+
+
+@pytest.fixture(params=[pytest.param(False, id="Eager"), pytest.param(True, id="Lazy")])
+def is_lazy(request):
+    """Fixture to determine if the header of the WKBElement objects is decoded lazily or not."""
+    return request.param
+
+
+@pytest.fixture(
+    params=[pytest.param(True, id="Extended input"), pytest.param(False, id="Not extended input")]
+)
+def is_extended_input(request):
+    """Fixture to determine if the test is for extended inputs or not."""
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        2,
+        pytest.param(100, marks=pytest.mark.long_benchmark),
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_create_wkb_elements(benchmark, N, is_lazy, is_extended_input):
+    """Benchmark the creation of WKBElement objects whose header is never read."""
+    points = create_points(N, convert_wkb=True, extended=is_extended_input, raw=True)
+
+    elements = benchmark(lambda: [WKBElement(point, lazy=is_lazy) for point in points])
+
+    assert len(elements) == N * N
+    assert elements[0].extended is is_extended_input
+    assert elements[0].srid == (4326 if is_extended_input else -1)
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        2,
+        pytest.param(100, marks=pytest.mark.long_benchmark),
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_create_and_read_wkb_elements(benchmark, N, is_lazy, is_extended_input):
+    """Benchmark the creation of WKBElement objects whose header is read twice."""
+    points = create_points(N, convert_wkb=True, extended=is_extended_input, raw=True)
+
+    def create_and_read():
+        elements = [WKBElement(point, lazy=is_lazy) for point in points]
+        return [(e.srid, e.extended, e.srid, e.extended) for e in elements]
+
+    res = benchmark(create_and_read)
+
+    assert len(res) == N * N
+    assert res[0][1] is is_extended_input
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(1000, marks=pytest.mark.long_benchmark),
+        pytest.param(100000, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_eq_and_hash_wkb_elements(benchmark, N):
+    """Benchmark the comparison and the set insertion of WKBElement objects of N vertices."""
+    polygon = shapely.Point(0, 0).buffer(1, quad_segs=max(N // 4, 1))
+    elements = [
+        WKBElement(memoryview(shapely.to_wkb(polygon, include_srid=False))) for _ in range(10)
+    ]
+
+    def eq_and_hash():
+        assert all(elements[0] == e for e in elements)
+        return len(set(elements))
+
+    assert benchmark(eq_and_hash) == 1
@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+
+from geoalchemy2 import Geometry
+
+
+@pytest.fixture
+def spatial_tables(conn, schema, N):
+    """Create N tables with a spatial column."""
+    metadata = MetaData()
+    table_names = []
+    for i in range(N):
+        table_name = "reflected_lake_{}".format(i)
+        Table(
+            table_name,
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry(geometry_type="LINESTRING", srid=4326)),
+            schema=schema,
+        )
+        table_names.append(table_name)
+    metadata.drop_all(conn, checkfirst=True)
+    metadata.create_all(conn)
+    yield table_names
+    metadata.drop_all(conn, checkfirst=True)
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        10,
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_reflect_metadata(benchmark, conn, schema, spatial_tables, N):
+    """Benchmark the reflection of N spatial tables with ``MetaData.reflect()``."""
+
+    def run():
+        metadata = MetaData()
+        metadata.reflect(conn, schema=schema, only=spatial_tables)
+        return metadata
+
+    metadata = benchmark(run)
+
+    assert len(metadata.tables) == N
+    for table in metadata.tables.values():
+        assert isinstance(table.c.geom.type, Geometry)
+        assert table.c.geom.type.srid == 4326
@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from geoalchemy2.shape import to_shapes
+from geoalchemy2.shape import to_shapes_parallel
+
+from .. import create_points
+
+
+@pytest.fixture(
+    params=[
+        pytest.param("to_shapes", id="Single thread"),
+        pytest.param("threads", id="Thread pool"),
+    ]
+)
+def decode(request):
+    """Fixture returning the function used to decode the WKB values."""
+    if request.param == "to_shapes":
+        yield to_shapes
+    else:
+        with ThreadPoolExecutor() as executor:
+            yield lambda values: to_shapes_parallel(values, chunk_size=10000, executor=executor)
+
+
+@pytest.mark.parametrize(
+    "N",
+    [
+        2,
+        pytest.param(300, marks=pytest.mark.long_benchmark),
+    ],
+)
+def test_decode_wkb_elements(benchmark, N, decode):
+    """Benchmark the conversion of WKBElement objects to Shapely geometries."""
+    elements = create_points(N, convert_wkb=True, extended=True)
+
+    shapes = benchmark(decode, elements)
+
+    assert len(shapes) == N * N
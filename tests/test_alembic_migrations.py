@@ -11,6 +11,8 @@ from sqlalchemy import Column
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
 from sqlalchemy import text
 
 from geoalchemy2 import Geometry
@@ -528,3 +530,39 @@ new_table = Table(
         },
         table_name="new_spatial_table",
     )
+
+
+def test_sqlite_spatial_indexes_quoted_table_name(use_alembic_monkeypatch):
+    """Check that the table names are passed as bound parameters to the spatial index query."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        # Mimic the metadata table of SpatiaLite
+        conn.execute(
+            text(
+                """CREATE TABLE geometry_columns (
+                    f_table_name TEXT,
+                    f_geometry_column TEXT,
+                    geometry_type INTEGER,
+                    coord_dimension INTEGER,
+                    srid INTEGER,
+                    spatial_index_enabled INTEGER
+                )"""
+            )
+        )
+        conn.execute(text("""CREATE TABLE "lake's" (id INTEGER, geom BLOB)"""))
+        conn.execute(
+            text("INSERT INTO geometry_columns VALUES (:table_name, 'geom', 2, 2, 4326, 1)"),
+            {"table_name": "lake's"},
+        )
+
+        indexes = inspect(conn).get_indexes("lake's")
+
+    engine.dispose()
+    assert indexes == [
+        {
+            "name": "idx_lake's_geom",
+            "column_names": ["geom"],
+            "unique": 0,
+            "dialect_options": {"_column_flag": True},
+        }
+    ]
@@ -0,0 +1,162 @@
+import json
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.event import listen
+
+import geoalchemy2.arrow
+from geoalchemy2 import Geometry
+from geoalchemy2.arrow import GEOARROW_WKB_EXTENSION_NAME
+from geoalchemy2.arrow import _raw_binary_select
+from geoalchemy2.arrow import iter_arrow_batches
+from geoalchemy2.arrow import to_arrow_table
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.shape import to_shape
+
+from . import select
+
+pa = pytest.importorskip("pyarrow")
+
+# EWKB of SRID=4326;POINT(1 2)
+POINT_1_2 = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+# EWKB of SRID=4326;POINT(3 4)
+POINT_3_4 = bytes.fromhex("0101000020e610000000000000000008400000000000001040")
+
+
+@pytest.fixture
+def lake_table():
+    return Table(
+        "lake",
+        MetaData(),
+        Column("id", Integer, primary_key=True),
+        Column("name", String),
+        Column("geom", Geometry(geometry_type="POINT", srid=4326, spatial_index=False)),
+        Column("geom_no_srid", Geometry(spatial_index=False)),
+    )
+
+
+@pytest.fixture
+def conn(lake_table):
+    """A plain SQLite connection where the SpatiaLite functions are replaced by fake ones."""
+    engine = create_engine("sqlite://")
+
+    def register_functions(dbapi_conn, connection_record):
+        # Like SpatiaLite, the fake AsEWKB function returns a hexadecimal string
+        dbapi_conn.create_function(
+            "AsEWKB", 1, lambda value: value.hex().upper() if value is not None else None
+        )
+
+    listen(engine, "connect", register_functions)
+
+    with engine.connect() as connection:
+        connection.execute(
+            text("CREATE TABLE lake (id INTEGER, name TEXT, geom BLOB, geom_no_srid BLOB)")
+        )
+        connection.execute(
+            text("INSERT INTO lake VALUES (:id, :name, :geom, :geom_no_srid)"),
+            [
+                {"id": 1, "name": "a", "geom": POINT_1_2, "geom_no_srid": None},
+                {"id": 2, "name": "b", "geom": POINT_3_4, "geom_no_srid": POINT_1_2},
+            ],
+        )
+        yield connection
+    engine.dispose()
+
+
+def test_check_pyarrow(monkeypatch):
+    @geoalchemy2.arrow.check_pyarrow()
+    def f():
+        return "ok"
+
+    assert f() == "ok"
+
+    with monkeypatch.context() as m:
+        m.setattr(geoalchemy2.arrow, "HAS_PYARROW", False)
+        with pytest.raises(ImportError, match="This feature needs the optional PyArrow"):
+            f()
+
+
+@pytest.mark.parametrize(
+    "dialect,expected",
+    [
+        pytest.param(
+            postgresql.dialect(),
+            "SELECT lake.id, ST_AsEWKB(lake.geom) AS geom, "
+            "ST_AsEWKB(ST_Centroid(lake.geom)) "
+            'AS "ST_AsEWKB_1" \nFROM lake',
+            id="postgresql",
+        ),
+        pytest.param(
+            sqlite.dialect(),
+            "SELECT lake.id, AsEWKB(lake.geom) AS geom, "
+            'AsEWKB(ST_Centroid(lake.geom)) AS "ST_AsEWKB_1" \nFROM lake',
+            id="sqlite",
+        ),
+        pytest.param(
+            mysql.dialect(),
+            "SELECT lake.id, ST_AsBinary(lake.geom) AS geom, "
+            "ST_AsBinary(ST_Centroid(lake.geom)) AS `ST_AsEWKB_1` \nFROM lake",
+            id="mysql",
+        ),
+    ],
+)
+def test_raw_binary_select(lake_table, dialect, expected):
+    statement = select([lake_table.c.id, lake_table.c.geom, lake_table.c.geom.ST_Centroid()])
+    raw_statement, spatial_types = _raw_binary_select(statement)
+
+    assert str(raw_statement.compile(dialect=dialect)) == expected
+    assert spatial_types[0] is None
+    assert spatial_types[1] is lake_table.c.geom.type
+    assert isinstance(spatial_types[2], Geometry)
+
+
+def test_to_arrow_table(conn, lake_table):
+    statement = select([lake_table]).order_by(lake_table.c.id)
+    table = to_arrow_table(conn, statement)
+
+    assert table.column_names == ["id", "name", "geom", "geom_no_srid"]
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("name").to_pylist() == ["a", "b"]
+    assert table.column("geom").to_pylist() == [POINT_1_2, POINT_3_4]
+    assert table.column("geom_no_srid").to_pylist() == [None, POINT_1_2]
+    # The values are decoded as WKB
+    assert [WKBElement(i).srid for i in table.column("geom").to_pylist()] == [4326, 4326]
+    assert to_shape(WKBElement(table.column("geom")[1].as_py())).wkt == "POINT (3 4)"
+
+    geom_field = table.schema.field("geom")
+    assert geom_field.type == pa.binary()
+    assert geom_field.metadata[b"ARROW:extension:name"] == GEOARROW_WKB_EXTENSION_NAME.encode()
+    assert json.loads(geom_field.metadata[b"ARROW:extension:metadata"]) == {
+        "crs": "EPSG:4326",
+        "crs_type": "authority_code",
+    }
+    geom_no_srid_field = table.schema.field("geom_no_srid")
+    assert json.loads(geom_no_srid_field.metadata[b"ARROW:extension:metadata"]) == {}
+    assert table.schema.field("id").metadata is None
+
+
+def test_to_arrow_table_empty(conn, lake_table):
+    statement = select([lake_table.c.id, lake_table.c.geom]).where(lake_table.c.id < 0)
+    table = to_arrow_table(conn, statement)
+
+    assert table.num_rows == 0
+    assert table.schema.field("geom").type == pa.binary()
+
+
+def test_iter_arrow_batches(conn, lake_table):
+    statement = select([lake_table.c.id, lake_table.c.geom]).order_by(lake_table.c.id)
+    batches = list(iter_arrow_batches(conn, statement, batch_size=1))
+
+    assert [batch.num_rows for batch in batches] == [1, 1]
+    table = pa.Table.from_batches(batches)
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("geom").to_pylist() == [POINT_1_2, POINT_3_4]
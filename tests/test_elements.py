@@ -1,3 +1,4 @@
+import pickle
 import re
 from itertools import permutations
 
@@ -10,11 +11,14 @@ from sqlalchemy import Table
 from sqlalchemy import func
 
 from geoalchemy2.elements import CompositeElement
+from geoalchemy2.elements import DynamicRasterElement
 from geoalchemy2.elements import DynamicWKBElement
 from geoalchemy2.elements import DynamicWKTElement
+from geoalchemy2.elements import ParsedWKT
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
+from geoalchemy2.elements import wkt_cache
 from geoalchemy2.exc import ArgumentError
 from geoalchemy2.types import Geometry
 
@@ -231,6 +235,65 @@ class TestExtendedWKTElement:
         assert e4.as_ewkt() == WKTElement(f"SRID={arbitrary_srid};{self._wkt}")
 
 
+class TestWKTParseCache:
+    @pytest.fixture
+    def cache(self):
+        wkt_cache.enable(maxsize=2)
+        yield wkt_cache
+        wkt_cache.disable()
+
+    def test_disabled_by_default(self):
+        assert not wkt_cache.enabled
+        assert wkt_cache.info() is None
+        assert wkt_cache.parse("SRID=4326;POINT(1 2)") == ParsedWKT(
+            4326, "POINT", "POINT(1 2)", "(1 2)", "SRID=4326"
+        )
+
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            ("POINT(1 2)", ParsedWKT(None, "POINT", "POINT(1 2)", "(1 2)")),
+            (
+                "SRID=4326;POINT Z (1 2 3)",
+                ParsedWKT(4326, "POINTZ", "POINT Z (1 2 3)", "(1 2 3)", "SRID=4326"),
+            ),
+            ("SRID=4326; POINT(1 2)", ParsedWKT(4326, "POINT", "POINT(1 2)", "(1 2)", "SRID=4326")),
+            ("SRID=a;POINT(1 2)", ParsedWKT(None, None, "SRID=a;POINT(1 2)", None)),
+            ("SRID=1;SRID=2;POINT(1 2)", ParsedWKT(None, None, "SRID=2;POINT(1 2)", None)),
+            ("UNKNOWN", ParsedWKT(None, None, "UNKNOWN", None)),
+        ],
+    )
+    def test_parse(self, cache, data, expected):
+        assert cache.parse(data) == expected
+
+    def test_stats(self, cache):
+        cache.parse("POINT(1 2)")
+        cache.parse("POINT(1 2)")
+        cache.parse("POINT(3 4)")
+        cache.parse("POINT(5 6)")
+        cache.parse("POINT(1 2)")
+        info = cache.info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+
+        cache.clear()
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+    def test_wkt_element(self, cache):
+        elem = WKTElement("SRID=4326;POINT(1 2)")
+        assert elem.srid == 4326
+        assert elem.extended is True
+        assert elem.as_wkt().data == "POINT(1 2)"
+        assert elem.as_wkt().srid == 4326
+        assert WKTElement("SRID=4326;POINT(1 2)").srid == 4326
+        assert cache.info().hits == 3
+
+        with pytest.raises(ArgumentError, match="invalid EWKT string"):
+            WKTElement("SRID=a;POINT(1 2)")
+        with pytest.raises(ArgumentError, match="invalid EWKT string"):
+            WKTElement("POINT(1 2)", extended=True)
+
+
 class TestWKTElementFunction:
     def test_ST_Equal_WKTElement_WKTElement(self):
         expr = func.ST_Equals(WKTElement("POINT(1 2)"), WKTElement("POINT(1 2)"))
@@ -340,6 +403,44 @@ class TestExtendedWKBElement:
             "ST_GeomFromEWKB_1": bytes(self._bin_ewkb),
         }
 
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    @pytest.mark.parametrize("is_hex", [False, True])
+    def test_pickle_raw_bytes(self, protocol, is_hex):
+        data = self._hex_ewkb if is_hex else self._bin_ewkb
+        e = DynamicWKBElement(data, extended=True)
+        e.name = "test"
+        pickled = pickle.dumps(e, protocol=protocol)
+        if protocol >= 3:
+            # The protocol 2 stores bytes objects as latin1 strings
+            assert bytes(self._bin_ewkb) in pickled
+            assert self._hex_ewkb.encode() not in pickled
+
+        unpickled = pickle.loads(pickled)
+        assert type(unpickled) is DynamicWKBElement
+        assert unpickled == e
+        assert unpickled.srid == self._srid
+        assert unpickled.extended is True
+        assert unpickled.data == data
+        assert unpickled.name == "test"
+
+    def test_pickle_out_of_band(self):
+        e = WKBElement(self._bin_ewkb, extended=True)
+        buffers = []
+        pickled = pickle.dumps(e, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        assert bytes(self._bin_ewkb) not in pickled
+
+        unpickled = pickle.loads(pickled, buffers=buffers)
+        assert isinstance(unpickled.data, memoryview)
+        assert unpickled == e
+        assert unpickled.srid == self._srid
+
+    def test_unpickle_legacy_state(self):
+        # Elements pickled by previous versions only contain the state returned by __getstate__
+        e = WKBElement.__new__(WKBElement)
+        e.__setstate__({"srid": self._srid, "data": self._hex_ewkb, "extended": True})
+        assert e == WKBElement(self._bin_ewkb, extended=True)
+
     def test_unpack_srid_from_bin(self):
         """
         Unpack SRID from WKB struct (when it is not provided as arg)
@@ -371,6 +472,100 @@ class TestExtendedWKBElement:
         assert set([a, b, c]) == set([a, b, c])
         assert len(set([a, b, c])) == 2
 
+    def test_eq_hash_mixed_data_types(self):
+        elements = [
+            WKBElement(self._bin_ewkb, extended=True),
+            WKBElement(self._hex_ewkb, extended=True),
+            WKBElement(self._hex_ewkb.upper(), extended=True),
+            WKBElement(bytes(self._bin_ewkb), extended=True),
+            WKBElement(memoryview(bytearray(self._bin_ewkb)), extended=True),
+            DynamicWKBElement(self._bin_ewkb, extended=True, lazy=True),
+        ]
+        for i, j in permutations(elements, 2):
+            assert i == j
+            assert hash(i) == hash(j)
+        assert len(set(elements)) == 1
+
+        assert elements[0] != WKBElement(self._bin_ewkb, srid=self._srid + 1, extended=True)
+        invalid = WKBElement("not a hex string", srid=self._srid, extended=True, lazy=True)
+        assert elements[0] != invalid
+        assert hash(invalid) is not None
+
+    def test_hash_cached(self, monkeypatch):
+        e = WKBElement(self._bin_ewkb, extended=True)
+        calls = []
+        original = WKBElement._wkb_bytes
+
+        def wkb_bytes(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(WKBElement, "_wkb_bytes", wkb_bytes)
+        assert hash(e) == hash(e)
+        assert len(calls) == 1
+
+    def test_lazy(self):
+        e1 = WKBElement(self._bin_ewkb, lazy=True)
+        e2 = WKBElement(self._hex_ewkb, lazy=True)
+        e3 = WKBElement(self._bin_ewkb, srid=9999, lazy=True)
+        for e in [e1, e2, e3]:
+            with pytest.raises(AttributeError):
+                object.__getattribute__(e, "extended")
+        assert e1.srid == e2.srid == self._srid
+        assert e3.srid == 9999
+        assert e1.extended is e2.extended is e3.extended is True
+        assert e1.geom_type == e2.geom_type == e3.geom_type == "POINT"
+        assert e1 == WKBElement(self._bin_ewkb)
+        assert e2 == WKBElement(self._hex_ewkb)
+        assert e3 == WKBElement(self._bin_ewkb, srid=9999)
+
+    def test_lazy_decode_once(self, monkeypatch):
+        e = WKBElement(self._bin_ewkb, lazy=True)
+        calls = []
+        read_header = WKBElement._read_header
+        monkeypatch.setattr(
+            WKBElement,
+            "_read_header",
+            staticmethod(lambda data: calls.append(data) or read_header(data)),
+        )
+        assert (e.srid, e.extended) == (self._srid, True)
+        assert (e.srid, e.extended) == (self._srid, True)
+        assert len(calls) == 1
+        assert e.geom_type == e.geom_type == "POINT"
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize(
+        "hex_data,expected",
+        [
+            pytest.param("0101000000000000000000f03f0000000000000040", "POINT", id="WKB"),
+            pytest.param(
+                "0101000080000000000000f03f00000000000000400000000000000840",
+                "POINTZ",
+                id="EWKB Z",
+            ),
+            pytest.param(
+                "01e9030000000000000000f03f00000000000000400000000000000840",
+                "POINTZ",
+                id="ISO WKB Z",
+            ),
+            pytest.param(
+                "01d1070000000000000000f03f00000000000000400000000000000840",
+                "POINTM",
+                id="ISO WKB M",
+            ),
+            pytest.param(
+                "01b90b0000000000000000f03f0000000000000040" "00000000000008400000000000001040",
+                "POINTZM",
+                id="ISO WKB ZM",
+            ),
+            pytest.param("00000000030000000000000000", "POLYGON", id="Big endian"),
+            pytest.param("0102", None, id="Unknown"),
+        ],
+    )
+    def test_geom_type(self, hex_data, expected):
+        assert WKBElement(hex_data).geom_type == expected
+        assert WKBElement(bytes.fromhex(hex_data), lazy=True).geom_type == expected
+
     def test_as_wkt_as_ewkt(self):
         arbitrary_srid = self._srid + 1
         e1 = WKBElement(self._bin_ewkb)
@@ -414,6 +609,40 @@ class TestExtendedWKBElement:
         e8_ewkb.data = e8_ewkb.data[:11] + "4" + e8_ewkb.data[12:]
         assert e8.as_ewkb() == e8_ewkb
 
+    def test_as_wkb_as_ewkb_big_endian(self):
+        # SRID=4326;POINT(1 2) in big endian
+        hex_ewkb = "0020000001000010e63ff00000000000004000000000000000"
+        hex_wkb = "00000000013ff00000000000004000000000000000"
+        e = WKBElement(memoryview(bytes.fromhex(hex_ewkb)))
+        assert e.as_wkb().desc == hex_wkb
+        assert e.as_wkb().as_ewkb().desc == hex_ewkb
+
+    def test_wkb_to_bytes_no_copy(self):
+        data = bytes.fromhex(self._hex_ewkb)
+        assert WKBElement._wkb_to_bytes(data) is data
+        assert WKBElement._wkb_to_bytes(memoryview(data)) is data
+
+        # A partial view or a view of a mutable buffer must be copied
+        partial = WKBElement._wkb_to_bytes(memoryview(data)[1:])
+        assert partial == data[1:]
+        mutable = bytearray(data)
+        copied = WKBElement._wkb_to_bytes(memoryview(mutable))
+        assert copied == data
+        assert isinstance(copied, bytes)
+
+        # The views that are not plain contiguous byte views must be copied
+        reversed_view = WKBElement._wkb_to_bytes(memoryview(data)[::-1])
+        assert reversed_view == data[::-1]
+        padded = data + b"\x00" * (-len(data) % 8)
+        assert WKBElement._wkb_to_bytes(memoryview(padded).cast("d")) == padded
+        assert WKBElement._wkb_to_bytes(memoryview(padded).cast("B", (2, len(padded) // 2))) == (
+            padded
+        )
+
+    def test_desc_memoryview(self):
+        e = WKBElement(memoryview(bytes.fromhex(self._hex_ewkb)))
+        assert e.desc == self._hex_ewkb
+
 
 class TestWKBElement:
     def test_desc(self):
@@ -540,6 +769,28 @@ class TestRasterElement:
             "raster_1": self.hex_rast_data,
         }
 
+    @pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+    def test_pickle_raw_bytes(self, protocol):
+        e = DynamicRasterElement(self.rast_data)
+        e.name = "test"
+        pickled = pickle.dumps(e, protocol=protocol)
+        if protocol >= 3:
+            # The protocol 2 stores bytes objects as latin1 strings
+            assert self.rast_data in pickled
+            assert self.hex_rast_data.encode() not in pickled
+
+        unpickled = pickle.loads(pickled)
+        assert type(unpickled) is DynamicRasterElement
+        assert unpickled == e
+        assert unpickled.data == self.hex_rast_data
+        assert unpickled.name == "test"
+
+    def test_pickle_upper_case_hex(self):
+        e = RasterElement(self.hex_rast_data.upper())
+        unpickled = pickle.loads(pickle.dumps(e))
+        assert unpickled.data == self.hex_rast_data.upper()
+        assert unpickled == e
+
     def test_hash(self):
         new_hex_rast_data = self.hex_rast_data.replace("f", "e")
         a = WKBElement(self.hex_rast_data)
@@ -558,6 +809,15 @@ class TestCompositeElement:
         e = CompositeElement(foo.c.one, "geom", String)
         assert str(e) == "(foo.one).geom"
 
+    def test_cache_key(self):
+        foo = Table("foo", MetaData(), Column("one", String))
+
+        key = CompositeElement(foo.c.one, "geom", String)._generate_cache_key()
+        assert key is not None
+        assert key == CompositeElement(foo.c.one, "geom", String)._generate_cache_key()
+        assert key != CompositeElement(foo.c.one, "path", String)._generate_cache_key()
+        assert key != CompositeElement(foo.c.one, "geom", Geometry)._generate_cache_key()
+
 
 class TestDynamicElements:
 
@@ -1174,6 +1174,45 @@ class TestReflection:
         reflection_tables_metadata.drop_all(conn, checkfirst=True)
         reflection_tables_metadata.create_all(conn)
 
+    @test_only_with_dialects("postgresql", "mysql", "mariadb", "sqlite")
+    def test_reflection_batched_queries(
+        self, conn, setup_reflection_tables, dialect_name, monkeypatch
+    ):
+        """The attributes of the spatial columns of a table are fetched in one query."""
+        dialect_module = geoalchemy2.admin.select_dialect(dialect_name)
+        fetch_name = {
+            "postgresql": "_get_spatial_columns_indexes",
+            "mysql": "_get_spatial_columns_attrs",
+            "mariadb": "_get_spatial_columns_attrs",
+            "sqlite": "_get_all_spatialite_attrs",
+            "geopackage": "_get_all_spatialite_attrs",
+        }[dialect_name]
+        calls = []
+        fetch = getattr(dialect_module, fetch_name)
+
+        def counted_fetch(*args, **kwargs):
+            calls.append(args)
+            return fetch(*args, **kwargs)
+
+        monkeypatch.setattr(dialect_module, fetch_name, counted_fetch)
+
+        metadata = MetaData()
+        metadata.reflect(conn, only=["lake"])
+        t = metadata.tables["lake"]
+        assert len(calls) == 1
+        # Only the columns of the reflected table are fetched
+        assert calls[0][-1] == "lake"
+
+        # A new inspector is used so the attributes are fetched again
+        t_single = Table("lake", MetaData(), autoload_with=conn)
+        assert len(calls) == 2
+        for col in t.columns:
+            if isinstance(col.type, Geometry):
+                single_type = t_single.c[col.name].type
+                assert col.type.geometry_type == single_type.geometry_type
+                assert col.type.srid == single_type.srid
+                assert col.type.spatial_index == single_type.spatial_index
+
     @test_only_with_dialects("postgresql", "sqlite")
     def test_reflection(self, conn, setup_reflection_tables, dialect_name):
         skip_pg12_sa1217(conn)
@@ -8,10 +8,18 @@ from sqlalchemy import Table
 from sqlalchemy import create_engine
 from sqlalchemy import text
 from sqlalchemy.event import listen
+from sqlalchemy.exc import IntegrityError
 
 from geoalchemy2 import Geometry
 from geoalchemy2 import load_spatialite_gpkg
-
+from geoalchemy2.admin.dialects.geopackage import _get_all_spatialite_attrs
+from geoalchemy2.admin.dialects.geopackage import bulk_load
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import to_shape
+
+from . import select
 from .schema_fixtures import TransformedGeometry
 
 
@@ -188,6 +196,207 @@ class TestIndex:
             == 1
         )
 
+    def test_bulk_load(self, conn, Lake, setup_tables):
+        table = Lake.__table__
+
+        def triggers():
+            query = text(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'lake'"
+            )
+            return sorted(i[0] for i in conn.execute(query))
+
+        conn.execute(table.insert(), [{"geom": "SRID=4326;LINESTRING(-1 -1,-2 -2)"}])
+        initial_triggers = triggers()
+        assert any(i.startswith("rtree_lake_geom_") for i in initial_triggers)
+        assert conn.execute(text("SELECT COUNT(*) FROM rtree_lake_geom")).scalar() == 1
+
+        with bulk_load(conn, table):
+            assert triggers() == []
+            conn.execute(
+                table.insert(),
+                [{"geom": "SRID=4326;LINESTRING({0} 0,{0} 1)".format(i)} for i in range(10)],
+            )
+            # The R*Tree is not updated during the load
+            assert conn.execute(text("SELECT COUNT(*) FROM rtree_lake_geom")).scalar() == 1
+
+        # The triggers are restored and the R*Tree contains all the rows
+        assert triggers() == initial_triggers
+        assert conn.execute(text("SELECT COUNT(*) FROM rtree_lake_geom")).scalar() == 11
+        assert conn.execute(
+            text("SELECT minx, maxx, miny, maxy FROM rtree_lake_geom WHERE id = 1")
+        ).fetchone() == (-2, -1, -2, -1)
+
+        # The triggers work again
+        conn.execute(table.insert(), [{"geom": "SRID=4326;LINESTRING(0 0,1 1)"}])
+        assert conn.execute(text("SELECT COUNT(*) FROM rtree_lake_geom")).scalar() == 12
+
+    def test_bulk_load_trigger_name_case(self):
+        """The triggers are matched case-insensitively, like the table names."""
+        engine = create_engine("sqlite://")
+        table = Table("Lake", MetaData(), Column("id", Integer), Column("Geom", Geometry()))
+        triggers_query = text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+
+        with engine.begin() as conn:
+            conn.execute(text('CREATE TABLE "Lake" (id INTEGER, "Geom" BLOB)'))
+            conn.execute(
+                text(
+                    "CREATE TABLE gpkg_extensions "
+                    "(table_name TEXT, column_name TEXT, extension_name TEXT)"
+                )
+            )
+            for name in ["fgti_lake_geom", "RTREE_Lake_Geom_insert", "other_trigger"]:
+                conn.execute(
+                    text(
+                        'CREATE TRIGGER "{}" AFTER INSERT ON lake BEGIN SELECT 1; END'.format(name)
+                    )
+                )
+            initial_triggers = sorted(i[0] for i in conn.execute(triggers_query))
+
+            with bulk_load(conn, table):
+                assert [i[0] for i in conn.execute(triggers_query)] == ["other_trigger"]
+
+            assert sorted(i[0] for i in conn.execute(triggers_query)) == initial_triggers
+
+    def test_bulk_load_failure(self):
+        """The triggers are left untouched when the load fails."""
+        engine = create_engine("sqlite://")
+        table = Table("lake", MetaData(), Column("id", Integer), Column("geom", Geometry()))
+        triggers_query = text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE lake (id INTEGER PRIMARY KEY, geom BLOB)"))
+            conn.execute(
+                text(
+                    "CREATE TABLE gpkg_extensions "
+                    "(table_name TEXT, column_name TEXT, extension_name TEXT)"
+                )
+            )
+            for name in ["fgti_lake_geom", "rtree_lake_geom_insert"]:
+                conn.execute(
+                    text(
+                        'CREATE TRIGGER "{}" AFTER INSERT ON lake BEGIN SELECT 1; END'.format(name)
+                    )
+                )
+            conn.execute(text("INSERT INTO lake (id) VALUES (1)"))
+            initial_triggers = sorted(i[0] for i in conn.execute(triggers_query))
+
+        with pytest.raises(IntegrityError):
+            with engine.begin() as conn:
+                with bulk_load(conn, table):
+                    conn.execute(text("INSERT INTO lake (id) VALUES (2)"))
+                    conn.execute(text("INSERT INTO lake (id) VALUES (1)"))
+
+        with engine.connect() as conn:
+            assert sorted(i[0] for i in conn.execute(triggers_query)) == initial_triggers
+            assert conn.execute(text("SELECT id FROM lake")).fetchall() == [(1,)]
+
+
+class TestNativeBinary:
+    @pytest.fixture
+    def NativeLake(self, base):
+        class NativeLake(base):
+            __tablename__ = "native_lake"
+            id = Column(Integer, primary_key=True)
+            geom = Column(Geometry("LINESTRING", srid=4326, native_binary=True))
+
+        return NativeLake
+
+    def test_insert_select(self, conn, NativeLake, setup_tables):
+        table = NativeLake.__table__
+        element = from_shape(to_shape(WKTElement("LINESTRING(0 0,1 1)")), srid=4326)
+        conn.execute(
+            table.insert(),
+            [{"id": 1, "geom": element}, {"id": 2, "geom": "SRID=4326;LINESTRING(2 2,3 3)"}],
+        )
+
+        # The WKBElement values are stored as valid GeoPackage binary values
+        assert conn.execute(
+            text("SELECT IsValidGPB(geom), ST_AsText(geom) FROM native_lake WHERE id = 1")
+        ).fetchone() == (1, "LINESTRING(0 0, 1 1)")
+        assert conn.execute(
+            text("SELECT minx, maxx, miny, maxy FROM rtree_native_lake_geom WHERE id = 1")
+        ).fetchone() == (0, 1, 0, 1)
+
+        # Both the GeoPackage binary values and the SpatiaLite BLOBs are decoded
+        rows = conn.execute(select([table.c.id, table.c.geom]).order_by(table.c.id)).fetchall()
+        assert [i[1].srid for i in rows] == [4326, 4326]
+        assert [to_shape(i[1]).wkt for i in rows] == [
+            "LINESTRING (0 0, 1 1)",
+            "LINESTRING (2 2, 3 3)",
+        ]
+
+    def test_select_without_spatialite(self, tmpdir, _engine_echo, check_spatialite):
+        tmp_db = tmpdir / "test_native_binary.gpkg"
+        table = Table(
+            "native_lake",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry("LINESTRING", srid=4326, native_binary=True)),
+        )
+        element = from_shape(to_shape(WKTElement("LINESTRING(0 0,1 1)")), srid=4326)
+
+        engine = create_engine(f"gpkg:///{tmp_db}", echo=_engine_echo)
+        listen(engine, "connect", load_spatialite_gpkg)
+        with engine.begin() as conn:
+            table.create(conn)
+            conn.execute(table.insert(), [{"id": 1, "geom": element}])
+        engine.dispose()
+
+        # The SpatiaLite extension is not needed to read the geometries
+        engine = create_engine(f"gpkg:///{tmp_db}", echo=_engine_echo)
+        with engine.connect() as conn:
+            geom = conn.execute(select([table.c.geom])).scalar()
+        engine.dispose()
+        assert isinstance(geom, WKBElement)
+        assert geom.srid == 4326
+        assert to_shape(geom).wkt == "LINESTRING (0 0, 1 1)"
+
+
+class TestReflection:
+    def test_get_all_spatialite_attrs(self):
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE Lake (id INTEGER, Geom GEOMETRY)"))
+            conn.execute(text("CREATE TABLE river (id INTEGER, geom GEOMETRY)"))
+            conn.execute(
+                text(
+                    """CREATE TABLE gpkg_geometry_columns (
+                        table_name TEXT,
+                        column_name TEXT,
+                        geometry_type_name TEXT,
+                        srs_id INTEGER,
+                        z INTEGER,
+                        m INTEGER
+                    )"""
+                )
+            )
+            conn.execute(
+                text(
+                    """CREATE TABLE gpkg_extensions (
+                        table_name TEXT, column_name TEXT, extension_name TEXT
+                    )"""
+                )
+            )
+            conn.execute(
+                text(
+                    """INSERT INTO gpkg_geometry_columns VALUES
+                        ('lake', 'Geom', 'LINESTRING', 4326, 0, 0),
+                        ('river', 'geom', 'POINT', 2154, 1, 1)"""
+                )
+            )
+            conn.execute(
+                text("INSERT INTO gpkg_extensions VALUES ('lake', 'Geom', 'gpkg_rtree_index')")
+            )
+
+            # The keys are the names returned by the reflection
+            assert _get_all_spatialite_attrs(conn) == {
+                ("Lake", "Geom"): ("LINESTRING", "XY", 4326, 1),
+                ("river", "geom"): ("POINT", "XYZM", 2154, 0),
+            }
+            assert _get_all_spatialite_attrs(conn, "LAKE") == {
+                ("Lake", "Geom"): ("LINESTRING", "XY", 4326, 1),
+            }
+
 
 class TestMiscellaneous:
     def test_load_spatialite_gpkg(self, tmpdir, _engine_echo, check_spatialite):
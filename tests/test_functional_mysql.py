@@ -3,6 +3,8 @@ from json import loads
 import pytest
 from packaging.version import parse as parse_version
 from shapely.geometry import LineString
+from sqlalchemy import Column
+from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import Table
 from sqlalchemy import __version__ as SA_VERSION
@@ -99,6 +101,34 @@ class TestInsertionCore:
             [{"geom": row[1]} for row in rows],
         )
 
+    @pytest.mark.parametrize("native_binary", [None, True])
+    def test_insert_native_binary(self, conn, metadata, native_binary):
+        table = Table(
+            "native_binary",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry("LINESTRING", srid=4326, native_binary=native_binary)),
+        )
+        metadata.drop_all(conn, checkfirst=True)
+        metadata.create_all(conn)
+
+        # The WKBElement values are bound as WKB, so the coordinates are not rounded
+        line = LineString([[0.1, 0.2], [1 / 3, 2 / 3], [-1 / 7, 2 / 7]])
+        conn.execute(
+            table.insert(),
+            [
+                {"id": 1, "geom": from_shape(line, srid=4326)},
+                {"id": 2, "geom": "LINESTRING(0 0,1 1)"},
+                {"id": 3, "geom": WKTElement("LINESTRING(0 0,1 1)", srid=4326)},
+            ],
+        )
+
+        geoms = conn.execute(select(table.c.geom).order_by(table.c.id)).scalars().all()
+        assert to_shape(geoms[0]).equals_exact(line, 0)
+        assert to_shape(geoms[1]).equals(LineString([[0, 0], [1, 1]]))
+        assert to_shape(geoms[2]).equals(LineString([[0, 0], [1, 1]]))
+        assert conn.execute(select(func.ST_SRID(table.c.geom))).scalars().all() == [4326] * 3
+
 
 class TestInsertionORM:
     def test_WKT(self, session, Lake, setup_tables):
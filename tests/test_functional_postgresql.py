@@ -1,5 +1,10 @@
+import asyncio
+import enum
 import re
+import sqlite3
+import struct
 from json import loads
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,11 +17,15 @@ else:
     del compat
 
 from packaging.version import parse as parse_version
+from shapely.geometry import LineString
 from shapely.geometry import Point
 from sqlalchemy import Column
+from sqlalchemy import Enum
+from sqlalchemy import Float
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import String
+from sqlalchemy import Table
 from sqlalchemy import __version__ as SA_VERSION
 from sqlalchemy import bindparam
 from sqlalchemy import text
@@ -29,16 +38,25 @@ from sqlalchemy.sql.expression import type_coerce
 from geoalchemy2 import Geography
 from geoalchemy2 import Geometry
 from geoalchemy2 import Raster
+from geoalchemy2.admin.dialects.postgresql import _copy_binary_chunks
+from geoalchemy2.admin.dialects.postgresql import _encode_native_binary
+from geoalchemy2.admin.dialects.postgresql import bulk_copy
+from geoalchemy2.admin.dialects.postgresql import register_asyncpg_codecs
 from geoalchemy2.elements import RasterElement
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
 from geoalchemy2.exc import ArgumentError
+from geoalchemy2.geojson import _geojson_features_select
+from geoalchemy2.geojson import iter_geojson_feature_collection
 from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import to_shape
 
+from . import check_async_engine
 from . import select
 from . import skip_pg12_sa1217
 from . import skip_postgis1
 from . import skip_postgis2
+from . import skip_sqla_lt_2
 
 SQLA_LT_2 = parse_version(SA_VERSION) <= parse_version("1.4")
 if SQLA_LT_2:
@@ -658,6 +676,71 @@ class TestSTAsGeoJson:
         )
 
 
+class TestGeoJSONFeatureCollection:
+    @pytest.fixture
+    def lake_table(self):
+        return Table(
+            "lake",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("name", String),
+            Column("geom", Geometry(geometry_type="LINESTRING", srid=4326)),
+        )
+
+    def test_features_select(self, lake_table):
+        stmt = _geojson_features_select(select([lake_table]).where(lake_table.c.id > 1))
+        assert str(stmt.compile(dialect=PGDialect_psycopg2())) == (
+            "SELECT ST_AsGeoJSON(anon_1, %(ST_AsGeoJSON_2)s, %(ST_AsGeoJSON_3)s) "
+            'AS "ST_AsGeoJSON_1" \n'
+            "FROM (SELECT lake.id AS id, lake.name AS name, lake.geom AS geom \n"
+            "FROM lake \n"
+            "WHERE lake.id > %(id_1)s) AS anon_1"
+        )
+        assert stmt.compile().params["ST_AsGeoJSON_2"] == "geom"
+
+    def test_features_select_no_spatial_column(self, lake_table):
+        with pytest.raises(ArgumentError, match="The statement does not select any spatial column"):
+            _geojson_features_select(select([lake_table.c.id]))
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 1000])
+    def test_iter_geojson_feature_collection(self, conn, Lake, setup_tables, batch_size):
+        skip_postgis1(conn)
+        skip_postgis2(conn)
+        conn.execute(
+            Lake.__table__.insert(),
+            [
+                {"id": 1, "geom": "SRID=4326;LINESTRING(0 0,1 1)"},
+                {"id": 2, "geom": "SRID=4326;LINESTRING(1 1,2 2)"},
+                {"id": 3, "geom": None},
+            ],
+        )
+        stmt = select([Lake.__table__]).order_by(Lake.__table__.c.id)
+        chunks = list(iter_geojson_feature_collection(conn, stmt, batch_size=batch_size))
+        assert len(chunks) == 2 + -(-3 // batch_size)
+        assert loads("".join(chunks)) == {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+                    "properties": {"id": 1},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": [[1, 1], [2, 2]]},
+                    "properties": {"id": 2},
+                },
+                {"type": "Feature", "geometry": None, "properties": {"id": 3}},
+            ],
+        }
+
+    def test_iter_geojson_feature_collection_empty(self, conn, Lake, setup_tables):
+        skip_postgis1(conn)
+        skip_postgis2(conn)
+        chunks = iter_geojson_feature_collection(conn, select([Lake.__table__]))
+        assert loads("".join(chunks)) == {"type": "FeatureCollection", "features": []}
+
+
 class TestSTSummaryStatsAgg:
     def test_st_summary_stats_agg(self, session, Ocean, setup_tables):
         # Create a new raster
@@ -705,3 +788,229 @@ class TestSTSummaryStatsAgg:
 
         # Check the result
         assert res == [(15, 15.0, 0.0, 1.0, 1.0)]
+
+
+class TestBulkCopy:
+    @pytest.fixture
+    def copy_table(self):
+        return Table(
+            "copy_table",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("name", String),
+            Column("geom", Geometry(geometry_type="POINT", srid=4326)),
+        )
+
+    @staticmethod
+    def _parse_copy_data(data):
+        assert data[:11] == b"PGCOPY\n\xff\r\n\x00"
+        assert data[-2:] == b"\xff\xff"
+        data = data[19:-2]
+        rows = []
+        while data:
+            (field_count,) = struct.unpack("!h", data[:2])
+            data = data[2:]
+            row = []
+            for _ in range(field_count):
+                (length,) = struct.unpack("!i", data[:4])
+                data = data[4:]
+                if length == -1:
+                    row.append(None)
+                else:
+                    row.append(data[:length])
+                    data = data[length:]
+            rows.append(row)
+        return rows
+
+    def test_copy_binary_chunks(self, copy_table):
+        ewkb = "0101000020e6100000000000000000f03f0000000000000040"
+        wkb = "0101000000000000000000f03f0000000000000040"
+        rows = [
+            (1, "a", WKBElement(ewkb, extended=True)),
+            (2, None, WKBElement(wkb, srid=4326)),
+            (3, "c", WKBElement(bytes.fromhex(wkb))),
+            (4, "d", WKTElement("SRID=4326;POINT(1 2)", extended=True)),
+            (5, "é", "POINT(1 2)"),
+            (6, "f", Point(1, 2)),
+            (7, "g", None),
+        ]
+        chunks = list(
+            _copy_binary_chunks(
+                list(copy_table.columns), rows, PGDialect_psycopg2(), chunk_size=100
+            )
+        )
+        assert len(chunks) > 1
+
+        parsed = self._parse_copy_data(b"".join(chunks))
+        assert [struct.unpack("!i", row[0])[0] for row in parsed] == list(range(1, 8))
+        assert [row[1] for row in parsed] == [b"a", None, b"c", b"d", "é".encode(), b"f", b"g"]
+        assert [row[2] for row in parsed] == [bytes.fromhex(ewkb)] * 6 + [None]
+
+    def test_copy_binary_chunks_float_enum(self):
+        class Color(enum.Enum):
+            red = 1
+            green = 2
+
+        table = Table(
+            "copy_float_table",
+            MetaData(),
+            Column("real_value", Float(precision=24)),
+            Column("double_value", Float(precision=53)),
+            Column("default_value", Float),
+            Column("color", Enum(Color)),
+            Column("label", Enum("a", "b", name="label")),
+        )
+        rows = [(1.5, 2.5, 3.5, Color.green, "b"), (None, None, None, "red", None)]
+        parsed = self._parse_copy_data(
+            b"".join(_copy_binary_chunks(list(table.columns), rows, PGDialect_psycopg2()))
+        )
+        assert parsed[0] == [
+            struct.pack("!f", 1.5),
+            struct.pack("!d", 2.5),
+            struct.pack("!d", 3.5),
+            b"green",
+            b"b",
+        ]
+        assert parsed[1] == [None, None, None, b"red", None]
+
+    def test_copy_binary_chunks_wrong_srid(self, copy_table):
+        rows = [(1, "a", WKTElement("POINT(1 2)", srid=2154))]
+        with pytest.raises(ArgumentError, match=r"The SRID \(2154\) of the value does not match"):
+            list(_copy_binary_chunks(list(copy_table.columns), rows, PGDialect_psycopg2()))
+
+    def test_copy_binary_chunks_wrong_geometry_type(self, copy_table):
+        rows = [(1, "a", "LINESTRING(1 2, 3 4)")]
+        with pytest.raises(
+            ArgumentError, match=r"The geometry type \(LINESTRING\) of the value does not match"
+        ):
+            list(_copy_binary_chunks(list(copy_table.columns), rows, PGDialect_psycopg2()))
+
+    def test_copy_binary_chunks_wrong_row_length(self, copy_table):
+        with pytest.raises(ArgumentError, match="Each row must contain 3 values but got 2"):
+            list(
+                _copy_binary_chunks(list(copy_table.columns), [(1, "a")], PGDialect_psycopg2())
+            )
+
+    def test_copy_binary_chunks_unsupported_type(self):
+        table = Table("raster_table", MetaData(), Column("rast", Raster))
+        with pytest.raises(ArgumentError, match="The type of the column 'rast'"):
+            list(_copy_binary_chunks(list(table.columns), [(None,)], PGDialect_psycopg2()))
+
+    def test_bulk_copy_wrong_driver(self, copy_table):
+        connection = SimpleNamespace(dialect=SimpleNamespace(driver="asyncpg"))
+        with pytest.raises(ArgumentError, match="not supported with the 'asyncpg' driver"):
+            bulk_copy(connection, copy_table, [])
+
+    def test_bulk_copy(self, conn, Poi, setup_tables):
+        rows = [
+            (1, from_shape(Point(1, 2))),
+            (2, WKTElement("SRID=4326;POINT(3 4)", extended=True)),
+            (3, None),
+        ]
+        bulk_copy(conn, Poi.__table__, rows, columns=["id", "geom"])
+
+        results = conn.execute(
+            select([Poi.__table__.c.id, Poi.__table__.c.geom]).order_by(Poi.__table__.c.id)
+        ).fetchall()
+        assert [row[0] for row in results] == [1, 2, 3]
+        assert results[0][1].srid == 4326
+        assert to_shape(results[0][1]).equals(Point(1, 2))
+        assert to_shape(results[1][1]).equals(Point(3, 4))
+        assert results[2][1] is None
+
+
+@skip_sqla_lt_2()
+class TestAsyncio:
+    @pytest.fixture
+    def async_engine(self, engine):
+        pytest.importorskip("asyncpg")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        return create_async_engine(
+            engine.url.set(drivername="postgresql+asyncpg"), plugins=["geoalchemy2"]
+        )
+
+    @pytest.fixture
+    def async_engine_binary_codecs(self, engine):
+        pytest.importorskip("asyncpg")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        return create_async_engine(
+            engine.url.set(drivername="postgresql+asyncpg").update_query_dict(
+                {"geoalchemy2_connect_postgresql_binary_codecs": "true"}
+            ),
+            plugins=["geoalchemy2"],
+        )
+
+    def test_async_engine(self, async_engine, schema):
+        rows, reflected = check_async_engine(async_engine, schema=schema)
+
+        assert [row[0].srid for row in rows] == [4326, 4326]
+        assert isinstance(rows[0][0], WKBElement)
+        assert to_shape(rows[0][0]).equals(LineString([(0, 0), (1, 1)]))
+        assert [round(row[1], 6) for row in rows] == [round(2**0.5, 6), 5]
+
+        assert isinstance(reflected.c.geom.type, Geometry)
+        assert reflected.c.geom.type.geometry_type == "LINESTRING"
+        assert reflected.c.geom.type.srid == 4326
+
+    @pytest.mark.parametrize("binary_codecs", [True, False])
+    def test_native_binary(self, async_engine, async_engine_binary_codecs, schema, binary_codecs):
+        engine = async_engine_binary_codecs if binary_codecs else async_engine
+        metadata = MetaData()
+        table = Table(
+            "native_binary",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry("POINT", 4326, native_binary=True)),
+            Column("geog", Geography("POINT", 4326, native_binary=True)),
+            schema=schema,
+        )
+
+        async def run():
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(metadata.drop_all, checkfirst=True)
+                    await conn.run_sync(metadata.create_all)
+                    await conn.execute(
+                        table.insert(),
+                        [
+                            {
+                                "id": 1,
+                                "geom": "SRID=4326;POINT(1 2)",
+                                "geog": from_shape(Point(3, 4), srid=4326),
+                            },
+                            {"id": 2, "geom": None, "geog": None},
+                        ],
+                    )
+                    result = await conn.execute(
+                        select([table.c.geom, table.c.geog]).order_by(table.c.id)
+                    )
+                    rows = result.all()
+                    await conn.run_sync(metadata.drop_all)
+                return rows
+            finally:
+                await engine.dispose()
+
+        rows = asyncio.run(run())
+
+        geom, geog = rows[0]
+        # The values are transferred as binary values only when the codecs are registered
+        assert isinstance(geom.data, str if not binary_codecs else bytes)
+        assert geom.srid == 4326
+        assert geom.extended is True
+        assert to_shape(geom).equals(Point(1, 2))
+        assert geog.srid == 4326
+        assert geog.extended is True
+        assert to_shape(geog).equals(Point(3, 4))
+        assert rows[1] == (None, None)
+
+    def test_register_asyncpg_codecs_wrong_driver(self):
+        with pytest.raises(ArgumentError, match="only be registered with asyncpg"):
+            register_asyncpg_codecs(sqlite3.connect(":memory:"))
+
+    def test_encode_native_binary(self):
+        ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+        assert _encode_native_binary(ewkb) == ewkb
+        assert _encode_native_binary(memoryview(ewkb)) == ewkb
+        assert _encode_native_binary(ewkb.hex()) == ewkb
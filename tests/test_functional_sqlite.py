@@ -1,4 +1,7 @@
+import os
 import re
+import sqlite3
+from functools import partial
 
 import pytest
 from shapely.geometry import GeometryCollection
@@ -11,23 +14,29 @@ from sqlalchemy import MetaData
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import create_engine
+from sqlalchemy import inspect
 from sqlalchemy import text
+from sqlalchemy.event import listen
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.sql import func
 
 from geoalchemy2 import Geometry
 from geoalchemy2 import load_spatialite
+from geoalchemy2.admin.dialects import sqlite as sqlite_dialect
+from geoalchemy2.admin.dialects.common import _get_cached_spatial_column
 from geoalchemy2.admin.dialects.geopackage import create_spatial_ref_sys_view
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
 from geoalchemy2.shape import from_shape
 from geoalchemy2.shape import to_shape
 
+from . import check_async_engine
 from . import format_wkt
 from . import select
 from . import skip_case_insensitivity
 from . import skip_pypy
+from . import skip_sqla_lt_2
 from . import test_only_with_dialects
 from .schema_fixtures import TransformedGeometry
 
@@ -208,6 +217,78 @@ class TestIndex:
         assert indexes_after_drop == []
         assert [table for table in tables_after_drop if "table_with_indexes" in table.name] == []
 
+    @test_only_with_dialects("sqlite-spatialite3", "sqlite-spatialite4")
+    def test_bulk_load(self, conn, Lake, setup_tables):
+        table = Lake.__table__
+
+        def spatial_index_enabled():
+            return conn.execute(
+                text(
+                    """SELECT spatial_index_enabled FROM geometry_columns
+                    WHERE f_table_name = 'lake' AND f_geometry_column = 'geom'"""
+                )
+            ).scalar()
+
+        assert spatial_index_enabled() == 1
+
+        with sqlite_dialect.bulk_load(conn, table):
+            # The index is disabled but the column is still registered
+            assert spatial_index_enabled() == 0
+            assert not self.check_spatial_idx(conn, "idx_lake_geom")
+            conn.execute(
+                table.insert(),
+                [{"geom": "SRID=4326;LINESTRING({0} 0,{0} 1)".format(i)} for i in range(10)],
+            )
+
+        # The index is rebuilt with all the rows
+        assert spatial_index_enabled() == 1
+        assert self.check_spatial_idx(conn, "idx_lake_geom")
+        assert conn.execute(text("SELECT COUNT(*) FROM idx_lake_geom")).scalar() == 10
+        assert conn.execute(text("SELECT CheckSpatialIndex('lake', 'geom')")).scalar() == 1
+
+    @test_only_with_dialects("sqlite-spatialite3", "sqlite-spatialite4")
+    def test_bulk_load_failure(self, conn, Lake, setup_tables):
+        """The spatial index is left untouched when the load fails."""
+        table = Lake.__table__
+        conn.execute(table.insert(), [{"id": 1, "geom": "SRID=4326;LINESTRING(0 0,1 1)"}])
+
+        with pytest.raises(IntegrityError):
+            with sqlite_dialect.bulk_load(conn, table):
+                conn.execute(
+                    table.insert(),
+                    [
+                        {"id": 2, "geom": "SRID=4326;LINESTRING(2 2,3 3)"},
+                        {"id": 1, "geom": "SRID=4326;LINESTRING(4 4,5 5)"},
+                    ],
+                )
+
+        assert (
+            conn.execute(
+                text(
+                    """SELECT spatial_index_enabled FROM geometry_columns
+                    WHERE f_table_name = 'lake' AND f_geometry_column = 'geom'"""
+                )
+            ).scalar()
+            == 1
+        )
+        assert self.check_spatial_idx(conn, "idx_lake_geom")
+        assert conn.execute(text("SELECT COUNT(*) FROM lake")).scalar() == 1
+        assert conn.execute(text("SELECT COUNT(*) FROM idx_lake_geom")).scalar() == 1
+        assert conn.execute(text("SELECT CheckSpatialIndex('lake', 'geom')")).scalar() == 1
+
+    @test_only_with_dialects("sqlite-spatialite3", "sqlite-spatialite4")
+    def test_bulk_load_no_index(self, conn, TableWithIndexes, setup_tables):
+        table = TableWithIndexes.__table__
+
+        with sqlite_dialect.bulk_load(
+            conn, table, columns=["geom_not_managed_no_index", "geom_managed_index"]
+        ):
+            assert not self.check_spatial_idx(conn, "idx_table_with_indexes_geom_managed_index")
+            assert self.check_spatial_idx(conn, "idx_table_with_indexes_geom_not_managed_index")
+
+        assert self.check_spatial_idx(conn, "idx_table_with_indexes_geom_managed_index")
+        assert not self.check_spatial_idx(conn, "idx_table_with_indexes_geom_not_managed_no_index")
+
 
 class TestMiscellaneous:
     @test_only_with_dialects("sqlite-spatialite3", "sqlite-spatialite4")
@@ -312,6 +393,170 @@ class TestMiscellaneous:
         with pytest.raises(RuntimeError):
             load_spatialite(conn.connection.dbapi_connection)
 
+    def test_load_spatialite_driver_already_loaded(self, monkeypatch):
+        monkeypatch.setenv("SPATIALITE_LIBRARY_PATH", "/nonexistent/mod_spatialite")
+
+        class RecordingConnection(sqlite3.Connection):
+            """A real sqlite3 connection recording the loaded extensions."""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.loaded = []
+
+            def enable_load_extension(self, enabled):
+                pass
+
+            def load_extension(self, path, *args, **kwargs):
+                self.loaded.append(path)
+
+        engine = create_engine("sqlite://", connect_args={"factory": RecordingConnection})
+        # Several listeners load the extension in the same connections
+        listen(engine, "connect", sqlite_dialect.load_spatialite_driver)
+        listen(engine, "connect", sqlite_dialect.load_spatialite_driver)
+
+        with engine.connect() as conn:
+            dbapi_conn = conn.connection.dbapi_connection
+            assert isinstance(dbapi_conn, sqlite3.Connection)
+            assert dbapi_conn.loaded == ["/nonexistent/mod_spatialite"]
+        engine.dispose()
+
+        # The extension is loaded in the new connections
+        with engine.connect() as conn:
+            other_conn = conn.connection.dbapi_connection
+            assert other_conn is not dbapi_conn
+            assert other_conn.loaded == ["/nonexistent/mod_spatialite"]
+        engine.dispose()
+
+        # Without connection record, the extension is always loaded
+        sqlite_dialect.load_spatialite_driver(dbapi_conn)
+        assert dbapi_conn.loaded == ["/nonexistent/mod_spatialite"] * 2
+
+
+class TestInitCache:
+    @pytest.fixture
+    def init_calls(self, monkeypatch):
+        """Replace the SpatiaLite functions by Python functions that record the calls."""
+        calls = []
+
+        def fake_load_spatialite_driver(dbapi_conn, *args):
+            def check_spatial_metadata():
+                calls.append(("CheckSpatialMetaData",))
+                return dbapi_conn.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE name = 'spatial_ref_sys'"
+                ).fetchone()[0]
+
+            def init_spatial_metadata(*args):
+                calls.append(("InitSpatialMetaData",) + args)
+                dbapi_conn.execute("CREATE TABLE spatial_ref_sys (srid INTEGER)")
+                dbapi_conn.execute("INSERT INTO spatial_ref_sys VALUES (4326)")
+                return 1
+
+            dbapi_conn.create_function("CheckSpatialMetaData", 0, check_spatial_metadata)
+            dbapi_conn.create_function("InitSpatialMetaData", -1, init_spatial_metadata)
+
+        monkeypatch.setattr(sqlite_dialect, "load_spatialite_driver", fake_load_spatialite_driver)
+        sqlite_dialect.clear_spatialite_init_cache()
+        yield calls
+        sqlite_dialect.clear_spatialite_init_cache()
+
+    @staticmethod
+    def connect(init_calls, database=":memory:", **kwargs):
+        dbapi_conn = sqlite3.connect(database, isolation_level=None)
+        sqlite_dialect.load_spatialite_driver(dbapi_conn)
+        sqlite_dialect.init_spatialite(dbapi_conn, cache=True, **kwargs)
+        return dbapi_conn
+
+    @staticmethod
+    def srids(dbapi_conn):
+        return dbapi_conn.execute("SELECT srid FROM spatial_ref_sys").fetchall()
+
+    def test_memory_template(self, init_calls):
+        conn_1 = self.connect(init_calls, init_mode="WGS84")
+        conn_2 = self.connect(init_calls, init_mode="WGS84")
+
+        assert [i for i in init_calls if i[0] == "InitSpatialMetaData"] == [
+            ("InitSpatialMetaData", 0, "WGS84")
+        ]
+        assert self.srids(conn_1) == self.srids(conn_2) == [(4326,)]
+
+        # The databases are independent copies of the template
+        conn_1.execute("DELETE FROM spatial_ref_sys")
+        assert self.srids(conn_1) == []
+        assert self.srids(conn_2) == [(4326,)]
+
+        # Another template is used for another init mode
+        self.connect(init_calls, init_mode="EMPTY")
+        assert [i for i in init_calls if i[0] == "InitSpatialMetaData"] == [
+            ("InitSpatialMetaData", 0, "WGS84"),
+            ("InitSpatialMetaData", 0, "EMPTY"),
+        ]
+
+    def test_memory_not_empty(self, init_calls, monkeypatch):
+        dbapi_conn = sqlite3.connect(":memory:")
+        dbapi_conn.execute("CREATE TABLE lake (id INTEGER)")
+        sqlite_dialect.load_spatialite_driver(dbapi_conn)
+        sqlite_dialect.init_spatialite(dbapi_conn, cache=True)
+
+        # The existing tables are not overwritten by the template
+        assert dbapi_conn.execute("SELECT * FROM lake").fetchall() == []
+        assert self.srids(dbapi_conn) == [(4326,)]
+        assert not sqlite_dialect._MEMORY_TEMPLATES
+
+    def test_file_cache(self, init_calls, tmpdir):
+        db_file = str(tmpdir / "test_init_cache.sqlite")
+        conn_1 = self.connect(init_calls, db_file)
+        assert init_calls == [("CheckSpatialMetaData",), ("InitSpatialMetaData", 0)]
+        conn_1.close()
+
+        # The file is not checked again
+        conn_2 = self.connect(init_calls, db_file)
+        assert len(init_calls) == 2
+        assert self.srids(conn_2) == [(4326,)]
+        conn_2.close()
+
+        # The cache is cleared
+        sqlite_dialect.clear_spatialite_init_cache()
+        self.connect(init_calls, db_file).close()
+        assert init_calls[2:] == [("CheckSpatialMetaData",)]
+
+    def test_file_cache_recreated_file(self, init_calls, tmpdir):
+        db_file = str(tmpdir / "test_init_cache.sqlite")
+        self.connect(init_calls, db_file).close()
+        assert init_calls == [("CheckSpatialMetaData",), ("InitSpatialMetaData", 0)]
+
+        # The new file can reuse the inode of the deleted one but it is initialized again
+        os.remove(db_file)
+        conn = self.connect(init_calls, db_file)
+        assert init_calls[2:] == [("CheckSpatialMetaData",), ("InitSpatialMetaData", 0)]
+        assert self.srids(conn) == [(4326,)]
+        conn.close()
+
+    def test_file_cache_modified_file(self, init_calls, tmpdir):
+        db_file = str(tmpdir / "test_init_cache.sqlite")
+        self.connect(init_calls, db_file).close()
+
+        # The file was modified by another connection so it is checked again, but only once
+        other_conn = sqlite3.connect(db_file, isolation_level=None)
+        other_conn.execute("CREATE TABLE lake (id INTEGER)")
+        other_conn.close()
+        self.connect(init_calls, db_file).close()
+        self.connect(init_calls, db_file).close()
+        assert init_calls[2:] == [("CheckSpatialMetaData",)]
+
+    def test_load_spatialite(self, check_spatialite):
+        engine = create_engine("sqlite://")
+        listen(engine, "connect", partial(load_spatialite, init_mode="WGS84", cache=True))
+
+        try:
+            for _ in range(2):
+                with engine.connect() as conn:
+                    nb_srid = conn.execute(text("SELECT COUNT(*) FROM spatial_ref_sys;")).scalar()
+                    assert nb_srid in [129, 131]
+                    assert conn.execute(text("SELECT CheckSpatialMetaData();")).scalar() == 3
+                engine.dispose()
+        finally:
+            sqlite_dialect.clear_spatialite_init_cache()
+
 
 class TestInsertionCore:
     @pytest.fixture
@@ -357,6 +602,44 @@ class TestInsertionCore:
                 extended=extended,
             )
 
+    @pytest.mark.parametrize(
+        "wkt",
+        [
+            "POINT(1 2)",
+            "LINESTRING(0 0,1 1,2 0)",
+            "POLYGON((0 0,1 0,1 1,0 0))",
+            "MULTIPOINT(0 0,1 1)",
+            "GEOMETRYCOLLECTION(POINT(-1 1),LINESTRING(2 2,3 3))",
+        ],
+    )
+    def test_insert_native_binary(self, conn, metadata, dialect_name, wkt):
+        table = Table(
+            "native_binary",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("geom", Geometry(srid=4326, native_binary=True)),
+        )
+        metadata.drop_all(conn, checkfirst=True)
+        metadata.create_all(conn)
+        element = from_shape(to_shape(WKTElement(wkt)), srid=4326)
+        conn.execute(
+            table.insert(),
+            [{"id": 1, "geom": element}, {"id": 2, "geom": "SRID=4326;" + wkt}],
+        )
+
+        rows = conn.execute(select([table.c.id, table.c.geom]).order_by(table.c.id)).fetchall()
+        for _, geom in rows:
+            assert isinstance(geom, WKBElement)
+            assert geom.srid == 4326
+            assert format_wkt(conn.execute(geom.ST_AsText()).scalar()) == wkt
+            assert conn.execute(geom.ST_SRID()).scalar() == 4326
+            assert to_shape(geom).equals(to_shape(element))
+
+        if dialect_name != "geopackage":
+            # The BLOB encoded on the client side is the same as the one built by SpatiaLite
+            blobs = conn.execute(select([func.hex(table.c.geom)]).order_by(table.c.id)).scalars()
+            assert len(set(blobs)) == 1
+
 
 class TestInsertionORM:
     @pytest.fixture
@@ -968,3 +1251,91 @@ class TestReflection:
             "lake_z",
             "lake_zm",
         ]
+
+    @pytest.fixture
+    def fake_metadata_conn(self):
+        """A plain SQLite connection with a fake SpatiaLite metadata table."""
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE Lake (id INTEGER, Geom GEOMETRY)"))
+            conn.execute(text("CREATE TABLE river (id INTEGER, geom GEOMETRY)"))
+            conn.execute(
+                text(
+                    """CREATE TABLE geometry_columns (
+                        f_table_name TEXT,
+                        f_geometry_column TEXT,
+                        geometry_type INTEGER,
+                        coord_dimension INTEGER,
+                        srid INTEGER,
+                        spatial_index_enabled INTEGER
+                    )"""
+                )
+            )
+            conn.execute(
+                text(
+                    """INSERT INTO geometry_columns VALUES
+                        ('lake', 'geom', 2, 2, 4326, 1),
+                        ('river', 'geom', 2, 2, 2154, 0)"""
+                )
+            )
+            yield conn
+
+    def test_get_all_spatialite_attrs(self, fake_metadata_conn):
+        # The keys are the names returned by the reflection
+        assert sqlite_dialect._get_all_spatialite_attrs(fake_metadata_conn) == {
+            ("Lake", "Geom"): (2, 2, 4326, 1),
+            ("river", "geom"): (2, 2, 2154, 0),
+        }
+        assert sqlite_dialect._get_all_spatialite_attrs(fake_metadata_conn, "LAKE") == {
+            ("Lake", "Geom"): (2, 2, 4326, 1),
+        }
+
+    def test_get_cached_spatial_column(self, fake_metadata_conn):
+        calls = []
+
+        def fetch(table_name):
+            calls.append(table_name)
+            return sqlite_dialect._get_all_spatialite_attrs(fake_metadata_conn, table_name)
+
+        inspector = inspect(fake_metadata_conn)
+        get_column = partial(_get_cached_spatial_column, inspector, None, fetch=fetch)
+
+        # Only the columns of the table are fetched when a single table is reflected
+        assert get_column("Lake", "Geom") == (2, 2, 4326, 1)
+        assert get_column("Lake", "id") is None
+        assert calls == ["Lake"]
+
+        # All the columns are fetched at once when another table is reflected
+        assert get_column("river", "geom") == (2, 2, 2154, 0)
+        assert get_column("river", "id") is None
+        assert calls == ["Lake", None]
+
+        # The cache is cleared with the other reflection results
+        inspector.clear_cache()
+        assert get_column("river", "geom") == (2, 2, 2154, 0)
+        assert calls == ["Lake", None, "river"]
+
+
+@skip_sqla_lt_2()
+class TestAsyncio:
+    @test_only_with_dialects("sqlite-spatialite4")
+    def test_async_engine(self, tmpdir, check_spatialite):
+        pytest.importorskip("aiosqlite")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        # The SpatiaLite extension is loaded by the plugin with the aiosqlite driver
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmpdir / 'test_async.sqlite'}"
+            "?geoalchemy2_connect_sqlite_init_mode=WGS84",
+            plugins=["geoalchemy2"],
+        )
+        rows, reflected = check_async_engine(async_engine)
+
+        assert [row[0].srid for row in rows] == [4326, 4326]
+        assert isinstance(rows[0][0], WKBElement)
+        assert to_shape(rows[0][0]).equals(LineString([(0, 0), (1, 1)]))
+        assert [round(row[1], 6) for row in rows] == [round(2**0.5, 6), 5]
+
+        assert isinstance(reflected.c.geom.type, Geometry)
+        assert reflected.c.geom.type.geometry_type == "LINESTRING"
+        assert reflected.c.geom.type.srid == 4326
@@ -1,11 +1,16 @@
 import re
 from pathlib import Path
 
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
 from sqlalchemy import select
 from sqlalchemy.sql import func
 
 import geoalchemy2.functions
 from geoalchemy2._functions_helpers import _generate_stubs
+from geoalchemy2.types import Geometry
 from geoalchemy2.types import Raster  # NOQA
 
 from . import skip_sqla_lt_2
@@ -478,6 +483,17 @@ def test_ST_AsGeoJSON():
     _test_simple_func("ST_AsGeoJSON")
 
 
+def test_ST_AsGeoJSON_feature_cache_key():
+    metadata = MetaData()
+    lake = Table("lake", metadata, Column("id", Integer), Column("geom", Geometry))
+    river = Table("river", metadata, Column("id", Integer), Column("geom", Geometry))
+
+    key = select(func.ST_AsGeoJSON(lake, "geom"))._generate_cache_key()
+    assert key is not None
+    assert key == select(func.ST_AsGeoJSON(lake, "geom"))._generate_cache_key()
+    assert key != select(func.ST_AsGeoJSON(river, "geom"))._generate_cache_key()
+
+
 def test_ST_AsGML():
     _test_simple_func("ST_AsGML")
 
@@ -1,7 +1,18 @@
+from functools import partial
+
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.engine import URL
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import SingletonThreadPool
+from sqlalchemy.pool import StaticPool
 
+from geoalchemy2.admin.dialects import sqlite as sqlite_dialect
+from geoalchemy2.admin.plugin import CONNECT_TIME_KEY
 from geoalchemy2.admin.plugin import GeoEngine
+from geoalchemy2.admin.plugin import _timed_connect
+from geoalchemy2.admin.plugin import warm_up_pool
 
 
 def test_geo_engine_init():
@@ -18,6 +29,8 @@ def test_geo_engine_init():
             "geoalchemy2_connect_sqlite_transaction": "true",
             "geoalchemy2_connect_sqlite_init_mode": "WGS84",
             "geoalchemy2_connect_sqlite_journal_mode": "OFF",
+            "geoalchemy2_connect_sqlite_init_cache": "true",
+            "geoalchemy2_connect_postgresql_binary_codecs": "on",
             "geoalchemy2_before_cursor_execute_mysql_convert": "off",
             "geoalchemy2_before_cursor_execute_mariadb_convert": "off",
         },
@@ -28,6 +41,11 @@ def test_geo_engine_init():
         "transaction": True,
         "init_mode": "WGS84",
         "journal_mode": "OFF",
+        "cache": True,
+    }
+
+    assert plugin.params["connect"]["postgresql"] == {
+        "binary_codecs": True,
     }
 
     assert plugin.params["before_cursor_execute"]["mysql"] == {
@@ -71,6 +89,8 @@ def test_update_url():
             "geoalchemy2_connect_sqlite_transaction": "true",
             "geoalchemy2_connect_sqlite_init_mode": "WGS84",
             "geoalchemy2_connect_sqlite_journal_mode": "OFF",
+            "geoalchemy2_connect_sqlite_init_cache": "true",
+            "geoalchemy2_connect_postgresql_binary_codecs": "true",
             "geoalchemy2_before_cursor_execute_mysql_convert": "yes",
             "geoalchemy2_before_cursor_execute_mariadb_convert": "y",
             "other_param": "value",
@@ -83,8 +103,77 @@ def test_update_url():
     assert "geoalchemy2_connect_sqlite_transaction" not in updated_url.query
     assert "geoalchemy2_connect_sqlite_init_mode" not in updated_url.query
     assert "geoalchemy2_connect_sqlite_journal_mode" not in updated_url.query
+    assert "geoalchemy2_connect_sqlite_init_cache" not in updated_url.query
+    assert "geoalchemy2_connect_postgresql_binary_codecs" not in updated_url.query
     assert "geoalchemy2_before_cursor_execute_mysql_convert" not in updated_url.query
     assert "geoalchemy2_before_cursor_execute_mariadb_convert" not in updated_url.query
 
     # Check that other parameters are preserved
     assert updated_url.query["other_param"] == "value"
+
+
+@pytest.fixture
+def dummy_connect(monkeypatch):
+    """Replace the SQLite connect listener by a dummy one that records the connections."""
+    connections = []
+
+    def connect(dbapi_conn, *args, **kwargs):
+        connections.append(dbapi_conn)
+
+    monkeypatch.setattr(sqlite_dialect, "connect", connect)
+    return connections
+
+
+def test_connect_time(dummy_connect):
+    """Test that the time spent in the connect listener is stored in the connection info."""
+    url = URL.create("sqlite")
+    plugin = GeoEngine(url, {})
+    engine = create_engine(url)
+    plugin.engine_created(engine)
+
+    with engine.connect() as conn:
+        assert len(dummy_connect) == 1
+        assert conn.connection.info[CONNECT_TIME_KEY] >= 0
+
+
+@pytest.mark.parametrize(
+    "poolclass,expected",
+    [
+        pytest.param(QueuePool, 3, id="QueuePool"),
+        pytest.param(StaticPool, 1, id="StaticPool"),
+        pytest.param(SingletonThreadPool, 1, id="SingletonThreadPool"),
+    ],
+)
+def test_warm_up(tmpdir, dummy_connect, poolclass, expected):
+    """Test that the connections are created when the engine is created."""
+    url = URL.create(
+        "sqlite",
+        database=str(tmpdir / "test_warm_up.sqlite"),
+        query={"geoalchemy2_pool_warm_up": "3"},
+    )
+    plugin = GeoEngine(url, {})
+    assert plugin.warm_up == 3
+    engine = create_engine(plugin.update_url(url), poolclass=poolclass)
+    plugin.engine_created(engine)
+
+    assert len(dummy_connect) == expected
+    if poolclass is QueuePool:
+        assert engine.pool.checkedin() == expected
+
+    # The connections of the pool are reused
+    timings = warm_up_pool(engine, 3)
+    assert len(timings) == expected
+    assert all(i >= 0 for i in timings)
+    assert len(dummy_connect) == expected
+    engine.dispose()
+
+
+def test_warm_up_timings(tmpdir, dummy_connect):
+    engine = create_engine("sqlite:///{}".format(tmpdir / "test_warm_up.sqlite"))
+    event.listen(engine, "connect", partial(_timed_connect, sqlite_dialect.connect))
+
+    timings = warm_up_pool(engine, 2)
+
+    assert len(timings) == 2
+    assert all(i >= 0 for i in timings)
+    engine.dispose()
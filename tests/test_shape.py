@@ -1,3 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 import shapely.wkb
 from shapely.geometry import Point
@@ -6,7 +9,10 @@ import geoalchemy2.shape
 from geoalchemy2.elements import WKBElement
 from geoalchemy2.elements import WKTElement
 from geoalchemy2.shape import from_shape
+from geoalchemy2.shape import from_shapes
 from geoalchemy2.shape import to_shape
+from geoalchemy2.shape import to_shapes
+from geoalchemy2.shape import to_shapes_parallel
 
 
 def test_check_shapely(monkeypatch):
@@ -114,3 +120,107 @@ def test_from_shape():
     s3 = shapely.wkb.loads(bytes(e3.data))
     assert isinstance(s, Point)
     assert s3.equals(p)
+
+
+def test_check_shapely_vectorized(monkeypatch):
+
+    @geoalchemy2.shape.check_shapely_vectorized()
+    def f():
+        return "ok"
+
+    assert f() == "ok"
+
+    with monkeypatch.context() as m:
+        m.setattr(geoalchemy2.shape, "HAS_SHAPELY_VECTORIZED", False)
+        with pytest.raises(ImportError, match="This feature needs Shapely>=2"):
+            f()
+
+
+def test_to_shapes():
+    elements = [
+        # POINT(1 2)
+        WKBElement(
+            b"\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\x00@"
+        ),
+        None,
+        WKBElement(str("0101000000000000000000f03f0000000000000040")),
+        WKTElement("SRID=3857;POINT(3 4)", extended=True),
+        WKTElement("POINT(5 6)"),
+    ]
+    shapes = to_shapes(iter(elements))
+    assert len(shapes) == len(elements)
+    assert shapes[1] is None
+    for element, shape in zip(elements, shapes):
+        if element is not None:
+            assert isinstance(shape, Point)
+            assert shape.equals(to_shape(element))
+
+    assert len(to_shapes([])) == 0
+
+
+def test_to_shapes_wrong_type():
+    with pytest.raises(TypeError, match="Only WKBElement and WKTElement objects are supported"):
+        to_shapes([WKTElement("POINT(1 2)"), 0])
+
+
+@pytest.mark.parametrize("extended", [True, False])
+@pytest.mark.parametrize("srid", [-1, 2154])
+def test_from_shapes(srid, extended):
+    shapes = [Point(1, 2), None, Point(3, 4, 5)]
+    elements = from_shapes(shapes, srid=srid, extended=extended)
+    assert len(elements) == len(shapes)
+    assert elements[1] is None
+    for shape, element in zip(shapes, elements):
+        if shape is not None:
+            expected = from_shape(shape, srid=srid, extended=extended)
+            assert isinstance(element, WKBElement)
+            assert isinstance(element.data, memoryview)
+            assert element == expected
+            assert element.srid == expected.srid
+            assert element.extended == expected.extended
+            assert to_shape(element).equals(shape)
+
+    assert from_shapes([]) == []
+
+
+@pytest.fixture(params=["default", "thread"])
+def executor(request):
+    if request.param == "default":
+        yield None
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            yield executor
+
+
+def test_to_shapes_parallel(executor):
+    point_wkb = b"\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf0?\x00\x00\x00\x00\x00\x00\x00@"
+    point_ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+    elements = [
+        WKBElement(point_wkb),
+        None,
+        WKBElement(point_ewkb.hex(), extended=True),
+        point_ewkb,
+        memoryview(point_wkb),
+        point_wkb.hex(),
+        None,
+    ]
+    shapes = to_shapes_parallel(elements, chunk_size=2, executor=executor)
+    assert len(shapes) == len(elements)
+    assert shapes[1] is None
+    assert shapes[6] is None
+    for idx in [0, 2, 3, 4, 5]:
+        assert isinstance(shapes[idx], Point)
+        assert shapes[idx].equals(Point(1, 2))
+
+    assert len(to_shapes_parallel([], executor=executor)) == 0
+    assert list(to_shapes_parallel([None, None], executor=executor)) == [None, None]
+
+
+def test_to_shapes_parallel_wrong_args():
+    with pytest.raises(TypeError, match="Only WKBElement objects and raw WKB values"):
+        to_shapes_parallel([WKTElement("POINT(1 2)")])
+    with pytest.raises(ValueError, match="The chunk size must be a positive integer"):
+        to_shapes_parallel([], chunk_size=0)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError, match="The process pools are not supported"):
+            to_shapes_parallel([], executor=executor)
@@ -1,17 +1,40 @@
 import re
+import struct
 
 import pytest
+import shapely
 from sqlalchemy import Column
 from sqlalchemy import MetaData
 from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.dialects.mysql.mariadb import MariaDBDialect
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from sqlalchemy.event import listens_for
 from sqlalchemy.sql import func
 from sqlalchemy.sql import insert
 from sqlalchemy.sql import text
 
+from geoalchemy2.admin.dialects.geopackage import GeoPackageDialect
+from geoalchemy2.elements import DynamicWKTElement
+from geoalchemy2.elements import RasterElement
+from geoalchemy2.elements import WKBElement
+from geoalchemy2.elements import WKTElement
+from geoalchemy2.elements import wkt_cache
 from geoalchemy2.exc import ArgumentError
+from geoalchemy2.shape import to_shape
 from geoalchemy2.types import Geography
 from geoalchemy2.types import Geometry
 from geoalchemy2.types import Raster
+from geoalchemy2.types import _DummyGeometry
+from geoalchemy2.types.dialects.geopackage import gpkg_blob_to_ewkb
+from geoalchemy2.types.dialects.geopackage import wkb_to_gpkg_blob
+from geoalchemy2.types.dialects.sqlite import format_geom_type
+from geoalchemy2.types.dialects.sqlite import spatialite_blob_to_ewkb
+from geoalchemy2.types.dialects.sqlite import wkb_to_spatialite_blob
 
 from . import select
 
@@ -44,6 +67,27 @@ class TestGeometry:
         g = Geometry(srid=900913)
         assert g.get_col_spec() == "geometry(GEOMETRY,900913)"
 
+    @pytest.mark.parametrize(
+        "type_,other_type",
+        [
+            pytest.param(Geometry(srid=4326), Geometry(srid=2154), id="Geometry"),
+            pytest.param(Geography(srid=4326), Geography(srid=2154), id="Geography"),
+            pytest.param(Geometry(), Geometry(native_binary=True), id="Geometry native binary"),
+            pytest.param(Raster(), Raster(spatial_index=False), id="Raster"),
+            pytest.param(
+                _DummyGeometry(geometry_type="POINT"),
+                _DummyGeometry(geometry_type="LINESTRING"),
+                id="_DummyGeometry",
+            ),
+        ],
+    )
+    def test_cache_key(self, type_, other_type):
+        key = type_._static_cache_key
+        # The key is NO_CACHE if the type is not cacheable
+        assert isinstance(key, tuple)
+        assert key == type_.copy()._static_cache_key
+        assert key != other_type._static_cache_key
+
     def test_get_col_spec_no_srid(self):
         g = Geometry(srid=None)
         assert g.get_col_spec() == "geometry(GEOMETRY,-1)"
@@ -124,6 +168,556 @@ class TestGeometry:
             '(SELECT "table".geom AS geom FROM "table") AS name',
         )
 
+    @pytest.mark.parametrize(
+        "dialect,srid,expected_srid,expected_extended",
+        [
+            pytest.param(postgresql.dialect(), -1, 3, True, id="PostgreSQL"),
+            pytest.param(postgresql.dialect(), 4326, 4326, True, id="PostgreSQL with SRID"),
+            pytest.param(mysql.dialect(), -1, -1, False, id="MySQL"),
+            pytest.param(mysql.dialect(), 4326, 4326, False, id="MySQL with SRID"),
+        ],
+    )
+    def test_result_processor(self, dialect, srid, expected_srid, expected_extended):
+        ewkb = bytes.fromhex("010100002003000000000000000000f03f0000000000000040")
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        process = Geometry(srid=srid).result_processor(dialect, None)
+        assert process(None) is None
+        element = process(ewkb if expected_extended else wkb)
+        assert isinstance(element, WKBElement)
+        assert element.srid == expected_srid
+        assert element.extended is expected_extended
+
+    @pytest.mark.parametrize(
+        "dialect,expected",
+        [
+            pytest.param(
+                PGDialect_asyncpg(),
+                'SELECT "table".geom AS geom, "table".geog AS geog, '
+                'ST_AsEWKB(ST_Centroid("table".geom)) AS "ST_Centroid_1" FROM "table"',
+                id="asyncpg",
+            ),
+            pytest.param(
+                PGDialect_psycopg2(),
+                'SELECT ST_AsEWKB("table".geom) AS geom, ST_AsBinary("table".geog) AS geog, '
+                'ST_AsEWKB(ST_Centroid("table".geom)) AS "ST_Centroid_1" FROM "table"',
+                id="psycopg2",
+            ),
+            pytest.param(
+                sqlite.dialect(),
+                'SELECT "table".geom AS geom, "table".geog AS geog, '
+                'AsEWKB(ST_Centroid("table".geom)) AS "ST_Centroid_1" FROM "table"',
+                id="sqlite",
+            ),
+            pytest.param(
+                GeoPackageDialect(),
+                'SELECT "table".geom AS geom, "table".geog AS geog, '
+                'AsEWKB(ST_Centroid("table".geom)) AS "ST_Centroid_1" FROM "table"',
+                id="geopackage",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                "SELECT ST_AsBinary(`table`.geom) AS geom, ST_AsBinary(`table`.geog) AS geog, "
+                "ST_AsBinary(ST_Centroid(`table`.geom)) AS `ST_Centroid_1` FROM `table`",
+                id="mysql",
+            ),
+        ],
+    )
+    def test_column_expression_native_binary(self, dialect, expected):
+        table = Table(
+            "table",
+            MetaData(),
+            Column("geom", Geometry(native_binary=True)),
+            Column("geog", Geography(native_binary=True)),
+        )
+        s = select([table.c.geom, table.c.geog, table.c.geom.ST_Centroid()])
+        eq_sql(s.compile(dialect=dialect), expected)
+
+    @pytest.mark.parametrize("type_", [Geometry, Geography])
+    def test_result_processor_native_binary(self, type_):
+        ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+        process = type_(native_binary=True).result_processor(PGDialect_asyncpg(), None)
+        element = process(ewkb)
+        assert isinstance(element, WKBElement)
+        assert element.srid == 4326
+        assert element.extended is True
+
+        # The option has no effect with the other drivers
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        process = Geography(native_binary=True).result_processor(PGDialect_psycopg2(), None)
+        assert process(wkb).extended is False
+
+    @pytest.mark.parametrize(
+        "dialect,expected",
+        [
+            pytest.param(sqlite.dialect(), 'INSERT INTO "table" (geom) VALUES (?)', id="sqlite"),
+            pytest.param(
+                GeoPackageDialect(), 'INSERT INTO "table" (geom) VALUES (?)', id="geopackage"
+            ),
+            pytest.param(
+                PGDialect_asyncpg(),
+                'INSERT INTO "table" (geom) VALUES (ST_GeomFromEWKT($1))',
+                id="asyncpg",
+            ),
+        ],
+    )
+    def test_insert_bind_expression_native_binary(self, dialect, expected):
+        table = Table("table", MetaData(), Column("geom", Geometry(native_binary=True)))
+        i = insert(table).values(geom="POINT(1 2)")
+        eq_sql(i.compile(dialect=dialect), expected)
+
+    @pytest.mark.parametrize(
+        "dialect,from_text,native_binary,expected",
+        [
+            pytest.param(
+                mysql.dialect(),
+                "ST_GeomFromEWKT",
+                None,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromWKB(%s, 4326))",
+                id="MySQL",
+            ),
+            pytest.param(
+                MariaDBDialect(),
+                "ST_GeomFromEWKT",
+                None,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromWKB(unhex(%s), 4326))",
+                id="MariaDB",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                "ST_GeomFromWKB",
+                None,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromWKB(%s, 4326))",
+                id="MySQL from WKB",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                "ST_GeomFromEWKT",
+                True,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromWKB(%s, 4326))",
+                id="MySQL native binary",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                "ST_GeomFromEWKT",
+                False,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromText(%s, 4326))",
+                id="MySQL text",
+            ),
+            pytest.param(
+                MariaDBDialect(),
+                "ST_GeomFromEWKT",
+                False,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromText(%s, 4326))",
+                id="MariaDB text",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                "ST_GeomFromGeoJSON",
+                None,
+                "INSERT INTO `table` (geom) VALUES (ST_GeomFromGeoJSON(%s))",
+                id="MySQL custom from text",
+            ),
+        ],
+    )
+    def test_insert_bind_expression_mysql(self, dialect, from_text, native_binary, expected):
+        table = Table(
+            "table",
+            MetaData(),
+            Column("geom", Geometry(srid=4326, from_text=from_text, native_binary=native_binary)),
+        )
+        i = insert(table).values(geom="POINT(1 2)")
+        eq_sql(i.compile(dialect=dialect), expected)
+
+    @pytest.mark.parametrize(
+        "dialect",
+        [pytest.param(mysql.dialect(), id="MySQL"), pytest.param(MariaDBDialect(), id="MariaDB")],
+    )
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(
+                WKBElement("0101000020e6100000000000000000f03f0000000000000040", extended=True),
+                id="WKB",
+            ),
+            pytest.param("SRID=4326;POINT(1 2)", id="EWKT"),
+            pytest.param(WKTElement("POINT(1 2)"), id="WKTElement"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "native_binary,expected",
+        [
+            pytest.param(False, "ST_GeomFromText('POINT%s(1 2)', 4326)", id="text"),
+            pytest.param(
+                None,
+                "ST_GeomFromWKB(unhex('0101000000000000000000f03f0000000000000040'), 4326)",
+                id="default",
+            ),
+            pytest.param(
+                True,
+                "ST_GeomFromWKB(unhex('0101000000000000000000f03f0000000000000040'), 4326)",
+                id="native binary",
+            ),
+        ],
+    )
+    def test_insert_bind_expression_mysql_literal_binds(
+        self, dialect, value, native_binary, expected
+    ):
+        table = Table(
+            "table", MetaData(), Column("geom", Geometry(srid=4326, native_binary=native_binary))
+        )
+        if native_binary is False:
+            # The WKB values are converted into WKT by Shapely
+            expected = expected % (" " if isinstance(value, WKBElement) else "")
+        i = insert(table).values(geom=value)
+        eq_sql(
+            i.compile(dialect=dialect, compile_kwargs={"literal_binds": True}),
+            "INSERT INTO `table` (geom) VALUES (%s)" % expected,
+        )
+
+    @pytest.mark.parametrize(
+        "dialect,to_bound",
+        [
+            pytest.param(mysql.dialect(), lambda wkb: wkb, id="MySQL"),
+            pytest.param(MariaDBDialect(), lambda wkb: wkb.hex(), id="MariaDB"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "native_binary", [pytest.param(None, id="default"), pytest.param(True, id="native")]
+    )
+    def test_bind_processor_native_binary_mysql(self, dialect, to_bound, native_binary):
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+        process = Geometry(srid=4326, native_binary=native_binary).bind_processor(dialect)
+
+        # All the geometries are converted into WKB without SRID
+        assert process(WKBElement(wkb)) == to_bound(wkb)
+        assert process(WKBElement(ewkb, extended=True)) == to_bound(wkb)
+        assert process(WKBElement(ewkb.hex(), extended=True)) == to_bound(wkb)
+        assert process("POINT(1 2)") == to_bound(wkb)
+        assert process("SRID=4326;POINT(1 2)") == to_bound(wkb)
+        assert process(WKTElement("POINT(1 2)", srid=4326)) == to_bound(wkb)
+        assert process(memoryview(wkb)) == to_bound(wkb)
+        assert process(None) is None
+
+        with pytest.raises(ArgumentError, match="The SRID"):
+            process(WKBElement(wkb, srid=2154))
+        with pytest.raises(ArgumentError, match="The SRID"):
+            process("SRID=2154;POINT(1 2)")
+
+    def test_bind_processor_native_binary_sqlite(self):
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        process = Geometry(srid=4326, native_binary=True).bind_processor(sqlite.dialect())
+        assert process(WKBElement(wkb)) == bytes.fromhex(
+            "0001e6100000"
+            "000000000000f03f0000000000000040000000000000f03f0000000000000040"
+            "7c01000000000000000000f03f0000000000000040fe"
+        )
+        assert process(WKBElement(wkb, srid=2154))[2:6] == (2154).to_bytes(4, "little")
+
+        # The WKT values are also encoded into SpatiaLite BLOBs
+        blob = process(WKBElement(wkb))
+        assert process("POINT(1 2)") == blob
+        assert process(WKTElement("POINT(1 2)")) == blob
+        assert process(WKTElement("POINT(1 2)", srid=2154)) == process(WKBElement(wkb, srid=2154))
+        assert process("SRID=2154;POINT(1 2)") == process(WKBElement(wkb, srid=2154))
+
+        # The binary values are bound as is if they are valid SpatiaLite BLOBs
+        assert process(blob) is blob
+        assert process(memoryview(blob)) == blob
+        with pytest.raises(ArgumentError, match="The binary value is not in the native binary"):
+            process(wkb)
+
+        # The geometries not supported by the BLOB encoder are rejected
+        nested = WKBElement(
+            shapely.to_wkb(shapely.from_wkt("GEOMETRYCOLLECTION (MULTIPOINT (1 2))"))
+        )
+        with pytest.raises(ArgumentError, match="The geometry can not be bound in the native"):
+            process(nested)
+        with pytest.raises(ArgumentError, match="The geometry can not be bound in the native"):
+            process("POINT EMPTY")
+        assert process(None) is None
+
+    def test_insert_bind_expression_native_binary_sqlite_literal_binds(self):
+        table = Table("table", MetaData(), Column("geom", Geometry(srid=4326, native_binary=True)))
+        blob = wkb_to_spatialite_blob(
+            bytes.fromhex("0101000000000000000000f03f0000000000000040"), 4326
+        )
+        for value in ["POINT(1 2)", WKTElement("POINT(1 2)"), blob]:
+            i = insert(table).values(geom=value)
+            eq_sql(
+                i.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}),
+                "INSERT INTO \"table\" (geom) VALUES (X'%s')" % blob.hex(),
+            )
+
+    @pytest.mark.parametrize("srid,expected_srid", [(-1, 2154), (4326, 4326)])
+    def test_result_processor_native_binary_sqlite(self, srid, expected_srid):
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        blob = wkb_to_spatialite_blob(wkb, 2154)
+        process = Geometry(srid=srid, native_binary=True).result_processor(sqlite.dialect(), None)
+        assert process(None) is None
+        element = process(blob)
+        assert isinstance(element, WKBElement)
+        assert element.srid == expected_srid
+        assert element.extended is True
+        assert to_shape(element).equals(shapely.wkb.loads(wkb))
+
+    def test_result_processor_lazy_elements(self, monkeypatch):
+        ewkb = bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")
+        engine = create_engine("sqlite://")
+
+        @listens_for(engine, "connect")
+        def register_functions(dbapi_conn, connection_record):
+            # Like SpatiaLite, the fake AsEWKB function returns a hexadecimal string
+            dbapi_conn.create_function("AsEWKB", 1, lambda value: value.hex())
+
+        table = Table("lazy_table", MetaData(), Column("geom", Geometry(lazy_elements=True)))
+        decoded_headers = []
+        read_header = WKBElement._read_header
+        monkeypatch.setattr(
+            WKBElement,
+            "_read_header",
+            staticmethod(lambda data: decoded_headers.append(data) or read_header(data)),
+        )
+
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE lazy_table (geom BLOB)"))
+            conn.execute(text("INSERT INTO lazy_table VALUES (:geom)"), [{"geom": ewkb}] * 3)
+            elements = conn.execute(select([table.c.geom])).scalars().all()
+
+        # The headers are not decoded when the rows are fetched
+        assert len(elements) == 3
+        assert all(isinstance(element, WKBElement) for element in elements)
+        assert decoded_headers == []
+
+        # The header is decoded when it is accessed
+        assert elements[0].srid == 4326
+        assert elements[0].extended is True
+        assert len(decoded_headers) == 1
+        assert to_shape(elements[1]).wkt == "POINT (1 2)"
+        assert len(decoded_headers) == 1
+
+    def test_result_processor_lazy_elements_known_attributes(self):
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        process = Geometry(srid=4326, lazy_elements=True).result_processor(mysql.dialect(), None)
+        element = process(wkb)
+        # The SRID is known from the type so only the extended flag is decoded from the header
+        assert object.__getattribute__(element, "srid") == 4326
+        assert element.extended is False
+
+    def test_bind_processor_native_binary_geopackage(self):
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        process = Geometry(srid=4326, native_binary=True).bind_processor(GeoPackageDialect())
+        gpkg_blob = bytes.fromhex("47500001e6100000") + wkb
+        assert process(WKBElement(wkb)) == gpkg_blob
+
+        # The WKT values are also encoded into GeoPackage binary values
+        assert process("POINT(1 2)") == gpkg_blob
+        assert process(WKTElement("POINT(1 2)")) == gpkg_blob
+        assert process("SRID=2154;POINT(1 2)") == process(WKBElement(wkb, srid=2154))
+        assert process("POINT EMPTY")[3] & 0x10
+
+        # The GeoPackage binary values are bound as is
+        assert process(gpkg_blob) is gpkg_blob
+        assert process(memoryview(gpkg_blob)) == gpkg_blob
+
+        # The SpatiaLite BLOBs are re-encoded into GeoPackage binary values with their SRID
+        assert process(wkb_to_spatialite_blob(wkb, 4326)) == gpkg_blob
+        assert process(memoryview(wkb_to_spatialite_blob(wkb, 2154))) == process(
+            WKBElement(wkb, srid=2154)
+        )
+        with pytest.raises(ArgumentError, match="The binary value is not in the native binary"):
+            process(wkb)
+        with pytest.raises(ArgumentError, match="The geometry can not be bound in the native"):
+            process(WKBElement("0108000000"))
+        assert process(None) is None
+
+        i = insert(Table("table", MetaData(), Column("geom", Geometry(native_binary=True))))
+        eq_sql(
+            i.values(geom=WKBElement(wkb, srid=4326)).compile(
+                dialect=GeoPackageDialect(), compile_kwargs={"literal_binds": True}
+            ),
+            "INSERT INTO \"table\" (geom) VALUES (X'%s')" % gpkg_blob.hex(),
+        )
+
+        # The values are decoded from the GeoPackage binary format
+        process = Geometry(native_binary=True).result_processor(GeoPackageDialect(), None)
+        element = process(bytes.fromhex("47500001e6100000") + wkb)
+        assert element.srid == 4326
+        assert element.extended is True
+        assert to_shape(element).wkt == "POINT (1 2)"
+
+    def test_result_processor_custom_element_type(self):
+        class WKTGeometry(Geometry):
+            as_binary = "ST_AsEWKT"
+            ElementType = WKTElement
+            cache_ok = True
+
+        process = WKTGeometry(srid=4326).result_processor(postgresql.dialect(), None)
+        element = process("SRID=4326;POINT(1 2)")
+        assert isinstance(element, WKTElement)
+        assert element.srid == 4326
+        assert element.extended is False
+
+    @pytest.mark.parametrize(
+        "dialect,value,expected",
+        [
+            pytest.param(
+                postgresql.dialect(),
+                WKTElement("POINT(1 2)", srid=4326),
+                "SRID=4326;POINT(1 2)",
+                id="PostgreSQL WKTElement",
+            ),
+            pytest.param(
+                postgresql.dialect(),
+                DynamicWKTElement("POINT(1 2)", srid=4326),
+                "SRID=4326;POINT(1 2)",
+                id="PostgreSQL DynamicWKTElement",
+            ),
+            pytest.param(
+                postgresql.dialect(),
+                WKBElement("010100002003000000000000000000f03f0000000000000040"),
+                "010100002003000000000000000000f03f0000000000000040",
+                id="PostgreSQL WKBElement",
+            ),
+            pytest.param(
+                postgresql.dialect(),
+                WKBElement(bytes.fromhex("0101000000000000000000f03f0000000000000040"), srid=3),
+                "010100002003000000000000000000f03f0000000000000040",
+                id="PostgreSQL non-extended WKBElement",
+            ),
+            pytest.param(
+                postgresql.dialect(),
+                WKBElement("00000000013ff00000000000004000000000000000", srid=3),
+                "0020000001000000033ff00000000000004000000000000000",
+                id="PostgreSQL non-extended big endian WKBElement",
+            ),
+            pytest.param(postgresql.dialect(), "POINT(1 2)", "POINT(1 2)", id="PostgreSQL str"),
+            pytest.param(
+                sqlite.dialect(),
+                DynamicWKTElement("POINT Z (1 2 3)"),
+                "SRID=4326;POINT(1 2 3)",
+                id="SQLite DynamicWKTElement",
+            ),
+            pytest.param(sqlite.dialect(), "POINT(1 2)", "SRID=4326;POINT(1 2)", id="SQLite str"),
+            pytest.param(
+                mysql.dialect(),
+                "SRID=4326;POINT(1 2)",
+                bytes.fromhex("0101000000000000000000f03f0000000000000040"),
+                id="MySQL str",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                WKBElement("0101000000000000000000f03f0000000000000040"),
+                bytes.fromhex("0101000000000000000000f03f0000000000000040"),
+                id="MySQL WKBElement",
+            ),
+            pytest.param(
+                mysql.dialect(),
+                WKBElement(bytes.fromhex("0101000020e6100000000000000000f03f0000000000000040")),
+                bytes.fromhex("0101000000000000000000f03f0000000000000040"),
+                id="MySQL extended WKBElement",
+            ),
+            pytest.param(
+                MariaDBDialect(),
+                WKBElement(
+                    bytes.fromhex(
+                        "0104000000020000000101000000000000000000f03f0000000000000040"
+                        "010100000000000000000008400000000000001040"
+                    )
+                ),
+                "0104000000020000000101000000000000000000f03f0000000000000040"
+                "010100000000000000000008400000000000001040",
+                id="MariaDB WKBElement",
+            ),
+            pytest.param(mysql.dialect(), None, None, id="MySQL None"),
+        ],
+    )
+    def test_bind_processor(self, dialect, value, expected):
+        process = Geometry(srid=4326).bind_processor(dialect)
+        assert process(value) == expected
+
+    @pytest.mark.parametrize(
+        "dialect,value,expected",
+        [
+            pytest.param(mysql.dialect(), "SRID=4326;POINT(1 2)", "POINT(1 2)", id="MySQL str"),
+            pytest.param(
+                mysql.dialect(),
+                WKBElement("0101000000000000000000f03f0000000000000040"),
+                "POINT (1 2)",
+                id="MySQL WKBElement",
+            ),
+            pytest.param(
+                MariaDBDialect(),
+                WKBElement(
+                    bytes.fromhex(
+                        "0104000000020000000101000000000000000000f03f0000000000000040"
+                        "010100000000000000000008400000000000001040"
+                    )
+                ),
+                "MULTIPOINT (1 2, 3 4)",
+                id="MariaDB WKBElement",
+            ),
+        ],
+    )
+    def test_bind_processor_mysql_text(self, dialect, value, expected):
+        """The values are bound as text when the native_binary option is disabled."""
+        process = Geometry(srid=4326, native_binary=False).bind_processor(dialect)
+        assert process(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "POINT(1 2)",
+            "POINT Z (1 2 3)",
+            "SRID=2154;POINT(1 2)",
+            "SRID=2154 ; MULTIPOINT ZM ((1 2 3 4), (5 6 7 8))",
+            WKTElement("SRID=2154;LINESTRING(1 2, 3 4)"),
+            WKTElement("POINT(1 2)", srid=2154),
+        ],
+    )
+    def test_bind_processor_sqlite_wkt_cache(self, value):
+        process = Geometry(srid=4326).bind_processor(sqlite.dialect())
+        expected = process(value)
+        wkt_cache.enable()
+        try:
+            assert process(value) == expected
+            assert process(value) == expected
+            assert wkt_cache.info().hits >= 1
+        finally:
+            wkt_cache.disable()
+
+    @pytest.mark.parametrize(
+        "wkt",
+        [
+            "POINT(1 2)",
+            "SRID=2154;POINT(1 2)",
+            "SRID=02154 ;POINT Z (1 2 3)",
+            "SRID=2154;POINT(1 2);POINT(3 4)",
+        ],
+    )
+    @pytest.mark.parametrize("default_srid", [None, 4326])
+    def test_format_geom_type_sqlite_wkt_cache(self, wkt, default_srid):
+        expected = format_geom_type(wkt, default_srid=default_srid)
+        wkt_cache.enable()
+        try:
+            assert format_geom_type(wkt, default_srid=default_srid) == expected
+        finally:
+            wkt_cache.disable()
+
+    def test_bind_processor_sqlite_wkt_cache_unparsable(self):
+        process = Geometry(srid=4326).bind_processor(sqlite.dialect())
+        wkt_cache.enable()
+        try:
+            with pytest.warns(UserWarning, match="The given WKT could not be parsed"):
+                assert process("UNKNOWN") == "UNKNOWN"
+        finally:
+            wkt_cache.disable()
+
+    def test_bind_processor_wrong_srid(self):
+        process = Geometry(srid=4326).bind_processor(mysql.dialect())
+        with pytest.raises(ArgumentError, match="is different from the one of the column"):
+            process(RasterElement("01" + "00" * 56))
+
 
 class TestGeography:
     def test_get_col_spec(self):
@@ -250,3 +844,258 @@ class TestCompositeType:
         s = select([func.ST_Dump(geography_table.c.geom).geom.label("geom")])
 
         eq_sql(s, 'SELECT ST_AsEWKB((ST_Dump("table".geom)).geom) AS geom ' 'FROM "table"')
+
+
+class TestSpatiaLiteBlob:
+    @pytest.mark.parametrize(
+        "wkt",
+        [
+            "POINT (1 2)",
+            "POINT Z (1 2 3)",
+            "POINT M (1 2 4)",
+            "POINT ZM (1 2 3 4)",
+            "LINESTRING (1 2, 3 4, -5 6)",
+            "LINESTRING Z (1 2 3, 4 5 6)",
+            "POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 2 1, 2 2, 1 1))",
+            "POLYGON ZM ((0 0 1 2, 4 0 1 2, 4 4 1 2, 0 0 1 2))",
+            "MULTIPOINT ((1 2), (-3 4))",
+            "MULTILINESTRING ((1 2, 3 4), (5 6, 7 8))",
+            "MULTIPOLYGON (((0 0, 1 0, 1 1, 0 0)), ((5 5, 6 5, 6 6, 5 5)))",
+            "GEOMETRYCOLLECTION (POINT (1 2), LINESTRING (3 4, 5 6))",
+        ],
+    )
+    @pytest.mark.parametrize("byte_order", ["little", "big"])
+    def test_roundtrip(self, wkt, byte_order):
+        geom = shapely.from_wkt(wkt)
+        wkb = shapely.to_wkb(geom, byte_order=int(byte_order == "little"), flavor="iso")
+        blob = wkb_to_spatialite_blob(wkb, 4326)
+        assert blob[0] == 0x00
+        assert blob[-1] == 0xFE
+        assert blob[6:38] == struct.pack("<4d", *geom.bounds)
+
+        ewkb = spatialite_blob_to_ewkb(blob)
+        element = WKBElement(ewkb)
+        assert element.srid == 4326
+        assert element.extended is True
+        result = to_shape(element)
+        assert result.wkt == geom.wkt
+        assert result.has_z == geom.has_z
+        assert result.has_m == geom.has_m
+
+        # The EWKB values are also accepted by the encoder
+        assert wkb_to_spatialite_blob(ewkb, 4326) == blob
+        assert wkb_to_spatialite_blob(ewkb.hex(), 4326) == blob
+
+    @pytest.mark.parametrize(
+        "wkb",
+        [
+            pytest.param(shapely.to_wkb(shapely.from_wkt("POINT EMPTY")), id="empty point"),
+            pytest.param(
+                shapely.to_wkb(shapely.from_wkt("LINESTRING EMPTY")), id="empty linestring"
+            ),
+            pytest.param(
+                shapely.to_wkb(shapely.from_wkt("GEOMETRYCOLLECTION (POINT (1 2), POINT EMPTY)")),
+                id="empty point in collection",
+            ),
+            pytest.param(
+                shapely.to_wkb(shapely.from_wkt("GEOMETRYCOLLECTION (MULTIPOINT (1 2))")),
+                id="nested collection",
+            ),
+            pytest.param(struct.pack("<BII6d", 1, 8, 3, 0, 0, 1, 1, 2, 0), id="circular string"),
+            pytest.param(b"\x01\x01\x00", id="truncated"),
+        ],
+    )
+    def test_encode_unsupported(self, wkb):
+        with pytest.raises(ValueError):
+            wkb_to_spatialite_blob(wkb, 4326)
+
+    def test_decode_big_endian(self):
+        blob = (
+            bytes.fromhex("0000000010e6")
+            + struct.pack(">4dBI", 1, 2, 1, 2, 0x7C, 1)
+            + struct.pack(">2dB", 1, 2, 0xFE)
+        )
+        element = WKBElement(spatialite_blob_to_ewkb(blob))
+        assert element.srid == 4326
+        assert to_shape(element).wkt == "POINT (1 2)"
+
+    @pytest.mark.parametrize(
+        "byte_order,endian", [pytest.param(0x81, "<", id="little"), (0x80, ">")]
+    )
+    @pytest.mark.parametrize(
+        "point_type,coords,expected",
+        [
+            (1, (1, 2), "POINT (1 2)"),
+            (2, (1, 2, 3), "POINT Z (1 2 3)"),
+            (3, (1, 2, 4), "POINT M (1 2 4)"),
+            (4, (1, 2, 3, 4), "POINT ZM (1 2 3 4)"),
+        ],
+    )
+    def test_decode_tiny_point(self, byte_order, endian, point_type, coords, expected):
+        blob = (
+            bytes((0x00, byte_order))
+            + struct.pack(endian + "iB%dd" % len(coords), 4326, point_type, *coords)
+            + bytes((0xFE,))
+        )
+        element = WKBElement(spatialite_blob_to_ewkb(blob))
+        assert element.srid == 4326
+        assert to_shape(element).wkt == expected
+
+    @pytest.mark.parametrize(
+        "class_int,vertices,expected",
+        [
+            (
+                1000002,
+                ((1, 2), (1.5, 2.5), (2.5, 3), (4, 5)),
+                "LINESTRING (1 2, 1.5 2.5, 2.5 3, 4 5)",
+            ),
+            (1001002, ((1, 2, 3), (2, 3, 4), (3, 4, 5)), "LINESTRING Z (1 2 3, 2 3 4, 3 4 5)"),
+            (
+                1002002,
+                ((1, 2, 10), (2, 3, 20), (3, 4, 30)),
+                "LINESTRING M (1 2 10, 2 3 20, 3 4 30)",
+            ),
+        ],
+    )
+    def test_decode_compressed_linestring(self, class_int, vertices, expected):
+        has_m = class_int == 1002002
+        delta_format = "<2fd" if has_m else "<%df" % len(vertices[0])
+        body = struct.pack("<I", len(vertices)) + struct.pack(
+            "<%dd" % len(vertices[0]), *vertices[0]
+        )
+        for previous, vertex in zip(vertices[:-2], vertices[1:-1]):
+            deltas = [v - p for v, p in zip(vertex, previous)]
+            if has_m:
+                deltas[-1] = vertex[-1]
+            body += struct.pack(delta_format, *deltas)
+        body += struct.pack("<%dd" % len(vertices[-1]), *vertices[-1])
+        blob = (
+            bytes.fromhex("0001e6100000")
+            + struct.pack("<4dBI", 1, 2, 4, 5, 0x7C, class_int)
+            + body
+            + bytes((0xFE,))
+        )
+        assert to_shape(WKBElement(spatialite_blob_to_ewkb(blob))).wkt == expected
+
+    def test_decode_compressed_polygon(self):
+        ring = (0, 0, 4, 0, 4, 4, 0, 0)
+        body = (
+            struct.pack("<II2d", 1, 4, 0, 0)
+            + struct.pack("<2f2f", 4, 0, 0, 4)
+            + struct.pack("<2d", 0, 0)
+        )
+        blob = (
+            bytes.fromhex("0001e6100000")
+            + struct.pack("<4dBI", 0, 0, 4, 4, 0x7C, 1000003)
+            + body
+            + bytes((0xFE,))
+        )
+        geom = to_shape(WKBElement(spatialite_blob_to_ewkb(blob)))
+        assert geom.exterior.coords[:] == list(zip(ring[0::2], ring[1::2]))
+
+    @pytest.mark.parametrize(
+        "blob",
+        [
+            pytest.param(b"", id="empty"),
+            pytest.param(b"0101000000000000000000f03f0000000000000040", id="not a BLOB"),
+            pytest.param(
+                bytes.fromhex("0001e6100000") + bytes(32) + b"\x7c\x01\x00", id="truncated"
+            ),
+            pytest.param(
+                bytes.fromhex("0001e6100000") + bytes(32) + struct.pack("<BI", 0x7C, 8) + b"\xfe",
+                id="unknown class",
+            ),
+        ],
+    )
+    def test_decode_invalid(self, blob):
+        with pytest.raises(ValueError):
+            spatialite_blob_to_ewkb(blob)
+
+
+class TestGeoPackageBlob:
+    @pytest.mark.parametrize(
+        "wkt",
+        [
+            "POINT (1 2)",
+            "POINT ZM (1 2 3 4)",
+            "LINESTRING (1 2, 3 4, -5 6)",
+            "LINESTRING Z (1 2 3, 4 5 6)",
+            "POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0), (1 1, 2 1, 2 2, 1 1))",
+            "MULTIPOINT ((1 2), (-3 4))",
+            "MULTIPOLYGON Z (((0 0 1, 1 0 1, 1 1 1, 0 0 1)), ((5 5 1, 6 5 1, 6 6 1, 5 5 1)))",
+            "GEOMETRYCOLLECTION (POINT (1 2), LINESTRING (3 4, 5 6))",
+            "GEOMETRYCOLLECTION (GEOMETRYCOLLECTION (POINT (1 2)))",
+            "POINT EMPTY",
+            "LINESTRING EMPTY",
+        ],
+    )
+    @pytest.mark.parametrize("byte_order", ["little", "big"])
+    def test_roundtrip(self, wkt, byte_order):
+        geom = shapely.from_wkt(wkt)
+        wkb = shapely.to_wkb(geom, byte_order=int(byte_order == "little"), flavor="iso")
+        blob = wkb_to_gpkg_blob(wkb, 4326)
+        assert blob[:2] == b"GP"
+        assert struct.unpack_from("<i", blob, 4)[0] == 4326
+        if geom.is_empty:
+            assert blob[3] == 0x11
+            assert blob[8:] == wkb
+        elif geom.geom_type == "Point":
+            assert blob[3] == 0x01
+            assert blob[8:] == wkb
+        else:
+            minx, miny, maxx, maxy = geom.bounds
+            assert blob[3] == 0x03
+            assert blob[8:40] == struct.pack("<4d", minx, maxx, miny, maxy)
+            assert blob[40:] == wkb
+
+        element = WKBElement(gpkg_blob_to_ewkb(blob))
+        assert element.srid == 4326
+        assert element.extended is True
+        result = to_shape(element)
+        assert result.wkt == geom.wkt
+        assert result.has_z == geom.has_z
+
+        # The EWKB values are converted to ISO WKB
+        ewkb = shapely.to_wkb(shapely.set_srid(geom, 4326), include_srid=True, flavor="extended")
+        assert wkb_to_gpkg_blob(ewkb, 4326) == wkb_to_gpkg_blob(
+            shapely.to_wkb(geom, flavor="iso"), 4326
+        )
+
+    @pytest.mark.parametrize(
+        "flags,envelope",
+        [
+            pytest.param(0x00, b"", id="big endian"),
+            pytest.param(0x05, struct.pack("<6d", 1, 1, 2, 2, 3, 3), id="XYZ envelope"),
+            pytest.param(0x09, struct.pack("<8d", 1, 1, 2, 2, 3, 3, 4, 4), id="XYZM envelope"),
+        ],
+    )
+    def test_decode_header(self, flags, envelope):
+        endian = "<" if flags & 0x01 else ">"
+        blob = (
+            b"GP"
+            + struct.pack(endian + "BBi", 0, flags, 2154)
+            + envelope
+            + shapely.to_wkb(shapely.from_wkt("POINT Z (1 2 3)"), flavor="iso")
+        )
+        element = WKBElement(gpkg_blob_to_ewkb(blob))
+        assert element.srid == 2154
+        assert to_shape(element).wkt == "POINT Z (1 2 3)"
+
+    def test_decode_spatialite_blob(self):
+        wkb = bytes.fromhex("0101000000000000000000f03f0000000000000040")
+        element = WKBElement(gpkg_blob_to_ewkb(wkb_to_spatialite_blob(wkb, 4326)))
+        assert element.srid == 4326
+        assert to_shape(element).wkt == "POINT (1 2)"
+
+    @pytest.mark.parametrize(
+        "blob",
+        [
+            pytest.param(b"GP\x00\x21\xe6\x10\x00\x00", id="extended"),
+            pytest.param(b"GP\x00\x0f\xe6\x10\x00\x00", id="unknown envelope"),
+            pytest.param(b"GP\x00\x01\xe6\x10", id="truncated"),
+            pytest.param(b"GP\x00\x01\xe6\x10\x00\x00\x01\x08\x00\x00\x00", id="curve"),
+        ],
+    )
+    def test_decode_invalid(self, blob):
+        with pytest.raises(ValueError):
+            gpkg_blob_to_ewkb(blob)